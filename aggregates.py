@@ -0,0 +1,151 @@
+import pandas as pd
+
+VALUATION_BINS = [0, 1, 2, 5, 10, float('inf')]
+VALUATION_LABELS = ['0-1B', '1-2B', '2-5B', '5-10B', '10B+']
+
+STATS = ["count", "sum", "mean", "median"]
+
+
+class AggregateStore:
+    # Every count/sum/mean/median the sections display, computed in one pass
+    # per dataset version. Sections read from here instead of re-running pandas.
+    def __init__(self, dataset, regions, version=None):
+        self.version = version
+        self.region_names = regions.names()
+        valuation = dataset["Valuation ($B)"]
+
+        # Whole dataset
+        self.industry_counts = _counts(dataset["Industry"])
+        self.city_counts = _counts(dataset["City"])
+        self._country_counts = _counts(dataset["Country"])
+        self.totals = {
+            "startups": len(dataset),
+            "valuation": valuation.sum(),
+            "median_valuation": valuation.median(),
+            "avg_valuation": valuation.mean(),
+            "cities": dataset["City"].nunique(),
+            "countries": dataset["Country"].nunique(),
+            "industries": dataset["Industry"].nunique(),
+        }
+        self.valuation_distribution = _valuation_bins(valuation)
+
+        # Region level, plus the number of unicorns (>= $1B) in each region
+        by_region = dataset.groupby("Region", observed=False)["Valuation ($B)"]
+        self.region_stats = by_region.agg(STATS)
+        self.region_stats["unicorns"] = (valuation >= 1).groupby(dataset["Region"], observed=False).sum()
+
+        # Region x industry cube
+        self.cube = dataset.groupby(["Region", "Industry"], observed=True)["Valuation ($B)"].agg(STATS)
+
+        self._region_industries = {}
+        self._split_cube(self.region_names)
+
+    def _split_cube(self, regions):
+        # A new dict, so copies of the store made before a delta keep theirs
+        self._region_industries = dict(self._region_industries)
+        for region in regions:
+            if region in self.cube.index.get_level_values(0):
+                stats = self.cube.xs(region, level="Region")
+            else:
+                stats = pd.DataFrame(columns=STATS, index=pd.Index([], name="Industry"))
+            self._region_industries[region] = stats
+
+    def apply_delta(self, removed, added, dataset, regions, version=None):
+        # Updates every aggregate for rows replaced (removed) and inserted
+        # (added) without a full pass: counts and sums are adjusted by the
+        # delta, medians are recomputed only in the regions it touches.
+        # dataset/regions are the frame and RegionIndex after the change.
+        self.version = version
+        self.industry_counts = _adjust_counts(self.industry_counts, removed["Industry"], added["Industry"])
+        self.city_counts = _adjust_counts(self.city_counts, removed["City"], added["City"])
+        self._country_counts = _adjust_counts(self._country_counts, removed["Country"], added["Country"])
+
+        valuation = self.totals["valuation"] - removed["Valuation ($B)"].sum() + added["Valuation ($B)"].sum()
+        self.totals = {
+            "startups": len(dataset),
+            "valuation": valuation,
+            "median_valuation": dataset["Valuation ($B)"].median(),
+            "avg_valuation": valuation / len(dataset) if len(dataset) else float("nan"),
+            "cities": len(self.city_counts),
+            "countries": len(self._country_counts),
+            "industries": len(self.industry_counts),
+        }
+        self.valuation_distribution = (
+            self.valuation_distribution
+            - _valuation_bins(removed["Valuation ($B)"])
+            + _valuation_bins(added["Valuation ($B)"])
+        )
+
+        touched = [
+            region for region in self.region_names
+            if (removed["Region"] == region).any() or (added["Region"] == region).any()
+        ]
+        if not touched:
+            return
+
+        # Region level and region x industry cube: only the touched regions
+        # are regrouped, with the same groupby as __init__ so the result has
+        # the dtypes and order of a full build
+        rows = pd.concat([regions.view(region) for region in touched])
+        by_region = rows.groupby("Region", observed=False)["Valuation ($B)"]
+        unicorns = (rows["Valuation ($B)"] >= 1).groupby(rows["Region"], observed=False).sum()
+        stats = self.region_stats.copy()
+        stats.loc[touched, STATS] = by_region.agg(STATS).loc[touched]
+        stats.loc[touched, "unicorns"] = unicorns.loc[touched]
+        self.region_stats = stats
+
+        fresh = rows.groupby(["Region", "Industry"], observed=True)["Valuation ($B)"].agg(STATS)
+        untouched = ~self.cube.index.get_level_values("Region").isin(touched)
+        cube = pd.concat([self.cube[untouched], fresh])
+        # Back to categorical levels (concat of different categories falls
+        # back to str) so the cube sorts in category order like a full build
+        cube.index = pd.MultiIndex.from_arrays([
+            pd.Categorical(cube.index.get_level_values("Region"), dtype=dataset["Region"].dtype),
+            pd.Categorical(cube.index.get_level_values("Industry"), dtype=dataset["Industry"].dtype),
+        ], names=["Region", "Industry"])
+        self.cube = cube.sort_index()
+        self._split_cube(touched)
+
+    def top_industry(self):
+        # Same tie-break as Series.mode(): smallest label among the most frequent
+        counts = self.industry_counts
+        top = counts[counts == counts.max()].index.sort_values()[0]
+        return top, counts[top]
+
+    def region_stat(self, region, stat):
+        return self.region_stats.loc[region, stat]
+
+    def industry_counts_for(self, region):
+        counts = self._region_industries[region]["count"].astype(int)
+        return counts.sort_values(ascending=False, kind="stable")
+
+    def industry_valuations_for(self, region):
+        return self._region_industries[region]["sum"].sort_values(ascending=True)
+
+    def industry_stats_for(self, region):
+        stats = self._region_industries[region]
+        industry_stats = pd.DataFrame({
+            'Industry': stats.index.astype(str),
+            'Avg_Valuation': stats["mean"].to_numpy(),
+            'Count': stats["count"].to_numpy(),
+        })
+        return industry_stats
+
+
+def _valuation_bins(valuation):
+    return pd.cut(
+        valuation, bins=VALUATION_BINS, labels=VALUATION_LABELS
+    ).value_counts().sort_index()
+
+
+def _counts(values):
+    # value_counts() without the unused categories of a categorical
+    counts = values.value_counts()
+    return counts[counts > 0]
+
+
+def _adjust_counts(counts, removed, added):
+    # value_counts() after replacing `removed` values by `added` ones
+    counts = counts.sub(_counts(removed), fill_value=0).add(_counts(added), fill_value=0)
+    counts = counts[counts > 0].astype(int)
+    return counts.sort_values(ascending=False, kind="stable")
@@ -1,23 +1,258 @@
-import pandas as pd 
 import customtkinter as ctk
 from datetime import datetime 
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import seaborn as sns
-import numpy as np
+import importlib
+import queue
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import figure_pool
+
+class LazyModule:
+    # Stands in for a module and imports it on first attribute access, so
+    # the window opens before the plotting and data stack is loaded
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+np = LazyModule("numpy")
+plt = LazyModule("matplotlib.pyplot")
+kde = LazyModule("kde")
+backend_tkagg = LazyModule("matplotlib.backends.backend_tkagg")
+charts = LazyModule("charts")
+Image = LazyModule("PIL.Image")
 
 class StartupData:
-    def __init__(self):
-        # Load and prepare data
-        self.dataset = pd.read_csv('startups_with_coordinates.csv')
-        self.european_countries = [
-            "Sweden", "United Kingdom", "Germany", "Netherlands", "Belgium", "Lithuania",
-            "Estonia", "France", "Austria", "Ireland", "Switzerland", "Spain",
-            "Luxembourg", "Finland", "Denmark", "Norway", "Czech Republic", "Croatia"
-        ]
-        self.dataset_USA = self.dataset[self.dataset["Country"] == "United States"]
-        self.dataset_China = self.dataset[self.dataset["Country"] == "China"]
-        self.dataset_EU = self.dataset[self.dataset["Country"].isin(self.european_countries)]
+    def __init__(self, progress=None):
+        # progress(text) is called before each loading stage
+        progress = progress or (lambda text: None)
+        
+        # Imported here: pandas is only needed once loading starts
+        from data_loader import DATA_FILE
+        from ingest import load_with_deltas, source_stamp
+        from regions import RegionIndex
+        from aggregates import AggregateStore
+        from investors import InvestorTable
+        from spatial_index import SpatialIndex
+        
+        # Load and prepare data (through the binary cache beside the CSV,
+        # with the ingested deltas merged over it)
+        progress("Loading startups...")
+        # Stamp of the files loaded, taken first so later changes are seen
+        self.sources = source_stamp(DATA_FILE)
+        paths = [path for path, _, _ in self.sources[1:]] if self.sources else None
+        dataset, self.version = load_with_deltas(DATA_FILE, paths)
+        # Region frames are views into one region-ordered dataset
+        progress("Indexing regions...")
+        self.regions = RegionIndex(dataset)
+        self.dataset = self.regions.dataset
+        progress("Computing aggregates...")
+        self.aggregates = AggregateStore(self.dataset, self.regions, self.version)
+        progress("Indexing investors...")
+        self.investors = InvestorTable(self.dataset, self.regions)
+        progress("Indexing coordinates...")
+        self.spatial = SpatialIndex(self.dataset["Latitude"], self.dataset["Longitude"])
+
+    def region(self, name):
+        return self.regions.view(name)
+
+    def add_region(self, name, countries):
+        from aggregates import AggregateStore
+        from investors import InvestorTable
+        from spatial_index import SpatialIndex
+        
+        # The dataset is re-ordered, so every row-position index is rebuilt
+        self.dataset = self.regions.add_region(name, countries)
+        self.aggregates = AggregateStore(self.dataset, self.regions, self.version)
+        self.investors = InvestorTable(self.dataset, self.regions)
+        self.spatial = SpatialIndex(self.dataset["Latitude"], self.dataset["Longitude"])
+
+    def apply_delta(self, delta, version):
+        # Merges validated delta rows (see ingest.py) into the dataset and
+        # updates every structure built on it instead of reloading
+        from ingest import assign_indice
+        from spatial_index import SpatialIndex
+        
+        delta = assign_indice(delta, self.dataset)
+        previous = self.dataset
+        old_positions, replaced = self.regions.upsert(delta)
+        self.dataset = self.regions.dataset
+        added = self.dataset.iloc[np.flatnonzero(old_positions < 0)]
+        self.aggregates.apply_delta(previous.iloc[replaced], added, self.dataset, self.regions, version)
+        self.investors.apply_delta(old_positions, self.dataset)
+        # Row positions moved; rebuilding the grid is a single vectorized pass
+        self.spatial = SpatialIndex(self.dataset["Latitude"], self.dataset["Longitude"])
+        self.version = version
+
+    def ingest(self, delta):
+        # Validates and stores a delta frame, then merges it in memory;
+        # returns the rows accepted
+        from data_loader import DATA_FILE
+        from ingest import append_delta, delta_version, file_stamps
+        
+        path, delta = append_delta(delta, DATA_FILE)
+        self.apply_delta(delta, delta_version(self.version, [path]))
+        # Without a stamp of what was loaded, leave it unknown: the next
+        # poll then does a full reload
+        if self.sources is not None:
+            self.sources += file_stamps([path])
+        return delta
+
+    def pending_deltas(self):
+        # Delta files written since this data was loaded, or None when the
+        # CSV or an already merged delta changed and only a reload will do
+        from data_loader import DATA_FILE
+        from ingest import source_stamp
+        
+        stamp = source_stamp(DATA_FILE)
+        if stamp is None or self.sources is None or stamp[:len(self.sources)] != self.sources:
+            return None
+        return [path for path, _, _ in stamp[len(self.sources):]]
+
+    def merged(self, paths):
+        # A copy with the delta files merged in. The structures apply_delta
+        # updates are copied first, so the UI keeps reading this instance
+        # while the merge runs in the background
+        import copy
+        from data_loader import DATA_FILE
+        from ingest import delta_version, file_stamps, read_delta
+        
+        data = copy.copy(self)
+        data.regions = copy.copy(self.regions)
+        data.aggregates = copy.copy(self.aggregates)
+        data.investors = copy.copy(self.investors)
+        data.investors.regions = data.regions
+        for path in paths:
+            data.apply_delta(read_delta(path, DATA_FILE), delta_version(data.version, [path]))
+        data.sources = self.sources + file_stamps(paths)
+        return data
+
+    def nearby(self, lat, lon, km):
+        # Startups within km of a point, nearest first, with a distance column
+        rows, distances = self.spatial.radius(lat, lon, km)
+        return self.dataset.iloc[rows].assign(**{"Distance (km)": distances})
+
+    def city_hubs(self, km=50, top=10):
+        # Startups within km of each (City, Country) centre, densest hubs
+        # first. A hub whose circle overlaps a denser one (centres less than
+        # 2 km apart) counts mostly the same startups and is left out
+        from spatial_index import haversine_km
+        
+        cities = self.dataset.groupby(["City", "Country"], observed=True)
+        centres = cities[["Latitude", "Longitude"]].mean()
+        counts = self.spatial.count_within(centres["Latitude"], centres["Longitude"], km)
+        # On ties the city with the most startups of its own names the hub
+        hubs = centres.assign(Startups=counts, Own=cities.size()).sort_values(
+            ["Startups", "Own"], ascending=False, kind="stable"
+        )
+        lat, lon = hubs["Latitude"].to_numpy(), hubs["Longitude"].to_numpy()
+        free = np.ones(len(hubs), dtype=bool)
+        kept = []
+        while free.any() and len(kept) < top:
+            hub = int(np.argmax(free))
+            kept.append(hub)
+            free &= haversine_km(lat[hub], lon[hub], lat, lon) >= 2 * km
+        return hubs["Startups"].iloc[kept]
+
+class BackgroundWorker:
+    # Runs jobs off the Tk thread. Results and status messages go through a
+    # queue that the Tk thread drains with root.after, so callbacks always
+    # run on the Tk thread.
+    def __init__(self, root, max_workers=2, poll_ms=50):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.messages = queue.Queue()
+        self.root.after(self.poll_ms, self.poll)
+
+    def submit(self, job, on_done, on_error=None):
+        future = self.executor.submit(job)
+        future.add_done_callback(lambda f: self.messages.put((f, on_done, on_error)))
+        return future
+
+    def post(self, callback, *args):
+        # Thread-safe: schedule callback(*args) on the Tk thread
+        self.messages.put((None, callback, args))
+
+    def poll(self):
+        # Always rescheduled: a failing callback must not stop the polling
+        try:
+            while True:
+                try:
+                    message = self.messages.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    self.dispatch(*message)
+                except Exception:
+                    # One callback failing does not drop the others
+                    print("Background callback failed:")
+                    traceback.print_exc()
+        finally:
+            self.root.after(self.poll_ms, self.poll)
+
+    def dispatch(self, future, callback, extra):
+        if future is None:
+            callback(*extra)
+        elif future.cancelled():
+            return
+        elif future.exception() is not None:
+            if extra is not None:
+                extra(future.exception())
+            else:
+                print("Background job failed:", future.exception())
+        else:
+            callback(future.result())
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+class DataWatcher:
+    # Polls stamp() with root.after and calls on_change() once a new stamp
+    # has stayed the same for a whole interval, so a file still being
+    # written is not reloaded half-way
+    def __init__(self, root, stamp, on_change, interval_ms=2000):
+        self.root = root
+        self.stamp = stamp
+        self.on_change = on_change
+        self.interval_ms = interval_ms
+        self.current = stamp()
+        self.seen = self.current
+        self.root.after(self.interval_ms, self.check)
+
+    def retry(self):
+        # Calls on_change for the current files once they are stable (e.g.
+        # after a failed load, whether or not they changed since)
+        self.current = None
+
+    def acknowledge(self):
+        # The current files are already handled: no on_change for them
+        self.current = self.seen = self.stamp()
+
+    def check(self):
+        stamp = self.stamp()
+        if stamp != self.current and stamp == self.seen:
+            self.current = stamp
+            self.on_change()
+        self.seen = stamp
+        self.root.after(self.interval_ms, self.check)
+
+def digest(*parts):
+    # Content hash of the frames/series/values a section displays
+    import hashlib
+    import pandas as pd
+    
+    h = hashlib.sha1()
+    for part in parts:
+        if isinstance(part, (pd.Series, pd.DataFrame)):
+            h.update(pd.util.hash_pandas_object(part, index=True).to_numpy().tobytes())
+        else:
+            h.update(repr(part).encode("utf-8"))
+    return h.hexdigest()
 
 class StyleConfig:
     # Style constants
@@ -83,15 +318,107 @@ class MetricCard:
         )
         self.value_label.pack(pady=(5, 15))
 
+    def set(self, title, value):
+        self.title_label.configure(text=title)
+        self.value_label.configure(text=value)
+
+class RenderedFigure:
+    # Shows a chart rasterized in a figure_pool worker once it is ready
+    POLL_MS = 30
+
+    def __init__(self, parent, future, **pack_options):
+        self.future = future
+        self.label = ctk.CTkLabel(parent, text="Rendering chart...", text_color="#666666")
+        self.label.pack(**pack_options)
+        self.label.after(self.POLL_MS, self.check)
+
+    def check(self):
+        if not self.label.winfo_exists():
+            return
+        if not self.future.done():
+            self.label.after(self.POLL_MS, self.check)
+            return
+        
+        try:
+            width, height, rgba = self.future.result()
+        except Exception as e:
+            self.label.configure(text=f"Error creating chart: {str(e)}", text_color="red")
+            return
+        
+        image = Image.frombuffer("RGBA", (width, height), rgba, "raw", "RGBA", 0, 1)
+        self.image = ctk.CTkImage(light_image=image, size=(width, height))
+        self.label.configure(image=self.image, text="")
+
+class LazyTabs:
+    # CTkTabview whose tabs are rendered the first time they are selected
+    def __init__(self, parent):
+        self.tabs = {}
+        self.renderers = {}
+        self.rendered = set()
+        self.tabview = ctk.CTkTabview(parent, command=self.render_current)
+        self.tabview.pack(fill="both", expand=True, padx=10, pady=10)
+
+    def add(self, name, render):
+        tab = self.tabview.add(name)
+        self.tabs[name] = tab
+        self.renderers[name] = render
+        return tab
+
+    def render_current(self):
+        name = self.tabview.get()
+        if not name or name in self.rendered:
+            return
+        self.rendered.add(name)
+        
+        try:
+            self.renderers[name]()
+        except Exception as e:
+            error_label = ctk.CTkLabel(
+                self.tabs[name],
+                text=f"Error loading {name} tab: {str(e)}",
+                text_color="red"
+            )
+            error_label.pack(pady=20)
+            print(f"Error in {name} tab:", e)
+
+def dashboard_metrics(aggregates):
+    # (title, value, icon) of the dashboard's metric cards
+    totals = aggregates.totals
+    total_startups = totals["startups"]
+    total_valuation = totals["valuation"]
+    median_valuation = totals["median_valuation"]
+    avg_valuation = totals["avg_valuation"]
+    total_cities = totals["cities"]
+    total_countries = totals["countries"]
+    most_common_industry, industry_count = aggregates.top_industry()
+    
+    return {
+        'top': [
+            ("Total Startups", f"{total_startups:,}", "🚀"),
+            ("Total Valuation", f"${total_valuation:.1f}B", "💰"),
+            ("Median Valuation", f"${median_valuation:.1f}B", "📊"),
+            ("Average Valuation", f"${avg_valuation:.1f}B", "📈"),
+        ],
+        'bottom': [
+            ("Active Cities", f"{total_cities}", "🏙"),
+            ("Active Markets", f"{total_countries}", "🌍"),
+            (f"Top Industry ({most_common_industry})", f"{industry_count} startups", "🏭"),
+            ("Total Industries", f"{totals['industries']}", "📋"),
+        ]
+    }
+
 class DashboardSection:
     def __init__(self, parent, data):
         self.parent = parent
-        self.data = data.dataset
-        self.dataset_USA = data.dataset_USA
-        self.dataset_China = data.dataset_China
-        self.dataset_EU = data.dataset_EU
+        self.bind(data)
         self.setup_dashboard()
 
+    def bind(self, data):
+        # References into the loaded data; a live reload that keeps this
+        # section rebinds them so the previous data can be freed
+        self.data = data.dataset
+        self.aggregates = data.aggregates
+
     def setup_dashboard(self):
         # Create dashboard content
         self.dashboard_frame = ctk.CTkScrollableFrame(self.parent)
@@ -139,37 +466,31 @@ class DashboardSection:
         metrics_frame_bottom.pack(fill="x", pady=10)
         
         # Create top row metrics
+        self.cards = []
         for title, value, icon in metrics['top']:
-            MetricCard(metrics_frame_top, title, value, icon)
+            self.cards.append(MetricCard(metrics_frame_top, title, value, icon))
             
         # Create bottom row metrics
         for title, value, icon in metrics['bottom']:
-            MetricCard(metrics_frame_bottom, title, value, icon)
+            self.cards.append(MetricCard(metrics_frame_bottom, title, value, icon))
+
+    def update_metrics(self, data):
+        # Live reload: only the card texts change, the graphs are kept
+        self.bind(data)
+        metrics = self.calculate_metrics()
+        for card, (title, value, icon) in zip(self.cards, metrics['top'] + metrics['bottom']):
+            card.set(title, value)
 
     def calculate_metrics(self):
-        total_startups = len(self.data)
-        total_valuation = self.data["Valuation ($B)"].sum()
-        median_valuation = self.data["Valuation ($B)"].median()
-        avg_valuation = self.data["Valuation ($B)"].mean()
-        total_cities = self.data["City"].nunique()
-        total_countries = self.data["Country"].nunique()
-        most_common_industry = self.data["Industry"].mode().iloc[0]
-        industry_count = len(self.data[self.data["Industry"] == most_common_industry])
-        
-        return {
-            'top': [
-                ("Total Startups", f"{total_startups:,}", "🚀"),
-                ("Total Valuation", f"${total_valuation:.1f}B", "💰"),
-                ("Median Valuation", f"${median_valuation:.1f}B", "📊"),
-                ("Average Valuation", f"${avg_valuation:.1f}B", "📈"),
-            ],
-            'bottom': [
-                ("Active Cities", f"{total_cities}", "🏙"),
-                ("Active Markets", f"{total_countries}", "🌍"),
-                (f"Top Industry ({most_common_industry})", f"{industry_count} startups", "🏭"),
-                ("Total Industries", f"{self.data['Industry'].nunique()}", "📋"),
-            ]
-        }
+        return dashboard_metrics(self.aggregates)
+
+    @staticmethod
+    def graph_inputs(aggregates):
+        return (
+            aggregates.valuation_distribution,
+            aggregates.region_stats["count"],
+            aggregates.city_counts.head(5),
+        )
 
     def create_graphs(self):
         graphs_frame = ctk.CTkFrame(self.dashboard_frame, fg_color="transparent")
@@ -181,12 +502,7 @@ class DashboardSection:
             growth_frame.pack(side="left", fill="both", expand=True, padx=10)
             
             fig1, ax1 = plt.subplots(figsize=(4, 3), dpi=100)
-            valuation_bins = [0, 1, 2, 5, 10, float('inf')]
-            valuation_labels = ['0-1B', '1-2B', '2-5B', '5-10B', '10B+']
-            self.data['Valuation_Category'] = pd.cut(self.data['Valuation ($B)'], 
-                                                bins=valuation_bins, 
-                                                labels=valuation_labels)
-            valuation_dist = self.data['Valuation_Category'].value_counts().sort_index()
+            valuation_dist = self.aggregates.valuation_distribution
             valuation_dist.plot(ax=ax1, kind='bar', color='#1a73e8')
             ax1.set_title("Valuation Distribution", pad=10)
             ax1.set_xlabel("Valuation Range")
@@ -194,7 +510,7 @@ class DashboardSection:
             ax1.tick_params(axis='x', rotation=45)
             plt.tight_layout()
             
-            canvas1 = FigureCanvasTkAgg(fig1, growth_frame)
+            canvas1 = backend_tkagg.FigureCanvasTkAgg(fig1, growth_frame)
             canvas1.draw()
             canvas1.get_tk_widget().pack(padx=10, pady=10)
             
@@ -203,18 +519,14 @@ class DashboardSection:
             regions_frame.pack(side="left", fill="both", expand=True, padx=10)
             
             fig2, ax2 = plt.subplots(figsize=(4, 3), dpi=100)
-            regions_data = {
-                'USA': len(self.dataset_USA),
-                'China': len(self.dataset_China),
-                'Europe': len(self.dataset_EU)
-            }
+            regions_data = self.aggregates.region_stats["count"].to_dict()
             colors = ['#1a73e8', '#4285f4', '#8ab4f8']
             plt.pie(regions_data.values(), labels=regions_data.keys(), autopct='%1.1f%%', 
                     colors=colors, startangle=90)
             plt.title("Regional Distribution", pad=10)
             plt.tight_layout()
             
-            canvas2 = FigureCanvasTkAgg(fig2, regions_frame)
+            canvas2 = backend_tkagg.FigureCanvasTkAgg(fig2, regions_frame)
             canvas2.draw()
             canvas2.get_tk_widget().pack(padx=10, pady=10)
             
@@ -223,7 +535,7 @@ class DashboardSection:
             cities_frame.pack(side="left", fill="both", expand=True, padx=10)
             
             fig3, ax3 = plt.subplots(figsize=(4, 3), dpi=100)
-            city_distribution = self.data['City'].value_counts().head(5)
+            city_distribution = self.aggregates.city_counts.head(5)
             city_distribution.plot(ax=ax3, kind='bar', color='#1a73e8')
             ax3.set_title("Top 5 Startup Hubs", pad=10)
             ax3.set_xlabel("Cities")
@@ -231,7 +543,7 @@ class DashboardSection:
             ax3.set_xticklabels(ax3.get_xticklabels(), rotation=45, ha='right')
             plt.tight_layout()
             
-            canvas3 = FigureCanvasTkAgg(fig3, cities_frame)
+            canvas3 = backend_tkagg.FigureCanvasTkAgg(fig3, cities_frame)
             canvas3.draw()
             canvas3.get_tk_widget().pack(padx=10, pady=10)
             
@@ -249,24 +561,31 @@ class DashboardSection:
 class AnalyticsSection:
     def __init__(self, parent, data):
         self.parent = parent
-        self.data = data
-        self.dataset_USA = data.dataset_USA
-        self.dataset_China = data.dataset_China
-        self.dataset_EU = data.dataset_EU
+        self.bind(data)
         self.setup_analytics()
+
+    def bind(self, data):
+        self.data = data
+        self.dataset_USA = data.region("USA")
+        self.dataset_China = data.region("China")
+        self.dataset_EU = data.region("Europe")
+        self.aggregates = data.aggregates
+        self.version = data.version
         
     def setup_analytics(self):
-        analytics_tabs = ctk.CTkTabview(self.parent)
-        analytics_tabs.pack(fill="both", expand=True, padx=10, pady=10)
+        self.analytics_tabs = LazyTabs(self.parent)
         
-        # Add regional tabs
-        self.tab_usa = analytics_tabs.add("United States")
-        self.tab_china = analytics_tabs.add("China")
-        self.tab_europe = analytics_tabs.add("Europe")
+        # Add regional tabs, each rendered on first selection
+        self.tab_usa = self.analytics_tabs.add("United States", self.create_usa_analysis)
+        self.tab_china = self.analytics_tabs.add("China", self.create_china_analysis)
+        self.tab_europe = self.analytics_tabs.add("Europe", self.create_europe_analysis)
         
-        self.create_usa_analysis()
-        self.create_china_analysis()
-        self.create_europe_analysis()
+        self.analytics_tabs.render_current()
+    
+    def valuation_density(self, region, dataset):
+        # KDE curve cached per (dataset version, region, column)
+        key = (self.version, region, "Valuation ($B)")
+        return kde.density_curve(key, dataset["Valuation ($B)"].to_numpy())
     
     def create_usa_analysis(self):
         left_frame = ctk.CTkFrame(self.tab_usa, fg_color="transparent")
@@ -276,23 +595,23 @@ class AnalyticsSection:
         
         # Valuation Distribution (Violin Plot)
         fig1, ax1 = plt.subplots(figsize=(8, 4))
-        sns.violinplot(data=self.dataset_USA, y="Valuation ($B)", ax=ax1, color='#1a73e8')
+        kde.violin(ax1, self.valuation_density("USA", self.dataset_USA), color='#1a73e8')
         ax1.set_title("Valuation Distribution in USA")
         ax1.set_ylabel("Valuation ($B)")
         
         # Add median line
-        median = self.dataset_USA["Valuation ($B)"].median()
+        median = self.aggregates.region_stat("USA", "median")
         ax1.axhline(y=median, color='red', linestyle='--', alpha=0.5, label=f'Median: ${median:.1f}B')
         ax1.legend()
         
         plt.tight_layout()
-        canvas1 = FigureCanvasTkAgg(fig1, left_frame)
+        canvas1 = backend_tkagg.FigureCanvasTkAgg(fig1, left_frame)
         canvas1.draw()
         canvas1.get_tk_widget().pack(side="left", fill="both", expand=True)
         
         # Startup Count by Industry
         fig2, ax2 = plt.subplots(figsize=(8, 4))
-        industry_counts = self.dataset_USA["Industry"].value_counts()
+        industry_counts = self.aggregates.industry_counts_for("USA")
         industry_counts.plot(kind="bar", ax=ax2, color='#1a73e8')
         ax2.set_title("Startup Count by Industry (USA)")
         ax2.set_xlabel("Industry")
@@ -305,7 +624,7 @@ class AnalyticsSection:
             ax2.text(i, v, str(v), ha='center', va='bottom')
         
         plt.tight_layout()
-        canvas2 = FigureCanvasTkAgg(fig2, right_frame)
+        canvas2 = backend_tkagg.FigureCanvasTkAgg(fig2, right_frame)
         canvas2.draw()
         canvas2.get_tk_widget().pack(side="right", fill="both", expand=True)
         
@@ -319,23 +638,23 @@ class AnalyticsSection:
         
         # Valuation Distribution (Violin Plot)
         fig1, ax1 = plt.subplots(figsize=(8, 4))
-        sns.violinplot(data=self.dataset_China, y="Valuation ($B)", ax=ax1, color='#1a73e8')
+        kde.violin(ax1, self.valuation_density("China", self.dataset_China), color='#1a73e8')
         ax1.set_title("Valuation Distribution in China")
         ax1.set_ylabel("Valuation ($B)")
         
         # Add median line
-        median = self.dataset_China["Valuation ($B)"].median()
+        median = self.aggregates.region_stat("China", "median")
         ax1.axhline(y=median, color='red', linestyle='--', alpha=0.5, label=f'Median: ${median:.1f}B')
         ax1.legend()
         
         plt.tight_layout()
-        canvas1 = FigureCanvasTkAgg(fig1, left_frame)
+        canvas1 = backend_tkagg.FigureCanvasTkAgg(fig1, left_frame)
         canvas1.draw()
         canvas1.get_tk_widget().pack(side="left", fill="both", expand=True)
         
         # Startup Count by Industry
         fig2, ax2 = plt.subplots(figsize=(8, 4))
-        industry_counts = self.dataset_China["Industry"].value_counts()
+        industry_counts = self.aggregates.industry_counts_for("China")
         industry_counts.plot(kind="bar", ax=ax2, color='#1a73e8')
         ax2.set_title("Startup Count by Industry (China)")
         ax2.set_xlabel("Industry")
@@ -348,7 +667,7 @@ class AnalyticsSection:
             ax2.text(i, v, str(v), ha='center', va='bottom')
         
         plt.tight_layout()
-        canvas2 = FigureCanvasTkAgg(fig2, right_frame)
+        canvas2 = backend_tkagg.FigureCanvasTkAgg(fig2, right_frame)
         canvas2.draw()
         canvas2.get_tk_widget().pack(side="right", fill="both", expand=True)
         
@@ -362,23 +681,23 @@ class AnalyticsSection:
         
         # Valuation Distribution (Violin Plot)
         fig1, ax1 = plt.subplots(figsize=(8, 4))
-        sns.violinplot(data=self.dataset_EU, y="Valuation ($B)", ax=ax1, color='#1a73e8')
+        kde.violin(ax1, self.valuation_density("Europe", self.dataset_EU), color='#1a73e8')
         ax1.set_title("Valuation Distribution in Europe")
         ax1.set_ylabel("Valuation ($B)")
         
         # Add median line
-        median = self.dataset_EU["Valuation ($B)"].median()
+        median = self.aggregates.region_stat("Europe", "median")
         ax1.axhline(y=median, color='red', linestyle='--', alpha=0.5, label=f'Median: ${median:.1f}B')
         ax1.legend()
         
         plt.tight_layout()
-        canvas1 = FigureCanvasTkAgg(fig1, left_frame)
+        canvas1 = backend_tkagg.FigureCanvasTkAgg(fig1, left_frame)
         canvas1.draw()
         canvas1.get_tk_widget().pack(side="left", fill="both", expand=True)
         
         # Startup Count by Industry
         fig2, ax2 = plt.subplots(figsize=(8, 4))
-        industry_counts = self.dataset_EU["Industry"].value_counts()
+        industry_counts = self.aggregates.industry_counts_for("Europe")
         industry_counts.plot(kind="bar", ax=ax2, color='#1a73e8')
         ax2.set_title("Startup Count by Industry (Europe)")
         ax2.set_xlabel("Industry")
@@ -391,7 +710,7 @@ class AnalyticsSection:
             ax2.text(i, v, str(v), ha='center', va='bottom')
         
         plt.tight_layout()
-        canvas2 = FigureCanvasTkAgg(fig2, right_frame)
+        canvas2 = backend_tkagg.FigureCanvasTkAgg(fig2, right_frame)
         canvas2.draw()
         canvas2.get_tk_widget().pack(side="right", fill="both", expand=True)
         
@@ -400,280 +719,258 @@ class AnalyticsSection:
 class IndustriesSection:
     def __init__(self, parent, data):
         self.parent = parent
-        self.dataset_USA = data.dataset_USA
-        self.dataset_China = data.dataset_China
-        self.dataset_EU = data.dataset_EU
+        self.bind(data)
         self.setup_industries()
+
+    def bind(self, data):
+        self.aggregates = data.aggregates
         
     def setup_industries(self):
-        industries_tabs = ctk.CTkTabview(self.parent)
-        industries_tabs.pack(fill="both", expand=True, padx=10, pady=10)
+        self.industries_tabs = LazyTabs(self.parent)
         
-        # Add regional tabs
-        self.tab_usa = industries_tabs.add("United States")
-        self.tab_china = industries_tabs.add("China")
-        self.tab_europe = industries_tabs.add("Europe")
+        # Add regional tabs, each rendered on first selection
+        self.tab_usa = self.industries_tabs.add("United States", self.create_usa_industries)
+        self.tab_china = self.industries_tabs.add("China", self.create_china_industries)
+        self.tab_europe = self.industries_tabs.add("Europe", self.create_europe_industries)
         
-        self.create_usa_industries()
-        self.create_china_industries()
-        self.create_europe_industries()
+        self.industries_tabs.render_current()
     
     def create_usa_industries(self):
-        left_frame = ctk.CTkFrame(self.tab_usa, fg_color="transparent")
-        left_frame.pack(side="left", fill="both", expand=True, padx=5)
-        right_frame = ctk.CTkFrame(self.tab_usa, fg_color="transparent")
-        right_frame.pack(side="right", fill="both", expand=True, padx=5)
-        
-        # Top Industries by Total Valuation (Bar Chart)
-        fig1, ax1 = plt.subplots(figsize=(8, 4))
-        industry_valuations = self.dataset_USA.groupby('Industry')['Valuation ($B)'].sum().sort_values(ascending=True)
-        
-        # Create horizontal bar chart
-        industry_valuations.plot(kind='barh', ax=ax1, color='#1a73e8')
-        ax1.set_title("Top Industries by Total Valuation (USA)")
-        ax1.set_xlabel("Total Valuation ($B)")
-        
-        # Add value labels on the bars with padding using x offset
-        for i, v in enumerate(industry_valuations):
-            ax1.text(v + 0.5, i, f'${v:.1f}B', va='center', ha='left')  # Using x + 0.5 for padding
-        
-        plt.tight_layout()
-        canvas1 = FigureCanvasTkAgg(fig1, left_frame)
-        canvas1.draw()
-        canvas1.get_tk_widget().pack(side="left", fill="both", expand=True)
-        
-        # Valuation per Startup in Key Industries (Scatter Plot)
-        fig2, ax2 = plt.subplots(figsize=(8, 4))
-        
-        # Calculate average valuation and count for each industry
-        industry_stats = self.dataset_USA.groupby('Industry').agg({
-            'Valuation ($B)': ['mean', 'count']
-        }).reset_index()
-        industry_stats.columns = ['Industry', 'Avg_Valuation', 'Count']
-        
-        # Create scatter plot with different colors for each industry
-        colors = plt.cm.Set3(np.linspace(0, 1, len(industry_stats)))  # Generate distinct colors
-        
-        for idx, row in industry_stats.iterrows():
-            scatter = ax2.scatter(
-                row['Count'], 
-                row['Avg_Valuation'],
-                s=100,  # marker size
-                c=[colors[idx]],  # use unique color
-                alpha=0.8,
-                label=f"{row['Industry']} (${row['Avg_Valuation']:.1f}B)"  # Add to legend
-            )
-        
-        ax2.set_title("Valuation per Startup in Key Industries (USA)")
-        ax2.set_xlabel("Number of Startups")
-        ax2.set_ylabel("Average Valuation ($B)")
-        ax2.grid(True, linestyle='--', alpha=0.3)
-        
-        # Add legend outside of plot
-        ax2.legend(
-            bbox_to_anchor=(1.05, 1),
-            loc='upper left',
-            borderaxespad=0.,
-            fontsize=8
-        )
-        
-        plt.tight_layout()
-        canvas2 = FigureCanvasTkAgg(fig2, right_frame)
-        canvas2.draw()
-        canvas2.get_tk_widget().pack(side="right", fill="both", expand=True)
-        
-        plt.close('all')
+        self.create_industries(self.tab_usa, "USA", "USA")
     
     def create_china_industries(self):
-        left_frame = ctk.CTkFrame(self.tab_china, fg_color="transparent")
-        left_frame.pack(side="left", fill="both", expand=True, padx=5)
-        right_frame = ctk.CTkFrame(self.tab_china, fg_color="transparent")
-        right_frame.pack(side="right", fill="both", expand=True, padx=5)
-        
-        # Top Industries by Total Valuation (Bar Chart)
-        fig1, ax1 = plt.subplots(figsize=(8, 4))
-        industry_valuations = self.dataset_China.groupby('Industry')['Valuation ($B)'].sum().sort_values(ascending=True)
-        
-        # Create horizontal bar chart
-        industry_valuations.plot(kind='barh', ax=ax1, color='#1a73e8')
-        ax1.set_title("Top Industries by Total Valuation (China)")
-        ax1.set_xlabel("Total Valuation ($B)")
-        
-        # Add value labels on the bars with padding using x offset
-        for i, v in enumerate(industry_valuations):
-            ax1.text(v + 0.5, i, f'${v:.1f}B', va='center', ha='left')
-        
-        plt.tight_layout()
-        canvas1 = FigureCanvasTkAgg(fig1, left_frame)
-        canvas1.draw()
-        canvas1.get_tk_widget().pack(side="left", fill="both", expand=True)
-        
-        # Valuation per Startup in Key Industries (Scatter Plot)
-        fig2, ax2 = plt.subplots(figsize=(8, 4))
-        
-        # Calculate average valuation and count for each industry
-        industry_stats = self.dataset_China.groupby('Industry').agg({
-            'Valuation ($B)': ['mean', 'count']
-        }).reset_index()
-        industry_stats.columns = ['Industry', 'Avg_Valuation', 'Count']
-        
-        # Create scatter plot with different colors for each industry
-        colors = plt.cm.Set3(np.linspace(0, 1, len(industry_stats)))
-        
-        for idx, row in industry_stats.iterrows():
-            scatter = ax2.scatter(
-                row['Count'], 
-                row['Avg_Valuation'],
-                s=100,
-                c=[colors[idx]],
-                alpha=0.8,
-                label=f"{row['Industry']} (${row['Avg_Valuation']:.1f}B)"
-            )
-        
-        ax2.set_title("Valuation per Startup in Key Industries (China)")
-        ax2.set_xlabel("Number of Startups")
-        ax2.set_ylabel("Average Valuation ($B)")
-        ax2.grid(True, linestyle='--', alpha=0.3)
-        
-        # Add legend outside of plot
-        ax2.legend(
-            bbox_to_anchor=(1.05, 1),
-            loc='upper left',
-            borderaxespad=0.,
-            fontsize=8
-        )
-        
-        plt.tight_layout()
-        canvas2 = FigureCanvasTkAgg(fig2, right_frame)
-        canvas2.draw()
-        canvas2.get_tk_widget().pack(side="right", fill="both", expand=True)
-        
-        plt.close('all')
+        self.create_industries(self.tab_china, "China", "China")
     
     def create_europe_industries(self):
-        left_frame = ctk.CTkFrame(self.tab_europe, fg_color="transparent")
+        self.create_industries(self.tab_europe, "Europe", "Europe")
+    
+    def create_industries(self, tab, region, label):
+        left_frame = ctk.CTkFrame(tab, fg_color="transparent")
         left_frame.pack(side="left", fill="both", expand=True, padx=5)
-        right_frame = ctk.CTkFrame(self.tab_europe, fg_color="transparent")
+        right_frame = ctk.CTkFrame(tab, fg_color="transparent")
         right_frame.pack(side="right", fill="both", expand=True, padx=5)
         
-        # Top Industries by Total Valuation (Bar Chart)
-        fig1, ax1 = plt.subplots(figsize=(8, 4))
-        industry_valuations = self.dataset_EU.groupby('Industry')['Valuation ($B)'].sum().sort_values(ascending=True)
-        
-        # Create horizontal bar chart
-        industry_valuations.plot(kind='barh', ax=ax1, color='#1a73e8')
-        ax1.set_title("Top Industries by Total Valuation (Europe)")
-        ax1.set_xlabel("Total Valuation ($B)")
-        
-        # Add value labels on the bars with padding using x offset
-        for i, v in enumerate(industry_valuations):
-            ax1.text(v + 0.5, i, f'${v:.1f}B', va='center', ha='left')
-        
-        plt.tight_layout()
-        canvas1 = FigureCanvasTkAgg(fig1, left_frame)
-        canvas1.draw()
-        canvas1.get_tk_widget().pack(side="left", fill="both", expand=True)
-        
-        # Valuation per Startup in Key Industries (Scatter Plot)
-        fig2, ax2 = plt.subplots(figsize=(8, 4))
-        
-        # Calculate average valuation and count for each industry
-        industry_stats = self.dataset_EU.groupby('Industry').agg({
-            'Valuation ($B)': ['mean', 'count']
-        }).reset_index()
-        industry_stats.columns = ['Industry', 'Avg_Valuation', 'Count']
-        
-        # Create scatter plot with different colors for each industry
-        colors = plt.cm.Set3(np.linspace(0, 1, len(industry_stats)))
-        
-        for idx, row in industry_stats.iterrows():
-            scatter = ax2.scatter(
-                row['Count'], 
-                row['Avg_Valuation'],
-                s=100,
-                c=[colors[idx]],
-                alpha=0.8,
-                label=f"{row['Industry']} (${row['Avg_Valuation']:.1f}B)"
-            )
+        # Both charts are rasterized in parallel worker processes
+        industry_valuations = self.aggregates.industry_valuations_for(region)
+        industry_stats = self.aggregates.industry_stats_for(region)
         
-        ax2.set_title("Valuation per Startup in Key Industries (Europe)")
-        ax2.set_xlabel("Number of Startups")
-        ax2.set_ylabel("Average Valuation ($B)")
-        ax2.grid(True, linestyle='--', alpha=0.3)
-        
-        # Add legend outside of plot
-        ax2.legend(
-            bbox_to_anchor=(1.05, 1),
-            loc='upper left',
-            borderaxespad=0.,
-            fontsize=8
+        RenderedFigure(
+            left_frame,
+            figure_pool.render(charts.industry_valuation_bars, industry_valuations, label),
+            side="left", fill="both", expand=True
         )
-        
-        plt.tight_layout()
-        canvas2 = FigureCanvasTkAgg(fig2, right_frame)
-        canvas2.draw()
-        canvas2.get_tk_widget().pack(side="right", fill="both", expand=True)
-        
-        plt.close('all')
+        RenderedFigure(
+            right_frame,
+            figure_pool.render(charts.industry_valuation_scatter, industry_stats, label),
+            side="right", fill="both", expand=True
+        )
+
+# From this many startups on, the map uses server-side clustering
+SERVER_CLUSTERING_ROWS = 50_000
+
+# Regions drawn on the in-app map
+MAP_REGION_COLORS = {"USA": "#1a73e8", "China": "#ea4335", "Europe": "#34a853"}
+MAP_REGION_LABELS = {"USA": "United States", "China": "China", "Europe": "Europe"}
 
 class MapViewSection:
-    def __init__(self, parent, data):
+    def __init__(self, parent, data, worker=None):
+        # worker: the app's BackgroundWorker, which builds the browser map
         self.parent = parent
-        self.data = data
+        self.worker = worker
+        self.map_process = None
+        self.building_map = False
+        self.map_canvas = None
+        self.bind(data)
         self.setup_map()
 
+    def bind(self, data):
+        self.data = data
+        if self.map_canvas is not None:
+            self.map_canvas.bind(data)
+
     def setup_map(self):
-        # Create a button to open the map
-        open_map_button = ctk.CTkButton(
-            self.parent,
+        self.map_frame = ctk.CTkFrame(self.parent, fg_color="transparent")
+        self.map_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        self.setup_controls()
+        self.setup_map_display()
+
+    def setup_map_display(self):
+        # Imported on first use: only this section draws the native map
+        from map_canvas import MapCanvas
+        
+        # Create right frame for map
+        self.map_display_frame = ctk.CTkFrame(self.map_frame, fg_color=StyleConfig.CARD_BG, corner_radius=10)
+        self.map_display_frame.pack(side="right", fill="both", expand=True)
+        
+        # Points stay as persistent artists; pan/zoom only re-culls them
+        self.fig, self.ax = plt.subplots(figsize=(10, 6))
+        self.map_canvas = MapCanvas(self.ax, self.data, MAP_REGION_COLORS, MAP_REGION_LABELS)
+        self.canvas = backend_tkagg.FigureCanvasTkAgg(self.fig, master=self.map_display_frame)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
+        self.map_canvas.connect(self.canvas)
+        self.canvas.draw_idle()
+
+    def setup_controls(self):
+        # Create left frame for controls
+        self.controls_frame = ctk.CTkFrame(self.map_frame, fg_color=StyleConfig.CARD_BG, width=200, corner_radius=10)
+        self.controls_frame.pack(side="left", fill="y", padx=(0, 10))
+        self.controls_frame.pack_propagate(False)
+
+        # Title
+        title_label = ctk.CTkLabel(
+            self.controls_frame,
+            text="Startup Map",
+            font=ctk.CTkFont(family="Helvetica", size=16, weight="bold"),
+            text_color="#1a73e8"
+        )
+        title_label.pack(pady=(20, 10), padx=10)
+
+        # Region filters
+        regions_label = ctk.CTkLabel(
+            self.controls_frame,
+            text="Filter Regions:",
+            font=ctk.CTkFont(size=14),
+            text_color="#666666"
+        )
+        regions_label.pack(pady=(20, 5), padx=10, anchor="w")
+
+        # Checkboxes only toggle visibility of the region's layer
+        self.region_vars = {}
+        for region, label in MAP_REGION_LABELS.items():
+            self.region_vars[region] = ctk.BooleanVar(value=True)
+            checkbox = ctk.CTkCheckBox(
+                self.controls_frame,
+                text=label,
+                variable=self.region_vars[region],
+                command=lambda region=region: self.toggle_region(region),
+                fg_color="#1a73e8",
+                hover_color="#1557b0"
+            )
+            checkbox.pack(pady=5, padx=10, anchor="w")
+
+        # Add zoom controls
+        zoom_frame = ctk.CTkFrame(self.controls_frame, fg_color="transparent")
+        zoom_frame.pack(pady=20, padx=10)
+
+        zoom_in_btn = ctk.CTkButton(
+            zoom_frame,
+            text="+",
+            width=30,
+            command=lambda: self.zoom(1.2),
+            fg_color="#1a73e8",
+            hover_color="#1557b0"
+        )
+        zoom_in_btn.pack(side="left", padx=2)
+
+        zoom_out_btn = ctk.CTkButton(
+            zoom_frame,
+            text="-",
+            width=30,
+            command=lambda: self.zoom(0.8),
+            fg_color="#1a73e8",
+            hover_color="#1557b0"
+        )
+        zoom_out_btn.pack(side="left", padx=2)
+
+        # Create a button to open the interactive (browser) map
+        self.open_map_button = ctk.CTkButton(
+            self.controls_frame,
             text="Open Interactive Map 🗺",
-            font=ctk.CTkFont(size=16),
+            font=ctk.CTkFont(size=14),
             fg_color="#1a73e8",
             hover_color="#1557b0",
-            height=40,
             command=self.open_map
         )
-        open_map_button.pack(pady=20)
-        
-        # Add description label
-        description = ctk.CTkLabel(
-            self.parent,
-            text="Click the button above to open an interactive map showing the global distribution of startups.\n"
-                 "The map will open in a new window with the following features:\n\n"
-                 "• Blue markers: USA startups\n"
-                 "• Red markers: China startups\n"
-                 "• Green markers: European startups\n\n"
-                 "You can click on markers to see startup details and use the layer control to filter regions.",
-            font=ctk.CTkFont(size=14),
+        self.open_map_button.pack(pady=10, padx=10)
+
+        # Shows why the interactive map could not be built
+        self.map_error_label = ctk.CTkLabel(
+            self.controls_frame,
+            text="",
+            font=ctk.CTkFont(size=12),
+            text_color="red",
+            wraplength=180
+        )
+        self.map_error_label.pack(padx=10)
+
+        hint = ctk.CTkLabel(
+            self.controls_frame,
+            text="Scroll to zoom, drag to pan.\nDense areas are shown\nas density hexagons.",
+            font=ctk.CTkFont(size=12),
             text_color="#666666"
         )
-        description.pack(pady=10)
+        hint.pack(pady=10, padx=10)
+
+    def toggle_region(self, region):
+        self.map_canvas.set_region_visible(region, self.region_vars[region].get())
+        self.canvas.draw_idle()
+
+    def zoom(self, factor):
+        self.map_canvas.zoom(factor)
+        self.map_canvas.redraw()
 
     def open_map(self):
+        # One map window at a time; it runs in its own process
+        if self.building_map or (self.map_process is not None and self.map_process.is_alive()):
+            return
+        data = self.data
+        
+        def build():
+            # Imported on first use: folium is only needed for the map
             import startup_map
             
+            # Large datasets are clustered in Python and served per viewport,
+            # with a density overlay for the overall picture
+            if len(data.dataset) >= SERVER_CLUSTERING_ROWS:
+                return startup_map.serve_map(data, options={"density": True})
+            return startup_map.build_map(data)
+        
+        # Built off the Tk thread; the window opens once the page is written
+        if self.worker is None:
+            self.on_map_built(build())
+            return
+        self.building_map = True
+        self.map_error_label.configure(text="")
+        self.open_map_button.configure(state="disabled", text="Building map...")
+        self.worker.submit(build, self.on_map_built, self.on_map_error)
+
+    def on_map_built(self, map_path):
+        import startup_map
+        
+        self.finish_map_build()
+        self.map_process = startup_map.show_map(map_path)
+
+    def on_map_error(self, error):
+        self.finish_map_build()
+        if self.map_error_label.winfo_exists():
+            self.map_error_label.configure(text=f"Error building map: {error}")
+        print("Error building map:", error)
+
+    def finish_map_build(self):
+        self.building_map = False
+        # The section may have been evicted while the map was built
+        if self.open_map_button.winfo_exists():
+            self.open_map_button.configure(state="normal", text="Open Interactive Map 🗺")
 
 class InvestorsSection:
     def __init__(self, parent, data):
         self.parent = parent
-        self.data = data.dataset
-        self.dataset_USA = data.dataset_USA
-        self.dataset_China = data.dataset_China
-        self.dataset_EU = data.dataset_EU
+        self.bind(data)
         self.setup_investors()
+
+    def bind(self, data):
+        self.investors = data.investors
         
     def setup_investors(self):
-        investors_tabs = ctk.CTkTabview(self.parent)
-        investors_tabs.pack(fill="both", expand=True, padx=10, pady=10)
+        self.investors_tabs = LazyTabs(self.parent)
         
-        # Add regional tabs
-        self.tab_usa = investors_tabs.add("United States")
-        self.tab_china = investors_tabs.add("China")
-        self.tab_europe = investors_tabs.add("Europe")
+        # Add regional tabs, each rendered on first selection
+        self.tab_usa = self.investors_tabs.add("United States", self.create_usa_analysis)
+        self.tab_china = self.investors_tabs.add("China", self.create_china_analysis)
+        self.tab_europe = self.investors_tabs.add("Europe", self.create_europe_analysis)
         
-        self.create_usa_analysis()
-        self.create_china_analysis()
-        self.create_europe_analysis()
+        self.investors_tabs.render_current()
     
     def create_usa_analysis(self):
         left_frame = ctk.CTkFrame(self.tab_usa, fg_color="transparent")
@@ -681,19 +978,8 @@ class InvestorsSection:
         right_frame = ctk.CTkFrame(self.tab_usa, fg_color="transparent")
         right_frame.pack(side="right", fill="both", expand=True, padx=5)
         
-        # Process investors data
-        def process_investors(row):
-            if pd.isna(row):
-                return []
-            return [inv.strip() for inv in str(row).split(',')]
-        
-        # Create a list of all investors and their frequencies
-        all_investors = []
-        for investors in self.dataset_USA['Select Investors'].apply(process_investors):
-            all_investors.extend(investors)
-        
-        investor_counts = pd.Series(all_investors).value_counts()
-        top_investors = investor_counts.head(10)  # Get top 10 investors
+        # Top 10 investors by number of startups backed
+        top_investors = self.investors.top_by_count("USA", 10)
         
         # Top Investors by Startup Count (Bar Chart)
         fig1, ax1 = plt.subplots(figsize=(8, 4))
@@ -710,28 +996,15 @@ class InvestorsSection:
             ax1.text(v + 0.1, i, str(v), va='center')
         
         plt.tight_layout()
-        canvas1 = FigureCanvasTkAgg(fig1, left_frame)
+        canvas1 = backend_tkagg.FigureCanvasTkAgg(fig1, left_frame)
         canvas1.draw()
         canvas1.get_tk_widget().pack(side="left", fill="both", expand=True)
         
         # Right frame - Top Investors by Portfolio Value (Pie Chart)
         fig2, ax2 = plt.subplots(figsize=(8, 4))
         
-        # Calculate total portfolio value for each investor
-        investor_portfolios = {}
-        for idx, row in self.dataset_USA.iterrows():
-            investors = process_investors(row['Select Investors'])
-            valuation = row['Valuation ($B)']
-            for investor in investors:
-                if investor in investor_portfolios:
-                    investor_portfolios[investor] += valuation
-                else:
-                    investor_portfolios[investor] = valuation
-        
-        # Get top 8 investors by portfolio value
-        top_portfolios = dict(sorted(investor_portfolios.items(), 
-                                    key=lambda x: x[1], 
-                                    reverse=True)[:8])
+        # Get top 8 investors by total portfolio value
+        top_portfolios = self.investors.top_by_portfolio("USA", 8).to_dict()
         
         # Create pie chart
         wedges, texts, autotexts = ax2.pie(
@@ -749,7 +1022,7 @@ class InvestorsSection:
         ax2.set_title("Top Investors by Portfolio Value")
         
         plt.tight_layout()
-        canvas2 = FigureCanvasTkAgg(fig2, right_frame)
+        canvas2 = backend_tkagg.FigureCanvasTkAgg(fig2, right_frame)
         canvas2.draw()
         canvas2.get_tk_widget().pack(side="right", fill="both", expand=True)
         
@@ -761,19 +1034,8 @@ class InvestorsSection:
         right_frame = ctk.CTkFrame(self.tab_china, fg_color="transparent")
         right_frame.pack(side="right", fill="both", expand=True, padx=5)
         
-        # Process investors data
-        def process_investors(row):
-            if pd.isna(row):
-                return []
-            return [inv.strip() for inv in str(row).split(',')]
-        
-        # Create a list of all investors and their frequencies
-        all_investors = []
-        for investors in self.dataset_China['Select Investors'].apply(process_investors):
-            all_investors.extend(investors)
-        
-        investor_counts = pd.Series(all_investors).value_counts()
-        top_investors = investor_counts.head(10)  # Get top 10 investors
+        # Top 10 investors by number of startups backed
+        top_investors = self.investors.top_by_count("China", 10)
         
         # Top Investors by Startup Count (Bar Chart)
         fig1, ax1 = plt.subplots(figsize=(8, 4))
@@ -790,28 +1052,15 @@ class InvestorsSection:
             ax1.text(v + 0.1, i, str(v), va='center')
         
         plt.tight_layout()
-        canvas1 = FigureCanvasTkAgg(fig1, left_frame)
+        canvas1 = backend_tkagg.FigureCanvasTkAgg(fig1, left_frame)
         canvas1.draw()
         canvas1.get_tk_widget().pack(side="left", fill="both", expand=True)
         
         # Right frame - Top Investors by Portfolio Value (Pie Chart)
         fig2, ax2 = plt.subplots(figsize=(8, 4))
         
-        # Calculate total portfolio value for each investor
-        investor_portfolios = {}
-        for idx, row in self.dataset_China.iterrows():
-            investors = process_investors(row['Select Investors'])
-            valuation = row['Valuation ($B)']
-            for investor in investors:
-                if investor in investor_portfolios:
-                    investor_portfolios[investor] += valuation
-                else:
-                    investor_portfolios[investor] = valuation
-        
-        # Get top 8 investors by portfolio value
-        top_portfolios = dict(sorted(investor_portfolios.items(), 
-                                    key=lambda x: x[1], 
-                                    reverse=True)[:8])
+        # Get top 8 investors by total portfolio value
+        top_portfolios = self.investors.top_by_portfolio("China", 8).to_dict()
         
         # Create pie chart
         wedges, texts, autotexts = ax2.pie(
@@ -829,7 +1078,7 @@ class InvestorsSection:
         ax2.set_title("Top Investors by Portfolio Value")
         
         plt.tight_layout()
-        canvas2 = FigureCanvasTkAgg(fig2, right_frame)
+        canvas2 = backend_tkagg.FigureCanvasTkAgg(fig2, right_frame)
         canvas2.draw()
         canvas2.get_tk_widget().pack(side="right", fill="both", expand=True)
         
@@ -841,19 +1090,8 @@ class InvestorsSection:
         right_frame = ctk.CTkFrame(self.tab_europe, fg_color="transparent")
         right_frame.pack(side="right", fill="both", expand=True, padx=5)
         
-        # Process investors data
-        def process_investors(row):
-            if pd.isna(row):
-                return []
-            return [inv.strip() for inv in str(row).split(',')]
-        
-        # Create a list of all investors and their frequencies
-        all_investors = []
-        for investors in self.dataset_EU['Select Investors'].apply(process_investors):
-            all_investors.extend(investors)
-        
-        investor_counts = pd.Series(all_investors).value_counts()
-        top_investors = investor_counts.head(10)  # Get top 10 investors
+        # Top 10 investors by number of startups backed
+        top_investors = self.investors.top_by_count("Europe", 10)
         
         # Top Investors by Startup Count (Bar Chart)
         fig1, ax1 = plt.subplots(figsize=(8, 4))
@@ -870,28 +1108,15 @@ class InvestorsSection:
             ax1.text(v + 0.1, i, str(v), va='center')
         
         plt.tight_layout()
-        canvas1 = FigureCanvasTkAgg(fig1, left_frame)
+        canvas1 = backend_tkagg.FigureCanvasTkAgg(fig1, left_frame)
         canvas1.draw()
         canvas1.get_tk_widget().pack(side="left", fill="both", expand=True)
         
         # Right frame - Top Investors by Portfolio Value (Pie Chart)
         fig2, ax2 = plt.subplots(figsize=(8, 4))
         
-        # Calculate total portfolio value for each investor
-        investor_portfolios = {}
-        for idx, row in self.dataset_EU.iterrows():
-            investors = process_investors(row['Select Investors'])
-            valuation = row['Valuation ($B)']
-            for investor in investors:
-                if investor in investor_portfolios:
-                    investor_portfolios[investor] += valuation
-                else:
-                    investor_portfolios[investor] = valuation
-        
-        # Get top 8 investors by portfolio value
-        top_portfolios = dict(sorted(investor_portfolios.items(), 
-                                    key=lambda x: x[1], 
-                                    reverse=True)[:8])
+        # Get top 8 investors by total portfolio value
+        top_portfolios = self.investors.top_by_portfolio("Europe", 8).to_dict()
         
         # Create pie chart
         wedges, texts, autotexts = ax2.pie(
@@ -909,7 +1134,7 @@ class InvestorsSection:
         ax2.set_title("Top Investors by Portfolio Value")
         
         plt.tight_layout()
-        canvas2 = FigureCanvasTkAgg(fig2, right_frame)
+        canvas2 = backend_tkagg.FigureCanvasTkAgg(fig2, right_frame)
         canvas2.draw()
         canvas2.get_tk_widget().pack(side="right", fill="both", expand=True)
         
@@ -918,11 +1143,12 @@ class InvestorsSection:
 class CompareSection:
     def __init__(self, parent, data):
         self.parent = parent
-        self.data = data
-        self.dataset_USA = data.dataset_USA
-        self.dataset_China = data.dataset_China
-        self.dataset_EU = data.dataset_EU
+        self.bind(data)
         self.setup_compare()
+
+    def bind(self, data):
+        self.data = data
+        self.aggregates = data.aggregates
         
     def setup_compare(self):
         # Create main frame with two rows
@@ -941,60 +1167,30 @@ class CompareSection:
         right_frame = ctk.CTkFrame(parent, fg_color="transparent")
         right_frame.pack(side="right", fill="both", expand=True, padx=5)
         
-        # Average Valuation Comparison (Bar Chart)
-        fig1, ax1 = plt.subplots(figsize=(8, 4))
         regions = ['USA', 'China', 'Europe']
-        avg_valuations = [
-            self.dataset_USA['Valuation ($B)'].mean(),
-            self.dataset_China['Valuation ($B)'].mean(),
-            self.dataset_EU['Valuation ($B)'].mean()
-        ]
-        
-        bars = ax1.bar(regions, avg_valuations, color=['#1a73e8', '#dc3912', '#ff9900'])
-        ax1.set_title("Average Startup Valuation by Region")
-        ax1.set_ylabel("Average Valuation ($B)")
-        
-        # Add value labels on top of bars
-        for i, v in enumerate(avg_valuations):
-            ax1.text(i, v, f'${v:.1f}B', ha='center', va='bottom')
-        
-        plt.tight_layout()
-        canvas1 = FigureCanvasTkAgg(fig1, left_frame)
-        canvas1.draw()
-        canvas1.get_tk_widget().pack(fill="both", expand=True)
-        
-        # Number of Unicorns Comparison (Pie Chart)
-        fig2, ax2 = plt.subplots(figsize=(8, 4))
-        
-        unicorn_counts = [
-            len(self.dataset_USA[self.dataset_USA['Valuation ($B)'] >= 1]),
-            len(self.dataset_China[self.dataset_China['Valuation ($B)'] >= 1]),
-            len(self.dataset_EU[self.dataset_EU['Valuation ($B)'] >= 1])
-        ]
-        
-        wedges, texts, autotexts = ax2.pie(
-            unicorn_counts,
-            labels=regions,
-            autopct='%1.1f%%',
-            colors=['#1a73e8', '#dc3912', '#ff9900'],
-            pctdistance=0.85
+        avg_valuations = [float(self.aggregates.region_stat(region, "mean")) for region in regions]
+        unicorn_counts = [int(self.aggregates.region_stat(region, "unicorns")) for region in regions]
+        
+        # Average Valuation (Bar Chart) and Number of Unicorns (Pie Chart)
+        RenderedFigure(
+            left_frame,
+            figure_pool.render(charts.average_valuation_bars, regions, avg_valuations),
+            fill="both", expand=True
+        )
+        RenderedFigure(
+            right_frame,
+            figure_pool.render(charts.unicorn_pie, regions, unicorn_counts),
+            fill="both", expand=True
         )
-        
-        ax2.set_title(f"Distribution of Unicorns\nTotal: {sum(unicorn_counts)} Companies")
-        
-        plt.tight_layout()
-        canvas2 = FigureCanvasTkAgg(fig2, right_frame)
-        canvas2.draw()
-        canvas2.get_tk_widget().pack(fill="both", expand=True)
     
     def create_industry_comparison(self, parent):
-        # Industry Distribution Comparison (Stacked Bar Chart)
-        fig, ax = plt.subplots(figsize=(16, 6))
-        
         # Get top 5 industries from each region
-        usa_industries = self.dataset_USA['Industry'].value_counts().head(5)
-        china_industries = self.dataset_China['Industry'].value_counts().head(5)
-        eu_industries = self.dataset_EU['Industry'].value_counts().head(5)
+        usa_counts = self.aggregates.industry_counts_for("USA")
+        china_counts = self.aggregates.industry_counts_for("China")
+        eu_counts = self.aggregates.industry_counts_for("Europe")
+        usa_industries = usa_counts.head(5)
+        china_industries = china_counts.head(5)
+        eu_industries = eu_counts.head(5)
         
         # Combine all unique industries
         all_industries = list(set(usa_industries.index) | 
@@ -1002,46 +1198,71 @@ class CompareSection:
                             set(eu_industries.index))
         
         # Create data for each region
-        usa_data = [self.dataset_USA['Industry'].value_counts().get(ind, 0) for ind in all_industries]
-        china_data = [self.dataset_China['Industry'].value_counts().get(ind, 0) for ind in all_industries]
-        eu_data = [self.dataset_EU['Industry'].value_counts().get(ind, 0) for ind in all_industries]
-        
-        x = np.arange(len(all_industries))
-        width = 0.25
-        
-        # Create bars
-        ax.bar(x - width, usa_data, width, label='USA', color='#1a73e8')
-        ax.bar(x, china_data, width, label='China', color='#dc3912')
-        ax.bar(x + width, eu_data, width, label='Europe', color='#ff9900')
-        
-        # Customize the plot
-        ax.set_title('Industry Distribution Comparison')
-        ax.set_xticks(x)
-        ax.set_xticklabels(all_industries, rotation=45, ha='right')
-        ax.legend()
-        
-        # Add value labels
-        for i, v in enumerate(usa_data):
-            ax.text(i - width, v, str(v), ha='center', va='bottom')
-        for i, v in enumerate(china_data):
-            ax.text(i, v, str(v), ha='center', va='bottom')
-        for i, v in enumerate(eu_data):
-            ax.text(i + width, v, str(v), ha='center', va='bottom')
-        
-        plt.tight_layout()
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
+        region_data = [
+            ('USA', [int(usa_counts.get(ind, 0)) for ind in all_industries]),
+            ('China', [int(china_counts.get(ind, 0)) for ind in all_industries]),
+            ('Europe', [int(eu_counts.get(ind, 0)) for ind in all_industries]),
+        ]
         
-        plt.close('all')
+        # Industry Distribution Comparison (Grouped Bar Chart)
+        RenderedFigure(
+            parent,
+            figure_pool.render(charts.industry_comparison_bars, all_industries, region_data, figsize=(16, 6)),
+            fill="both", expand=True
+        )
+
+# Sections built by the navigation bar, by nav choice
+SECTIONS = {
+    "Dashboard": DashboardSection,
+    "Regional Overview": AnalyticsSection,
+    "Industries": IndustriesSection,
+    "MapView": MapViewSection,
+    "Investors": InvestorsSection,
+    "Compare": CompareSection,
+}
+
+# Number of built sections kept alive (hidden) between nav clicks
+SECTION_CACHE_SIZE = 4
+
+# How often the data file and its deltas are checked for changes
+WATCH_INTERVAL_MS = 2000
+
+def section_inputs(data):
+    # Digest of what each section displays. After a reload only sections
+    # whose digest changed are rebuilt; "Dashboard.metrics" covers the
+    # metric cards, which are updated in place.
+    aggregates = data.aggregates
+    regions = data.regions.names()
+    return {
+        "Dashboard.metrics": digest(dashboard_metrics(aggregates)),
+        "Dashboard": digest(*DashboardSection.graph_inputs(aggregates)),
+        "Regional Overview": digest(
+            aggregates.region_stats["median"], aggregates.cube["count"],
+            # Valuation densities: row order is irrelevant
+            *[data.region(region)["Valuation ($B)"].sort_values(ignore_index=True) for region in regions]
+        ),
+        "Industries": digest(aggregates.cube),
+        "Investors": digest(
+            *[data.investors.top_by_count(region, 10) for region in regions],
+            *[data.investors.top_by_portfolio(region, 8) for region in regions]
+        ),
+        "Compare": digest(aggregates.region_stats[["mean", "unicorns"]], aggregates.cube["count"]),
+        "MapView": digest(data.dataset[["Company", "City", "Country", "Valuation ($B)", "Latitude", "Longitude", "Region"]]),
+    }
 
 class StartupInsightsApp:
     def __init__(self):
         self.setup_window()
-        self.data = StartupData()
+        self.data = None
+        self.inputs = {}
+        self.watcher = None
+        self.reloading = False
+        self.reload_pending = False
+        self.worker = BackgroundWorker(self.root)
         self.setup_navigation()
         self.setup_content()
         self.setup_status_bar()
+        self.load_data()
 
     def setup_window(self):
         self.root = ctk.CTk()
@@ -1091,6 +1312,12 @@ class StartupInsightsApp:
         self.content_container = ctk.CTkFrame(self.root, fg_color="transparent")
         self.content_container.pack(fill=ctk.BOTH, expand=True, padx=20, pady=(0, 20))
         
+        # Built sections, least recently shown first, and their section objects
+        self.section_cache = OrderedDict()
+        self.section_views = {}
+        self.current_choice = None
+        self.current_frame = None
+        
         # Show initial dashboard
         self.display_content("Dashboard")
 
@@ -1098,36 +1325,183 @@ class StartupInsightsApp:
         status_bar = ctk.CTkFrame(self.root, height=30, fg_color=StyleConfig.NAV_BG)
         status_bar.pack(side=ctk.BOTTOM, fill=ctk.X)
         
-        status_label = ctk.CTkLabel(
+        self.status_label = ctk.CTkLabel(
             status_bar,
             text="Ready",
             font=ctk.CTkFont(size=12),
             text_color="#666666",
         )
-        status_label.pack(side=ctk.LEFT, padx=10)
+        self.status_label.pack(side=ctk.LEFT, padx=10)
 
-    def display_content(self, choice):
-        # Clear previous content
-        for widget in self.content_container.winfo_children():
-            widget.destroy()
+    def set_status(self, text):
+        self.status_label.configure(text=text)
+
+    def load_data(self):
+        # Load and aggregate in the background; the window stays responsive
+        progress = lambda text: self.worker.post(self.set_status, text)
+        
+        def load():
+            data = StartupData(progress)
+            return data, section_inputs(data)
+        
+        self.worker.submit(load, self.on_data_loaded, self.on_data_error)
+
+    def on_data_loaded(self, result):
+        self.data, self.inputs = result
+        self.set_status(f"Ready - {len(self.data.dataset):,} startups loaded")
+        self.invalidate_sections()
+        self.watch_data()
+
+    def on_data_error(self, error):
+        self.set_status(f"Error loading data: {error}")
+        print("Error loading data:", error)
+        # Watched from now on, so fixing the file loads it without a restart
+        self.watch_data()
+        self.watcher.retry()
+
+    def watch_data(self):
+        from data_loader import DATA_FILE
+        from ingest import source_stamp
+        
+        if self.watcher is None:
+            self.watcher = DataWatcher(
+                self.root, lambda: source_stamp(DATA_FILE), self.reload_data, WATCH_INTERVAL_MS
+            )
+
+    def reload_data(self):
+        # Called by the watcher; one reload at a time, the last change wins
+        if self.reloading:
+            self.reload_pending = True
+            return
+        self.reloading = True
+        previous = self.data
+        progress = lambda text: self.worker.post(self.set_status, text)
+        
+        def reload():
+            from ingest import diff_datasets
             
+            # Nothing loaded yet (the first load failed): a plain load
+            if previous is None:
+                data = StartupData(progress)
+                return data, section_inputs(data), None
+            # New delta files alone are merged into a copy of the current
+            # data; anything else is a full reload
+            paths = previous.pending_deltas()
+            if paths is None:
+                data = StartupData(progress)
+            else:
+                progress(f"Merging {len(paths)} new delta file(s)...")
+                data = previous.merged(paths)
+            return data, section_inputs(data), diff_datasets(previous.dataset, data.dataset)
+        
+        self.worker.submit(reload, self.on_data_reloaded, self.on_reload_error)
+
+    def ingest(self, delta):
+        # Validates and stores a delta frame off the Tk thread, then merges
+        # it like any new delta file, without waiting for the watcher
+        from data_loader import DATA_FILE
+        from ingest import append_delta
+        
+        self.worker.submit(lambda: append_delta(delta, DATA_FILE), self.on_delta_stored, self.on_ingest_error)
+
+    def on_delta_stored(self, result):
+        if self.watcher is not None:
+            self.watcher.acknowledge()
+        self.reload_data()
+
+    def on_ingest_error(self, error):
+        self.set_status(f"Error ingesting data: {error}")
+        print("Error ingesting data:", error)
+
+    def on_data_reloaded(self, result):
+        # finish_reload even if refreshing fails, or no reload would run again
         try:
-            if choice == "Dashboard":
-                DashboardSection(self.content_container, self.data)
-            elif choice == "Regional Overview":
-                AnalyticsSection(self.content_container, self.data)
-            elif choice == "Industries":
-                IndustriesSection(self.content_container, self.data)
-            elif choice == "MapView":
-                MapViewSection(self.content_container, self.data)
-            elif choice == "Investors":
-                InvestorsSection(self.content_container, self.data)
-            elif choice == "Compare":
-                CompareSection(self.content_container, self.data)
+            data, inputs, changes = result
+            stale = {name for name, value in inputs.items() if self.inputs.get(name) != value}
+            self.data, self.inputs = data, inputs
+        
+            # Metric cards are updated in place when the graphs below them are unchanged
+            dashboard = self.section_views.get("Dashboard")
+            if dashboard is not None and "Dashboard" not in stale and "Dashboard.metrics" in stale:
+                dashboard.update_metrics(data)
+            self.invalidate_sections(stale & set(SECTIONS))
+            # Sections kept show the same content; point them at the new data so
+            # the previous one is not kept alive
+            for view in self.section_views.values():
+                view.bind(data)
+        
+            if changes is None:
+                self.set_status(f"Ready - {len(data.dataset):,} startups loaded")
+            else:
+                summary = ", ".join(f"{len(companies)} {kind}" for kind, companies in changes.items())
+                refreshed = ", ".join(sorted(stale)) or "nothing"
+                self.set_status(f"Reloaded {len(data.dataset):,} startups ({summary}) - refreshed {refreshed}")
+        finally:
+            self.finish_reload()
+
+    def on_reload_error(self, error):
+        # Keep showing the current data; the next change triggers a new attempt
+        self.set_status(f"Error reloading data: {error}")
+        print("Error reloading data:", error)
+        self.finish_reload()
+
+    def finish_reload(self):
+        self.reloading = False
+        if self.reload_pending:
+            self.reload_pending = False
+            self.reload_data()
+
+    def display_content(self, choice):
+        if choice == self.current_choice and self.current_frame is not None:
+            return
+        
+        # Hide the previous section; it stays built unless it failed to load
+        if self.current_frame is not None:
+            self.current_frame.pack_forget()
+            if self.current_choice not in self.section_cache:
+                self.current_frame.destroy()
+        
+        frame = self.section_cache.get(choice)
+        if frame is not None:
+            self.section_cache.move_to_end(choice)
+        else:
+            frame = self.build_section(choice)
+        
+        frame.pack(fill=ctk.BOTH, expand=True)
+        self.current_choice = choice
+        self.current_frame = frame
+
+    def build_section(self, choice):
+        frame = ctk.CTkFrame(self.content_container, fg_color="transparent")
+        
+        # Not cached: rebuilt by invalidate_sections once the data arrives
+        if self.data is None:
+            loading_label = ctk.CTkLabel(
+                frame,
+                text="Loading startup data...",
+                font=ctk.CTkFont(size=16),
+                text_color="#666666"
+            )
+            loading_label.pack(pady=40)
+            return frame
+        
+        try:
+            if SECTIONS[choice] is MapViewSection:
+                # Builds the browser map through the app's worker
+                self.section_views[choice] = MapViewSection(frame, self.data, self.worker)
+            else:
+                self.section_views[choice] = SECTIONS[choice](frame, self.data)
+            self.section_cache[choice] = frame
+            
+            # Drop the least recently shown sections beyond the cache bound
+            while len(self.section_cache) > SECTION_CACHE_SIZE:
+                evicted_choice, evicted = self.section_cache.popitem(last=False)
+                self.section_views.pop(evicted_choice, None)
+                evicted.destroy()
             
         except Exception as e:
             error_label = ctk.CTkLabel(
-                self.content_container,
+                frame,
                 text=f"Error loading {choice} section: {str(e)}",
                 text_color="red"
             )
@@ -1135,9 +1509,32 @@ class StartupInsightsApp:
             
             # Log the error (you might want to add proper logging)
             print(f"Error in {choice} section:", e)
+        
+        return frame
+
+    def invalidate_sections(self, choices=None):
+        # Call whenever self.data changes: cached sections show stale figures.
+        # choices limits this to the given sections (default: all of them);
+        # a section shown without being cached (loading, error) is always rebuilt
+        choice = self.current_choice
+        stale = list(self.section_cache) if choices is None else [c for c in self.section_cache if c in choices]
+        rebuild_current = choice is not None and (choice in stale or choice not in self.section_cache)
+        
+        if rebuild_current and choice not in self.section_cache:
+            self.current_frame.destroy()
+        for name in stale:
+            self.section_views.pop(name, None)
+            self.section_cache.pop(name).destroy()
+        
+        if rebuild_current:
+            self.current_choice = None
+            self.current_frame = None
+            self.display_content(choice)
 
     def run(self):
         self.root.mainloop()
+        self.worker.shutdown()
+        figure_pool.shutdown()
 
 if __name__ == "__main__":
     app = StartupInsightsApp()
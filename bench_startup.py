@@ -0,0 +1,97 @@
+import os
+import subprocess
+import sys
+
+# Startup benchmark: everything imported before the window shows must fit in
+# IMPORT_BUDGET_US, and the plotting/data stack must not be part of it.
+#
+#   python bench_startup.py            # import-time budget only
+#   python bench_startup.py --window   # also time until the window is drawn
+
+IMPORT_BUDGET_US = 300_000
+
+# Imported lazily on first use, never on the path to the window
+DEFERRED_MODULES = ["pandas", "numpy", "matplotlib", "seaborn", "folium"]
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+WINDOW_SCRIPT = """
+import time
+start = time.perf_counter()
+import app
+window = app.StartupInsightsApp()
+window.root.update()
+print(f"{(time.perf_counter() - start) * 1000:.0f}")
+window.worker.shutdown()
+window.root.destroy()
+"""
+
+
+def import_times(module="app"):
+    # Parse `python -X importtime` output into [(package, cumulative_us)],
+    # keeping the indentation that encodes the import tree
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=HERE, capture_output=True, text=True, check=True,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, package = line.split("|")
+        times.append((package.rstrip()[1:], int(cumulative)))
+    return times
+
+
+def direct_imports(times, module):
+    # Children are listed before their parent, one indent level deeper
+    end = next(i for i, (package, _) in enumerate(times) if package == module)
+    children = []
+    for package, us in reversed(times[:end]):
+        if not package.startswith(" "):
+            break
+        if not package.startswith("   "):
+            children.append((us, package.strip()))
+    return sorted(children, reverse=True)
+
+
+def time_to_window():
+    result = subprocess.run(
+        [sys.executable, "-c", WINDOW_SCRIPT],
+        cwd=HERE, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        return None
+    return int(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    times = import_times("app")
+    total = dict(times)["app"]
+    loaded = {package.strip().split(".")[0] for package, _ in times}
+    leaked = [module for module in DEFERRED_MODULES if module in loaded]
+
+    print(f"import app: {total / 1000:.1f} ms (budget {IMPORT_BUDGET_US / 1000:.0f} ms)")
+    for us, package in direct_imports(times, "app")[:5]:
+        print(f"  {package:<30} {us / 1000:8.1f} ms")
+
+    failed = False
+    if total > IMPORT_BUDGET_US:
+        print("FAIL: import budget exceeded")
+        failed = True
+    if leaked:
+        print(f"FAIL: imported before first use: {', '.join(leaked)}")
+        failed = True
+
+    if "--window" in sys.argv:
+        elapsed = time_to_window()
+        if elapsed is None:
+            print("time to window: unavailable (no display?)")
+        else:
+            print(f"time to window: {elapsed} ms")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
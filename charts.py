@@ -0,0 +1,92 @@
+import numpy as np
+from matplotlib import colormaps
+
+# Chart builders rasterized by figure_pool in worker processes. Each one
+# draws on a bare matplotlib Figure (no pyplot) from plain, picklable data.
+
+REGION_COLORS = ['#1a73e8', '#dc3912', '#ff9900']
+
+
+def industry_valuation_bars(fig, industry_valuations, label):
+    # Top Industries by Total Valuation (Bar Chart)
+    ax = fig.add_subplot()
+    industry_valuations.plot(kind='barh', ax=ax, color='#1a73e8')
+    ax.set_title(f"Top Industries by Total Valuation ({label})")
+    ax.set_xlabel("Total Valuation ($B)")
+
+    # Add value labels on the bars with padding using x offset
+    for i, v in enumerate(industry_valuations):
+        ax.text(v + 0.5, i, f'${v:.1f}B', va='center', ha='left')
+
+
+def industry_valuation_scatter(fig, industry_stats, label):
+    # Valuation per Startup in Key Industries (Scatter Plot)
+    ax = fig.add_subplot()
+    colors = colormaps['Set3'](np.linspace(0, 1, len(industry_stats)))
+
+    for idx, row in industry_stats.iterrows():
+        ax.scatter(
+            row['Count'],
+            row['Avg_Valuation'],
+            s=100,
+            c=[colors[idx]],
+            alpha=0.8,
+            label=f"{row['Industry']} (${row['Avg_Valuation']:.1f}B)"
+        )
+
+    ax.set_title(f"Valuation per Startup in Key Industries ({label})")
+    ax.set_xlabel("Number of Startups")
+    ax.set_ylabel("Average Valuation ($B)")
+    ax.grid(True, linestyle='--', alpha=0.3)
+
+    # Add legend outside of plot
+    ax.legend(
+        bbox_to_anchor=(1.05, 1),
+        loc='upper left',
+        borderaxespad=0.,
+        fontsize=8
+    )
+
+
+def average_valuation_bars(fig, regions, avg_valuations):
+    # Average Valuation Comparison (Bar Chart)
+    ax = fig.add_subplot()
+    ax.bar(regions, avg_valuations, color=REGION_COLORS)
+    ax.set_title("Average Startup Valuation by Region")
+    ax.set_ylabel("Average Valuation ($B)")
+
+    # Add value labels on top of bars
+    for i, v in enumerate(avg_valuations):
+        ax.text(i, v, f'${v:.1f}B', ha='center', va='bottom')
+
+
+def unicorn_pie(fig, regions, unicorn_counts):
+    # Number of Unicorns Comparison (Pie Chart)
+    ax = fig.add_subplot()
+    ax.pie(
+        unicorn_counts,
+        labels=regions,
+        autopct='%1.1f%%',
+        colors=REGION_COLORS,
+        pctdistance=0.85
+    )
+    ax.set_title(f"Distribution of Unicorns\nTotal: {sum(unicorn_counts)} Companies")
+
+
+def industry_comparison_bars(fig, industries, region_data):
+    # Industry Distribution Comparison (grouped bars, one group per region)
+    ax = fig.add_subplot()
+    x = np.arange(len(industries))
+    width = 0.25
+    offsets = [-width, 0, width]
+
+    for (region, counts), offset, color in zip(region_data, offsets, REGION_COLORS):
+        ax.bar(x + offset, counts, width, label=region, color=color)
+        # Add value labels
+        for i, v in enumerate(counts):
+            ax.text(i + offset, v, str(v), ha='center', va='bottom')
+
+    ax.set_title('Industry Distribution Comparison')
+    ax.set_xticks(x)
+    ax.set_xticklabels(industries, rotation=45, ha='right')
+    ax.legend()
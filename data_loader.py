@@ -0,0 +1,207 @@
+import os
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+
+DATA_FILE = 'startups_with_coordinates.csv'
+
+# Bump when the cached layout changes so old caches are rebuilt
+CACHE_VERSION = 3
+
+# Columns the dashboard reads and how they are kept in memory; other CSV
+# columns (e.g. indice) are not loaded.
+#   'category': categorical
+#   'text': categorical when values repeat enough (CATEGORY_RATIO), else str
+#   'float': float32 when every value survives within FLOAT32_TOLERANCE
+SCHEMA = {
+    'Company': 'text',
+    'Valuation ($B)': 'float',
+    'Country': 'category',
+    'City': 'category',
+    'Industry': 'category',
+    'Select Investors': 'text',
+    'Latitude': 'float',
+    'Longitude': 'float',
+}
+CATEGORY_RATIO = 0.5
+# Valuations are given to the cent of a billion, coordinates to ~1 m
+FLOAT32_TOLERANCE = {'Valuation ($B)': 0.005, 'Latitude': 1e-5, 'Longitude': 1e-5}
+
+# Parquet needs pyarrow; without it we still cache, as a pickle
+try:
+    import pyarrow  # noqa: F401
+    CACHE_FORMAT = 'parquet'
+except ImportError:
+    CACHE_FORMAT = 'pickle'
+
+
+def cache_paths(csv_path):
+    base, _ = os.path.splitext(csv_path)
+    extension = '.parquet' if CACHE_FORMAT == 'parquet' else '.pkl'
+    return base + '.cache' + extension, base + '.cache.json'
+
+
+def file_stat(path):
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def file_hash(path, chunk_size=1 << 20):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compact_column(column, kind, tolerance=0.0):
+    if kind == 'float':
+        column = column.astype('float64')
+        narrow = column.astype('float32')
+        error = np.abs(narrow.to_numpy(dtype='float64') - column.to_numpy())
+        return narrow if np.nanmax(error, initial=0.0) <= tolerance else column
+    if kind == 'category' or column.nunique() <= CATEGORY_RATIO * len(column):
+        return column.astype('category')
+    return column
+
+
+def apply_schema(dataset):
+    # Compact dtypes for the SCHEMA columns present; others are left alone
+    return dataset.assign(**{
+        name: compact_column(dataset[name], kind, FLOAT32_TOLERANCE.get(name, 0.0))
+        for name, kind in SCHEMA.items() if name in dataset
+    })
+
+
+def align_dtypes(dataset, rows):
+    # Casts rows to the dataset's dtypes, widening categoricals on both
+    # sides, so pd.concat([dataset, rows]) keeps the compact dtypes
+    dataset = dataset.copy(deep=False)
+    rows = rows.copy()
+    for name in dataset.columns.intersection(rows.columns):
+        dtype = dataset[name].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            new = pd.Index(rows[name].dropna().unique()).difference(dtype.categories)
+            if len(new):
+                dataset[name] = dataset[name].cat.add_categories(new)
+            rows[name] = pd.Categorical(rows[name], categories=dataset[name].cat.categories)
+        elif dtype.kind == 'f':
+            rows[name] = rows[name].astype(dtype)
+    return dataset, rows
+
+
+def memory_report(before, after):
+    before_mb = before.memory_usage(deep=True).sum() / 1e6
+    after_mb = after.memory_usage(deep=True).sum() / 1e6
+    return f"Dataset memory: {before_mb:.2f} MB -> {after_mb:.2f} MB ({before_mb / after_mb:.1f}x smaller)"
+
+
+def read_source(csv_path):
+    # Only the SCHEMA columns are parsed; known categoricals directly as such
+    header = pd.read_csv(csv_path, nrows=0).columns
+    columns = [name for name in SCHEMA if name in header]
+    dtypes = {name: 'category' for name in columns if SCHEMA[name] == 'category'}
+    dataset = pd.read_csv(csv_path, usecols=columns, dtype=dtypes)[columns]
+    return apply_schema(check_rows(dataset, csv_path))
+
+
+def check_rows(dataset, csv_path):
+    # Rows failing validation go to the CSV's quarantine file
+    from validation import validate, quarantine_path, write_quarantine
+
+    dataset, rejected = validate(dataset)
+    try:
+        path = write_quarantine(rejected, quarantine_path(csv_path))
+    except OSError as e:
+        print("Could not write quarantine file:", e)
+    else:
+        if path:
+            print(f"{len(rejected)} invalid rows moved to {path}")
+    return dataset
+
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(meta_path, meta):
+    tmp_path = meta_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, meta_path)
+
+
+def _read_cache(cache_path):
+    if CACHE_FORMAT == 'parquet':
+        return pd.read_parquet(cache_path)
+    return pd.read_pickle(cache_path)
+
+
+def write_cache(dataset, csv_path, source_hash=None):
+    # Write the frame beside the CSV, then the metadata that validates it
+    cache_path, meta_path = cache_paths(csv_path)
+    meta = file_stat(csv_path)
+    meta['sha1'] = source_hash or file_hash(csv_path)
+    meta['version'] = CACHE_VERSION
+    meta['format'] = CACHE_FORMAT
+
+    tmp_path = cache_path + '.tmp'
+    if CACHE_FORMAT == 'parquet':
+        dataset.to_parquet(tmp_path, index=False)
+    else:
+        dataset.to_pickle(tmp_path)
+    os.replace(tmp_path, cache_path)
+    _write_meta(meta_path, meta)
+    return meta['sha1']
+
+
+def load_startups(csv_path=DATA_FILE, use_cache=True):
+    # Returns (dataset, fingerprint); the fingerprint is the CSV's sha1 and
+    # identifies the dataset version for anything derived from it
+    if not use_cache:
+        return read_source(csv_path), file_hash(csv_path)
+
+    cache_path, meta_path = cache_paths(csv_path)
+    meta = _read_meta(meta_path)
+    stat = file_stat(csv_path)
+
+    if (meta and meta.get('version') == CACHE_VERSION
+            and meta.get('format') == CACHE_FORMAT
+            and os.path.exists(cache_path)):
+        fresh = meta['size'] == stat['size'] and meta['mtime_ns'] == stat['mtime_ns']
+        if not fresh and meta['size'] == stat['size']:
+            # Touched but maybe not modified: only the hash can tell
+            source_hash = file_hash(csv_path)
+            if source_hash == meta['sha1']:
+                meta.update(stat)
+                try:
+                    _write_meta(meta_path, meta)
+                except OSError:
+                    pass
+                fresh = True
+        if fresh:
+            try:
+                return _read_cache(cache_path), meta['sha1']
+            except Exception as e:
+                # Corrupt or unreadable cache: fall back to the CSV
+                print("Ignoring unreadable data cache:", e)
+
+    dataset = read_source(csv_path)
+    source_hash = file_hash(csv_path)
+    try:
+        write_cache(dataset, csv_path, source_hash)
+    except Exception as e:
+        print("Could not write data cache:", e)
+    return dataset, source_hash
+
+
+if __name__ == "__main__":
+    # python data_loader.py [CSV]: memory of a plain read_csv vs the schema
+    import sys
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+    print(memory_report(pd.read_csv(csv_path), read_source(csv_path)))
@@ -0,0 +1,49 @@
+import numpy as np
+from geo_cluster import TILE_SIZE, project
+
+# Valuation-weighted point density on square Web Mercator grids. Points are
+# binned once at the finest resolution; each coarser level sums 4x4 blocks
+# of the level above, so every level costs O(cells) whatever the number of
+# startups. A grid at zoom z has cells of cell_px screen pixels at that zoom.
+
+DENSITY_ZOOMS = (0, 2, 4, 6)
+CELL_PX = 8
+# Latitude range of the Web Mercator square
+MERCATOR_BOUNDS = [[-85.0511, -180.0], [85.0511, 180.0]]
+
+
+def grid_cells(zoom, cell_px=CELL_PX):
+    return TILE_SIZE * 2 ** zoom // cell_px
+
+
+def density_grids(lat, lon, weights=None, zooms=DENSITY_ZOOMS, cell_px=CELL_PX):
+    # {zoom: (cells, cells) array}, row 0 at the north edge
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+    weights = np.ones(len(lat)) if weights is None else np.nan_to_num(np.asarray(weights, dtype=float))
+    keep = np.isfinite(lat) & np.isfinite(lon)
+
+    zooms = sorted(zooms)
+    cells = grid_cells(zooms[-1], cell_px)
+    x, y = project(lat[keep], lon[keep])
+    index = (y * cells).astype(np.int64) * cells + (x * cells).astype(np.int64)
+    grid = np.bincount(index, weights=weights[keep], minlength=cells * cells).reshape(cells, cells)
+
+    grids = {zooms[-1]: grid}
+    for zoom in reversed(zooms[:-1]):
+        factor = cells // grid_cells(zoom, cell_px)
+        cells //= factor
+        grid = grid.reshape(cells, factor, cells, factor).sum(axis=(1, 3))
+        grids[zoom] = grid
+    return grids
+
+
+def density_image(grid, cmap="YlOrRd"):
+    # RGBA uint8 image: log-scaled colour, empty cells transparent
+    from matplotlib import colormaps
+    scale = np.log1p(grid)
+    top = scale.max()
+    scale = scale / top if top > 0 else scale
+    rgba = colormaps[cmap](scale)
+    rgba[..., 3] = np.where(grid > 0, 0.35 + 0.5 * scale, 0.0)
+    return (rgba * 255).astype(np.uint8)
@@ -0,0 +1,44 @@
+import os
+
+# Worker processes that rasterize independent charts with the Agg backend.
+# The Tk side receives (width, height, rgba_bytes) and only blits the image.
+
+_pool = None
+
+
+def pool_size():
+    return max(1, min(4, (os.cpu_count() or 2) - 1))
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        # Imported here: multiprocessing is not needed to open the window
+        from concurrent.futures import ProcessPoolExecutor
+        _pool = ProcessPoolExecutor(max_workers=pool_size())
+    return _pool
+
+
+def rasterize(builder, args, figsize, dpi):
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=figsize, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    builder(fig, *args)
+    fig.tight_layout()
+    canvas.draw()
+    width, height = canvas.get_width_height()
+    return width, height, bytes(canvas.buffer_rgba())
+
+
+def render(builder, *args, figsize=(8, 4), dpi=100):
+    # builder must be a module-level function so it can be pickled
+    return get_pool().submit(rasterize, builder, args, figsize, dpi)
+
+
+def shutdown():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
@@ -0,0 +1,123 @@
+import numpy as np
+
+# Grid-based hierarchical clustering of points, supercluster style. Points
+# are projected to Web Mercator in [0, 1) and merged per grid cell of
+# radius_px screen pixels at every zoom level. A cell at zoom z is exactly
+# four cells at zoom z + 1, so each level is built from the level below
+# instead of from the raw points.
+
+TILE_SIZE = 256
+
+
+def project(lat, lon):
+    lat = np.clip(np.asarray(lat, dtype=float), -85.0511, 85.0511)
+    x = (np.asarray(lon, dtype=float) + 180.0) / 360.0
+    sin = np.sin(np.radians(lat))
+    y = 0.5 - np.log((1 + sin) / (1 - sin)) / (4 * np.pi)
+    return np.clip(x, 0, 1 - 1e-12), np.clip(y, 0, 1 - 1e-12)
+
+
+def unproject(x, y):
+    lon = np.asarray(x) * 360.0 - 180.0
+    lat = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * np.asarray(y)))))
+    return lat, lon
+
+
+class ClusterLevel:
+    # Clusters of one zoom level, sorted by x for viewport queries
+    def __init__(self, x, y, count, value, ids):
+        order = np.argsort(x, kind="stable")
+        self.x = x[order]
+        self.y = y[order]
+        self.count = count[order]
+        self.value = value[order]
+        # Row id of the point when count == 1, else -1
+        self.ids = ids[order]
+
+    def __len__(self):
+        return len(self.x)
+
+    def query(self, x_ranges, y_min, y_max):
+        selected = []
+        for x_min, x_max in x_ranges:
+            start, stop = np.searchsorted(self.x, [x_min, x_max], side="left")
+            rows = np.arange(start, stop)
+            rows = rows[(self.y[rows] >= y_min) & (self.y[rows] <= y_max)]
+            selected.append(rows)
+        return np.concatenate(selected) if selected else np.array([], dtype=int)
+
+
+class ClusterIndex:
+    def __init__(self, lat, lon, value=None, ids=None, min_zoom=0, max_zoom=12, radius_px=60):
+        lat = np.asarray(lat, dtype=float)
+        lon = np.asarray(lon, dtype=float)
+        keep = np.isfinite(lat) & np.isfinite(lon)
+        value = np.zeros(len(lat)) if value is None else np.asarray(value, dtype=float)
+        ids = np.arange(len(lat)) if ids is None else np.asarray(ids)
+
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+        self.radius_px = radius_px
+
+        x, y = project(lat[keep], lon[keep])
+        count = np.ones(len(x))
+        value = np.nan_to_num(value[keep])
+        ids = ids[keep].astype(np.int64)
+
+        # Zooms above max_zoom are served the points themselves
+        self.points = ClusterLevel(x, y, count, value, ids)
+
+        self.levels = {}
+        for zoom in range(max_zoom, min_zoom - 1, -1):
+            x, y, count, value, ids = self._merge(x, y, count, value, ids, zoom)
+            self.levels[zoom] = ClusterLevel(x, y, count, value, ids)
+
+    def _merge(self, x, y, count, value, ids, zoom):
+        cells = TILE_SIZE * 2 ** zoom / self.radius_px
+        cell_x = np.floor(x * cells).astype(np.int64)
+        cell_y = np.floor(y * cells).astype(np.int64)
+        keys = cell_x * (int(np.ceil(cells)) + 1) + cell_y
+        keys, inverse = np.unique(keys, return_inverse=True)
+
+        total = np.bincount(inverse, weights=count)
+        merged_x = np.bincount(inverse, weights=x * count) / total
+        merged_y = np.bincount(inverse, weights=y * count) / total
+        merged_value = np.bincount(inverse, weights=value)
+        merged_ids = np.full(len(keys), -1, dtype=np.int64)
+        merged_ids[inverse] = ids
+        merged_ids[total > 1] = -1
+        return merged_x, merged_y, total, merged_value, merged_ids
+
+    def level(self, zoom):
+        zoom = int(zoom)
+        if zoom > self.max_zoom:
+            return self.points
+        return self.levels[max(zoom, self.min_zoom)]
+
+    def query(self, zoom, west, south, east, north, limit=5000):
+        # Clusters inside the viewport as (lat, lon, count, value, id) arrays
+        level = self.level(zoom)
+        # Pad by one cluster radius: a cluster centred just outside the
+        # viewport still covers part of it
+        pad = self.radius_px / (TILE_SIZE * 2 ** min(int(zoom), self.max_zoom + 1))
+        x_ranges = [(x_min - pad, x_max + pad) for x_min, x_max in self._x_ranges(west, east)]
+        y_max, y_min = project([south, north], [0, 0])[1]
+        rows = level.query(x_ranges, y_min - pad, y_max + pad)
+
+        if len(rows) > limit:
+            # Keep the largest clusters when the viewport is overfull
+            rows = rows[np.argsort(-level.count[rows], kind="stable")[:limit]]
+
+        lat, lon = unproject(level.x[rows], level.y[rows])
+        return lat, lon, level.count[rows], level.value[rows], level.ids[rows]
+
+    def _x_ranges(self, west, east):
+        if east - west >= 360:
+            return [(0.0, 1.0)]
+        west = (west + 180) % 360 - 180
+        east = (east + 180) % 360 - 180
+        x_west, x_east = (np.array([west, east]) + 180.0) / 360.0
+        if x_west <= x_east:
+            return [(x_west, x_east)]
+        # Viewport crosses the antimeridian
+        return [(x_west, 1.0), (0.0, x_east)]
@@ -0,0 +1,152 @@
+import os
+import sys
+import json
+import unicodedata
+import pandas as pd
+from data_loader import DATA_FILE, file_hash
+
+# Offline batch geocoding of (City, Country) pairs. Pairs are resolved
+# against a local gazetteer CSV (City, Country, Latitude, Longitude and an
+# optional "Alternate Names" column, comma separated), each distinct pair
+# at most once per batch, and every answer is kept in an on-disk cache so a
+# refreshed dataset only looks up cities it has never seen.
+#
+#   python geocoding.py new_startups.csv geocoded.csv
+#   python geocoding.py --seed-gazetteer startups_with_coordinates.csv
+
+GAZETTEER_FILE = 'gazetteer.csv'
+GEOCODE_CACHE_FILE = 'geocode_cache.json'
+COORDINATES = ['Latitude', 'Longitude']
+
+
+def place_key(city, country):
+    # "São Paulo ", "Brazil" -> "sao paulo|brazil"
+    def normalize(name):
+        name = unicodedata.normalize('NFKD', str(name))
+        name = ''.join(c for c in name if not unicodedata.combining(c))
+        return ' '.join(name.casefold().split())
+    return normalize(city) + '|' + normalize(country)
+
+
+class Gazetteer:
+    def __init__(self, path=GAZETTEER_FILE):
+        self.path = path
+        self.version = file_hash(path)
+        places = pd.read_csv(path)
+        self.coordinates = {}
+        for city, country, lat, lon, aliases in zip(
+            places['City'], places['Country'], places['Latitude'], places['Longitude'],
+            places['Alternate Names'] if 'Alternate Names' in places else [''] * len(places)
+        ):
+            aliases = '' if pd.isna(aliases) else str(aliases)
+            names = [city] + [alias for alias in aliases.split(',') if alias.strip()]
+            for name in names:
+                # First entry wins, so list the main city before namesakes
+                self.coordinates.setdefault(place_key(name, country), (float(lat), float(lon)))
+
+    def lookup(self, key):
+        return self.coordinates.get(key)
+
+
+class GeocodeCache:
+    # {"gazetteer": sha1, "places": {key: [lat, lon] | null}}
+    def __init__(self, path=GEOCODE_CACHE_FILE):
+        self.path = path
+        self.places = {}
+        self.gazetteer = None
+        self.dirty = False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            self.places = stored['places']
+            self.gazetteer = stored.get('gazetteer')
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def sync(self, gazetteer_version):
+        # Misses are only final for the gazetteer that produced them
+        if self.gazetteer != gazetteer_version:
+            self.places = {key: value for key, value in self.places.items() if value is not None}
+            self.gazetteer = gazetteer_version
+            self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'gazetteer': self.gazetteer, 'places': self.places}, f)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+
+class Geocoder:
+    def __init__(self, gazetteer_path=GAZETTEER_FILE, cache_path=GEOCODE_CACHE_FILE):
+        self.gazetteer_path = gazetteer_path
+        self.gazetteer = None
+        self.cache = GeocodeCache(cache_path)
+        self.stats = {'pairs': 0, 'cached': 0, 'resolved': 0, 'unresolved': 0}
+
+    def resolve(self, keys):
+        # keys: distinct place keys -> {key: (lat, lon) | None}
+        keys = set(keys)
+        # Cached misses count as missing until checked against the gazetteer
+        missing = [key for key in keys if self.cache.places.get(key) is None]
+        if missing:
+            # The gazetteer is only read when something is not resolved yet
+            if self.gazetteer is None:
+                self.gazetteer = Gazetteer(self.gazetteer_path)
+            self.cache.sync(self.gazetteer.version)
+            missing = [key for key in keys if key not in self.cache.places]
+
+        for key in missing:
+            found = self.gazetteer.lookup(key)
+            self.cache.places[key] = list(found) if found else None
+            self.stats['resolved' if found else 'unresolved'] += 1
+        self.cache.dirty |= bool(missing)
+        self.stats['pairs'] += len(keys)
+        self.stats['cached'] += len(keys) - len(missing)
+        return {key: self.cache.places[key] for key in keys}
+
+    def geocode(self, dataset, overwrite=False):
+        # Fills Latitude/Longitude of the rows that lack them (all rows when
+        # overwrite) and returns the frame; unresolved places stay NaN
+        dataset = dataset.copy()
+        for column in COORDINATES:
+            if column not in dataset:
+                dataset[column] = float('nan')
+        todo = dataset[COORDINATES].isna().any(axis=1) if not overwrite else pd.Series(True, index=dataset.index)
+        if not todo.any():
+            return dataset
+
+        pairs = dataset.loc[todo, ['City', 'Country']].drop_duplicates()
+        keys = [place_key(city, country) for city, country in zip(pairs['City'], pairs['Country'])]
+        found = self.resolve(keys)
+        pairs['Latitude'] = [found[key][0] if found[key] else float('nan') for key in keys]
+        pairs['Longitude'] = [found[key][1] if found[key] else float('nan') for key in keys]
+
+        rows = dataset.loc[todo, ['City', 'Country']].merge(pairs, on=['City', 'Country'], how='left')
+        dataset.loc[todo, COORDINATES] = rows[COORDINATES].to_numpy()
+        self.cache.save()
+        return dataset
+
+
+def seed_gazetteer(csv_path=DATA_FILE, gazetteer_path=GAZETTEER_FILE):
+    # Builds a gazetteer from an already geocoded dataset: one row per city
+    dataset = pd.read_csv(csv_path).dropna(subset=COORDINATES)
+    places = dataset.groupby(['City', 'Country'], as_index=False)[COORDINATES].median()
+    places.to_csv(gazetteer_path, index=False)
+    return len(places)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == '--seed-gazetteer':
+        print(f"{seed_gazetteer(sys.argv[2])} places written to {GAZETTEER_FILE}")
+    elif len(sys.argv) == 3:
+        geocoder = Geocoder()
+        geocoded = geocoder.geocode(pd.read_csv(sys.argv[1]))
+        geocoded.to_csv(sys.argv[2], index=False)
+        missing = geocoded[COORDINATES].isna().any(axis=1).sum()
+        print(f"Geocoded {len(geocoded)} rows ({missing} without coordinates):", geocoder.stats)
+    else:
+        print("usage: python geocoding.py INPUT.csv OUTPUT.csv | --seed-gazetteer GEOCODED.csv")
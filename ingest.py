@@ -0,0 +1,193 @@
+import os
+import sys
+import glob
+import hashlib
+import pandas as pd
+from data_loader import DATA_FILE, align_dtypes, file_hash, load_startups
+
+# Incremental ingestion: new or updated startups arrive as small CSV delta
+# files keyed on Company. Each accepted delta is validated and appended to
+# <base>.deltas/ next to the dataset CSV as a numbered file, never edited
+# afterwards. Readers merge the deltas over the base CSV in order (the last
+# row for a company wins); compact() folds them back into the CSV.
+#
+#   python ingest.py new_startups.csv     # validate and append a delta
+#   python ingest.py --compact            # rewrite the CSV, clear deltas
+
+KEY = 'Company'
+REQUIRED_COLUMNS = ['Company', 'Valuation ($B)', 'Country', 'City', 'Industry']
+DELTA_COLUMNS = REQUIRED_COLUMNS + ['Select Investors', 'Latitude', 'Longitude']
+
+
+def delta_dir(csv_path=DATA_FILE):
+    base, _ = os.path.splitext(csv_path)
+    return base + '.deltas'
+
+
+def delta_files(csv_path=DATA_FILE):
+    return sorted(glob.glob(os.path.join(delta_dir(csv_path), '*.csv')))
+
+
+def next_delta_number(csv_path=DATA_FILE):
+    # After the highest number used by a delta or a delta's quarantine file:
+    # compact() removes the deltas, not their quarantine files, so numbers
+    # are never reused while rejected rows are kept under them
+    from validation import quarantine_path
+    quarantined = glob.glob(os.path.join(os.path.dirname(quarantine_path(csv_path)), '*.csv'))
+    names = [os.path.basename(path).split('.')[0] for path in delta_files(csv_path) + quarantined]
+    return max([int(name) for name in names if name.isdigit()], default=0) + 1
+
+
+def delta_version(version, paths):
+    # Identifies base + deltas, chained one delta at a time so merging a
+    # new delta in memory gives the version a fresh load would
+    for path in paths:
+        version = hashlib.sha1((version + file_hash(path)).encode('utf-8')).hexdigest()
+    return version
+
+
+def validate_delta(delta, geocoder=None):
+    # Cleans a delta like the preprocessing pipeline and checks its rows like
+    # the loader; returns (accepted rows, rejected rows with their reasons).
+    # Raises ValueError when required columns are missing
+    from preprocess import clean_valuation
+    from geocoding import Geocoder
+    from validation import validate
+
+    missing = [column for column in REQUIRED_COLUMNS if column not in delta]
+    if missing:
+        raise ValueError(f"delta is missing columns: {', '.join(missing)}")
+    delta = delta[[column for column in DELTA_COLUMNS if column in delta]].reset_index(drop=True)
+    delta = delta.assign(**{'Valuation ($B)': clean_valuation(delta['Valuation ($B)'])})
+    delta = (geocoder or Geocoder()).geocode(delta)
+    delta, rejected = validate(delta)
+    return delta.drop_duplicates(KEY, keep='last').reset_index(drop=True), rejected
+
+
+def append_delta(delta, csv_path=DATA_FILE, geocoder=None):
+    # Validates and stores a delta; returns (path, accepted rows). Rejected
+    # rows go to the quarantine file named after the delta
+    from validation import quarantine_path, write_quarantine
+
+    delta, rejected = validate_delta(delta, geocoder)
+    directory = delta_dir(csv_path)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{next_delta_number(csv_path):06d}.csv")
+    delta.to_csv(path + '.tmp', index=False)
+    os.replace(path + '.tmp', path)
+    quarantined = write_quarantine(rejected, quarantine_path(csv_path, path))
+    if quarantined:
+        print(f"{len(rejected)} invalid rows moved to {quarantined}")
+    return path, delta
+
+
+def assign_indice(delta, dataset):
+    # Updated companies keep their indice, new ones are numbered after the rest
+    if 'indice' not in dataset:
+        return delta
+    known = dataset.drop_duplicates(KEY).set_index(KEY)['indice']
+    indice = delta[KEY].map(known)
+    new = indice.isna()
+    start = int(dataset['indice'].max()) + 1 if len(dataset) else 0
+    indice[new] = range(start, start + int(new.sum()))
+    return delta.assign(indice=indice.astype('int64'))
+
+
+def merge_delta(dataset, delta):
+    # Merge on read: replaced rows are dropped, delta rows appended
+    delta = assign_indice(delta, dataset)
+    kept = dataset[~dataset[KEY].isin(delta[KEY])]
+    kept, delta = align_dtypes(kept, delta)
+    return pd.concat([kept, delta], ignore_index=True)
+
+
+def read_delta(path, csv_path=DATA_FILE):
+    # A stored delta, checked again like the base CSV: the file may have
+    # been edited or dropped in by hand. Rows failing now are quarantined
+    # under <number>.merge.csv, apart from those rejected when appended
+    from validation import quarantine_path, validate, write_quarantine
+
+    try:
+        delta, rejected = validate(pd.read_csv(path))
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}")
+    name = os.path.splitext(os.path.basename(path))[0] + '.merge.csv'
+    try:
+        quarantined = write_quarantine(rejected, quarantine_path(csv_path, name))
+    except OSError as e:
+        print("Could not write quarantine file:", e)
+    else:
+        if quarantined:
+            print(f"{len(rejected)} invalid rows moved to {quarantined}")
+    return delta
+
+
+def merge_deltas(dataset, paths, csv_path=DATA_FILE):
+    # One delta at a time, in order, exactly as they were ingested
+    for path in paths:
+        dataset = merge_delta(dataset, read_delta(path, csv_path))
+    return dataset
+
+
+def load_with_deltas(csv_path=DATA_FILE, paths=None):
+    # load_startups() with the pending deltas (or the given ones) merged in
+    dataset, version = load_startups(csv_path)
+    paths = delta_files(csv_path) if paths is None else paths
+    return merge_deltas(dataset, paths, csv_path), delta_version(version, paths)
+
+
+def file_stamps(paths):
+    # (path, size, mtime) of each file; raises OSError for a missing one
+    stamps = []
+    for path in paths:
+        stat = os.stat(path)
+        stamps.append((path, stat.st_size, stat.st_mtime_ns))
+    return tuple(stamps)
+
+
+def source_stamp(csv_path=DATA_FILE):
+    # Changes whenever the CSV or its deltas change; cheap enough to poll
+    try:
+        return file_stamps([csv_path] + delta_files(csv_path))
+    except OSError:
+        return None
+
+
+def diff_datasets(old, new, columns=None):
+    # Companies added, removed and changed between two loads of the data
+    columns = columns or [column for column in DELTA_COLUMNS if column in old and column in new]
+    old_rows = pd.Series(pd.util.hash_pandas_object(old[columns], index=False).to_numpy(), index=old[KEY])
+    new_rows = pd.Series(pd.util.hash_pandas_object(new[columns], index=False).to_numpy(), index=new[KEY])
+    old_rows = old_rows[~old_rows.index.duplicated(keep='last')]
+    new_rows = new_rows[~new_rows.index.duplicated(keep='last')]
+    common = old_rows.index.intersection(new_rows.index)
+    return {
+        'added': new_rows.index.difference(old_rows.index).tolist(),
+        'removed': old_rows.index.difference(new_rows.index).tolist(),
+        'changed': common[old_rows[common].to_numpy() != new_rows[common].to_numpy()].tolist(),
+    }
+
+
+def compact(csv_path=DATA_FILE):
+    # Writes base + deltas as the new CSV and removes the merged deltas.
+    # The CSV is read whole, not through the loader's schema, so columns
+    # the app does not load (indice) are kept
+    paths = delta_files(csv_path)
+    if not paths:
+        return 0
+    dataset = merge_deltas(pd.read_csv(csv_path), paths, csv_path)
+    dataset.to_csv(csv_path + '.tmp', index=False)
+    os.replace(csv_path + '.tmp', csv_path)
+    for path in paths:
+        os.remove(path)
+    return len(paths)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ['--compact']:
+        print(f"{compact()} deltas merged into {DATA_FILE}")
+    elif len(sys.argv) == 2:
+        path, delta = append_delta(pd.read_csv(sys.argv[1]))
+        print(f"{len(delta)} startups stored in {path}")
+    else:
+        print("usage: python ingest.py DELTA.csv | --compact")
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+
+class InvestorTable:
+    # Long startup <-> investor table built once from "Select Investors".
+    # The dataset is region-ordered (see RegionIndex), and explode keeps
+    # that order, so each region's investor rows are a contiguous slice too.
+    def __init__(self, dataset, regions):
+        self.regions = regions
+        self.size = len(dataset)
+        investors = _split_investors(dataset)
+
+        self.rows = dataset.index.get_indexer(investors.index)
+        self.table = pd.DataFrame({
+            "Investor": pd.Categorical(investors.to_numpy()),
+            "Valuation ($B)": dataset["Valuation ($B)"].to_numpy()[self.rows],
+        })
+
+    def apply_delta(self, old_positions, dataset):
+        # old_positions: from RegionIndex.upsert (new row -> old row, -1 for
+        # inserted rows). Only inserted rows are split; the investors of
+        # kept rows are renumbered, those of replaced rows dropped (with
+        # their categories, as in a fresh build).
+        moved = np.flatnonzero(old_positions >= 0)
+        new_of_old = np.full(self.size, -1)
+        new_of_old[old_positions[moved]] = moved
+        rows = new_of_old[self.rows]
+        kept = rows >= 0
+
+        investors = _split_investors(dataset.iloc[np.flatnonzero(old_positions < 0)])
+        rows = np.concatenate((rows[kept], dataset.index.get_indexer(investors.index)))
+        names = union_categoricals(
+            [self.table["Investor"].array[kept], pd.Categorical(investors.astype(str))],
+            sort_categories=True,
+        ).remove_unused_categories()
+
+        # Back in dataset order, so regions stay contiguous slices
+        order = np.argsort(rows, kind="stable")
+        self.rows = rows[order]
+        self.size = len(dataset)
+        self.table = pd.DataFrame({
+            "Investor": names[order],
+            "Valuation ($B)": dataset["Valuation ($B)"].to_numpy()[self.rows],
+        })
+
+    def for_region(self, region=None):
+        if region is None:
+            return self.table
+        start, stop = self.regions.bounds(region)
+        first, last = np.searchsorted(self.rows, [start, stop])
+        return self.table.iloc[first:last]
+
+    def top_by_count(self, region=None, n=10):
+        counts = self.for_region(region).groupby("Investor", observed=True).size()
+        return counts.sort_values(ascending=False, kind="stable").head(n)
+
+    def top_by_portfolio(self, region=None, n=8):
+        portfolios = self.for_region(region).groupby("Investor", observed=True)["Valuation ($B)"].sum()
+        return portfolios.sort_values(ascending=False, kind="stable").head(n)
+
+
+def _split_investors(dataset):
+    investors = dataset["Select Investors"].dropna().str.split(",").explode().str.strip()
+    return investors[investors != ""]
@@ -0,0 +1,203 @@
+import numpy as np
+
+# In-app map panel drawn with matplotlib. Every region keeps one persistent
+# scatter whose offsets are replaced by the points inside the (padded)
+# viewport; region toggles only flip visibility. A region with more than
+# MAX_POINTS points in view is drawn as a density hexbin instead, rebuilt
+# only when the viewport changes.
+
+WORLD = (-180.0, 180.0, -90.0, 90.0)
+MAX_POINTS = 5000
+DENSITY_GRIDSIZE = 60
+# Fraction of the view width/height kept on each side, so a drag does not
+# reveal empty space before the next cull
+CULL_PAD = 0.5
+MIN_SPAN = 0.01
+
+REFERENCE_CITIES = {
+    'New York': (-74.006, 40.7128),
+    'San Francisco': (-122.4194, 37.7749),
+    'London': (-0.1278, 51.5074),
+    'Paris': (2.3522, 48.8566),
+    'Beijing': (116.4074, 39.9042),
+    'Shanghai': (121.4737, 31.2304)
+}
+
+
+class RegionLayer:
+    def __init__(self, ax, name, bounds, color, label):
+        self.ax = ax
+        self.name = name
+        self.start, self.stop = bounds
+        self.color = color
+        self.visible = True
+        self.dense = False
+        self.points = ax.scatter([], [], c=color, s=50, alpha=0.6, label=label)
+        self.density = None
+        self.density_view = None
+
+    def update(self, rows, lon, lat, view):
+        # rows: sorted row positions inside the padded view
+        start, stop = np.searchsorted(rows, [self.start, self.stop])
+        rows = rows[start:stop]
+        self.dense = len(rows) > MAX_POINTS
+        if self.dense:
+            self.points.set_offsets(np.empty((0, 2)))
+            if self.density_view != view:
+                self._build_density(lon[rows], lat[rows], view)
+        else:
+            self.points.set_offsets(np.column_stack((lon[rows], lat[rows])))
+        self.set_visible(self.visible)
+        return len(rows)
+
+    def _build_density(self, lon, lat, view):
+        if self.density is not None:
+            self.density.remove()
+        self.density = self.ax.hexbin(
+            lon, lat, gridsize=DENSITY_GRIDSIZE, extent=view, bins="log",
+            mincnt=1, cmap=_region_cmap(self.color), linewidths=0, alpha=0.7, zorder=1
+        )
+        self.density_view = view
+
+    def set_visible(self, visible):
+        self.visible = visible
+        self.points.set_visible(visible and not self.dense)
+        if self.density is not None:
+            self.density.set_visible(visible and self.dense)
+
+
+def _region_cmap(color):
+    from matplotlib.colors import LinearSegmentedColormap
+    return LinearSegmentedColormap.from_list(color, ["#ffffff", color])
+
+
+class MapCanvas:
+    def __init__(self, ax, data, region_colors, labels=None):
+        self.ax = ax
+        self.layers = {}
+        self.bind(data)
+        self.view = None
+        self.drag = None
+        labels = labels or {}
+
+        ax.set_xlim(WORLD[:2])
+        ax.set_ylim(WORLD[2:])
+        ax.grid(True, linestyle='--', alpha=0.3)
+        ax.set_title('Global Startup Distribution')
+        ax.set_xlabel('Longitude')
+        ax.set_ylabel('Latitude')
+
+        self.layers = {
+            name: RegionLayer(ax, name, data.regions.bounds(name), color, labels.get(name, name))
+            for name, color in region_colors.items()
+        }
+
+        # Add major cities for reference
+        for city, coords in REFERENCE_CITIES.items():
+            ax.plot(coords[0], coords[1], 'k.', markersize=5)
+            ax.annotate(city, coords, xytext=(5, 5), textcoords='offset points', fontsize=8)
+        ax.legend(loc="lower left")
+
+        self.update_view()
+
+    def bind(self, data):
+        # Point arrays and index of the data shown; region bounds follow it
+        self.spatial = data.spatial
+        self.lon = data.dataset["Longitude"].to_numpy(dtype=float)
+        self.lat = data.dataset["Latitude"].to_numpy(dtype=float)
+        for name, layer in self.layers.items():
+            layer.start, layer.stop = data.regions.bounds(name)
+
+    def update_view(self):
+        # Re-cull only when the visible area leaves the padded area last culled
+        x_min, x_max = self.ax.get_xlim()
+        y_min, y_max = self.ax.get_ylim()
+        if self.view is not None:
+            west, east, south, north = self.view
+            inside = west <= x_min and x_max <= east and south <= y_min and y_max <= north
+            # Hexbins are sized to the view they were built for, points are not
+            if inside and not any(layer.dense for layer in self.layers.values()):
+                return False
+        pad_x = (x_max - x_min) * CULL_PAD
+        pad_y = (y_max - y_min) * CULL_PAD
+        view = (
+            max(x_min - pad_x, WORLD[0]), min(x_max + pad_x, WORLD[1]),
+            max(y_min - pad_y, WORLD[2]), min(y_max + pad_y, WORLD[3]),
+        )
+        if view == self.view:
+            return False
+        self.view = view
+        west, east, south, north = view
+        rows = np.sort(self.spatial.bbox(south, west, north, east))
+        for layer in self.layers.values():
+            layer.update(rows, self.lon, self.lat, view)
+        return True
+
+    def set_region_visible(self, name, visible):
+        self.layers[name].set_visible(visible)
+
+    def zoom(self, factor, center=None):
+        x_min, x_max = self.ax.get_xlim()
+        y_min, y_max = self.ax.get_ylim()
+        if center is None:
+            center = ((x_min + x_max) / 2, (y_min + y_max) / 2)
+        cx, cy = center
+        x_span = max((x_max - x_min) / factor, MIN_SPAN)
+        y_span = max((y_max - y_min) / factor, MIN_SPAN)
+        # Keep the point under the cursor fixed
+        x_min = cx - (cx - x_min) / (x_max - x_min) * x_span
+        y_min = cy - (cy - y_min) / (y_max - y_min) * y_span
+        self.set_limits(x_min, x_min + x_span, y_min, y_min + y_span)
+
+    def pan(self, dx, dy):
+        x_min, x_max = self.ax.get_xlim()
+        y_min, y_max = self.ax.get_ylim()
+        self.set_limits(x_min + dx, x_max + dx, y_min + dy, y_max + dy)
+
+    def set_limits(self, x_min, x_max, y_min, y_max):
+        # Clamp to the world, never wider than it
+        x_span = min(x_max - x_min, WORLD[1] - WORLD[0])
+        y_span = min(y_max - y_min, WORLD[3] - WORLD[2])
+        x_min = min(max(x_min, WORLD[0]), WORLD[1] - x_span)
+        y_min = min(max(y_min, WORLD[2]), WORLD[3] - y_span)
+        self.ax.set_xlim(x_min, x_min + x_span)
+        self.ax.set_ylim(y_min, y_min + y_span)
+
+    def connect(self, canvas):
+        # Mouse wheel zooms around the cursor, left drag pans
+        self.canvas = canvas
+        canvas.mpl_connect("scroll_event", self.on_scroll)
+        canvas.mpl_connect("button_press_event", self.on_press)
+        canvas.mpl_connect("motion_notify_event", self.on_motion)
+        canvas.mpl_connect("button_release_event", self.on_release)
+
+    def redraw(self):
+        self.update_view()
+        self.canvas.draw_idle()
+
+    def on_scroll(self, event):
+        if event.inaxes is not self.ax:
+            return
+        self.zoom(1.2 if event.button == "up" else 1 / 1.2, (event.xdata, event.ydata))
+        self.redraw()
+
+    def on_press(self, event):
+        if event.inaxes is self.ax and event.button == 1:
+            self.drag = (event.x, event.y)
+
+    def on_motion(self, event):
+        if self.drag is None:
+            return
+        # Screen pixels to data units of the current view
+        inverse = self.ax.transData.inverted()
+        x0, y0 = inverse.transform(self.drag)
+        x1, y1 = inverse.transform((event.x, event.y))
+        self.drag = (event.x, event.y)
+        self.pan(x0 - x1, y0 - y1)
+        # Points are already culled with padding, so dragging only repaints
+        self.canvas.draw_idle()
+
+    def on_release(self, event):
+        if self.drag is not None:
+            self.drag = None
+            self.redraw()
@@ -0,0 +1,126 @@
+import os
+import json
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+# Local HTTP server for the map: serves the generated files from map_dir and
+# answers viewport queries from in-memory indexes, so the page only ever
+# receives what is visible.
+#
+#   GET /clusters?region=USA&z=4&west=..&south=..&east=..&north=..
+#   GET /nearby?lat=52.52&lon=13.40&km=50
+#
+# Other endpoints (e.g. tiles) are registered with add_endpoint.
+
+
+class MapRequestHandler(SimpleHTTPRequestHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        endpoint = self.server.endpoints.get(url.path.strip("/"))
+        if endpoint is None:
+            return super().do_GET()
+
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        try:
+            status, body = 200, endpoint(params)
+        except (KeyError, ValueError) as e:
+            status, body = 400, {"error": str(e)}
+
+        payload = json.dumps(body, separators=(",", ":")).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MapServer:
+    def __init__(self, map_dir, host="127.0.0.1", port=0):
+        self.httpd = ThreadingHTTPServer((host, port), MapRequestHandler)
+        self.httpd.daemon_threads = True
+        self.set_root(map_dir)
+        self.httpd.endpoints = {}
+        self.thread = None
+        self.cluster_indexes = {}
+        self.spatial = None
+        self.add_endpoint("clusters", self.clusters)
+        self.add_endpoint("nearby", self.nearby)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def set_root(self, map_dir):
+        # Directory whose files are served; requests already being handled
+        # finish with the previous one
+        os.makedirs(map_dir, exist_ok=True)
+        self.map_dir = os.path.abspath(map_dir)
+        self.httpd.RequestHandlerClass = partial(MapRequestHandler, directory=self.map_dir)
+
+    def add_endpoint(self, name, handler):
+        # handler(params) -> JSON-serializable body
+        self.httpd.endpoints[name] = handler
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+            self.thread.start()
+        return self.url
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread = None
+
+    def set_clusters(self, clusters):
+        # {region: (index, data)}, index: geo_cluster.ClusterIndex whose ids
+        # are row positions in data. Swapped in one assignment, so requests
+        # being served see either the old or the new regions
+        self.cluster_indexes = dict(clusters)
+
+    def set_spatial(self, index, data):
+        # index: spatial_index.SpatialIndex whose ids are row positions in data
+        self.spatial = (index, data)
+
+    def nearby(self, params):
+        # {"count": n, "startups": [[company, city, valuation, km], ...]}
+        if self.spatial is None:
+            raise KeyError("no spatial index loaded")
+        index, data = self.spatial
+        ids, distances = index.radius(float(params["lat"]), float(params["lon"]), float(params["km"]))
+        limit = int(params.get("limit", 10))
+        rows = data.iloc[ids[:limit]]
+        startups = [
+            [str(company), str(city), round(float(valuation), 2), round(float(km), 1)]
+            for company, city, valuation, km in zip(
+                rows["Company"], rows["City"], rows["Valuation ($B)"], distances[:limit]
+            )
+        ]
+        return {"count": int(len(ids)), "startups": startups}
+
+    def clusters(self, params):
+        index, data = self.cluster_indexes[params["region"]]
+        lat, lon, count, value, ids = index.query(
+            int(params["z"]),
+            float(params["west"]), float(params["south"]),
+            float(params["east"]), float(params["north"]),
+        )
+
+        # Clusters: [lat, lon, count, total valuation]
+        # Single startups: [lat, lon, 1, valuation, company, city, country]
+        single = ids >= 0
+        rows = data.iloc[ids[single]]
+        details = iter(zip(rows["Company"], rows["City"], rows["Country"]))
+        items = []
+        for i in range(len(lat)):
+            item = [round(float(lat[i]), 6), round(float(lon[i]), 6), int(count[i]), round(float(value[i]), 2)]
+            if single[i]:
+                item.extend(str(field) for field in next(details))
+            items.append(item)
+        return items
@@ -0,0 +1,127 @@
+import os
+import argparse
+import pandas as pd
+from data_loader import DATA_FILE, load_startups
+
+# Cleaning of the raw "Startups in 2021" export, as done by hand in
+# pretraitement_donnees.ipynb, as a chain of generator stages over CSV
+# chunks: memory stays flat whatever the size of the raw file.
+#
+#   python preprocess.py "Startups in 2021.csv" -o startups_with_coordinates.csv
+#
+# Stages: keep China/US/European rows -> drop incomplete rows -> parse
+# Valuation ($B) -> drop Date Joined -> geocode (City, Country) -> write.
+
+CHUNK_SIZE = 100_000
+
+# Countries kept by the notebook
+EUROPEAN_FILTER = [
+    "Sweden", "Germany", "France", "United Kingdom", "Italy", "Spain",
+    "Netherlands", "Poland", "Belgium", "Denmark", "Finland", "Austria",
+    "Norway", "Ireland", "Portugal", "Czech Republic", "Greece", "Hungary",
+    "Switzerland", "Slovakia", "Slovenia", "Luxembourg", "Iceland", "Estonia",
+    "Latvia", "Lithuania", "Malta", "Romania", "Bulgaria", "Croatia"
+]
+KEPT_COUNTRIES = ["China", "United States"] + EUROPEAN_FILTER
+
+DROPPED_COLUMNS = ["Date Joined"]
+OUTPUT_COLUMNS = [
+    "indice", "Company", "Valuation ($B)", "Country", "City", "Industry",
+    "Select Investors", "Latitude", "Longitude"
+]
+
+
+def read_chunks(path, chunksize=CHUNK_SIZE):
+    # Numbers each raw row: "indice" is the row's position in the raw file
+    start = 0
+    for chunk in pd.read_csv(path, chunksize=chunksize, dtype=str, keep_default_na=True):
+        chunk.index = pd.RangeIndex(start, start + len(chunk), name="indice")
+        start += len(chunk)
+        yield chunk
+
+
+def filter_countries(chunks, countries=KEPT_COUNTRIES):
+    for chunk in chunks:
+        yield chunk[chunk["Country"].str.strip().isin(countries)]
+
+
+def drop_incomplete(chunks, columns=None):
+    # Like the notebook's dropna(), but blind to columns it drops later
+    for chunk in chunks:
+        subset = columns or [column for column in chunk.columns if column not in DROPPED_COLUMNS]
+        yield chunk.dropna(subset=subset)
+
+
+def clean_valuation(values):
+    # "$140,000" -> "140000"; missing values stay missing
+    return values.astype(str).str.replace("$", "", regex=False).str.replace(",", "", regex=False)
+
+
+def parse_valuation(chunks):
+    # "$140,000" -> 140000.0; unparsable values become NaN and are dropped
+    for chunk in chunks:
+        valuation = clean_valuation(chunk["Valuation ($B)"])
+        chunk = chunk.assign(**{"Valuation ($B)": pd.to_numeric(valuation, errors="coerce").astype("float64")})
+        yield chunk.dropna(subset=["Valuation ($B)"])
+
+
+def drop_columns(chunks, columns=DROPPED_COLUMNS):
+    for chunk in chunks:
+        yield chunk.drop(columns=[column for column in columns if column in chunk])
+
+
+def geocode(chunks, geocoder, stats):
+    # Rows whose place is not in the gazetteer are dropped and counted
+    for chunk in chunks:
+        # Coordinates already in the feed are kept, the rest are looked up
+        for column in ["Latitude", "Longitude"]:
+            if column in chunk:
+                chunk = chunk.assign(**{column: pd.to_numeric(chunk[column], errors="coerce")})
+        chunk = geocoder.geocode(chunk)
+        located = chunk["Latitude"].notna() & chunk["Longitude"].notna()
+        stats["unlocated"] += int((~located).sum())
+        yield chunk[located]
+
+
+def write_csv(chunks, output_path, stats):
+    # Written beside the target and moved into place once complete
+    tmp_path = output_path + ".tmp"
+    header = True
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+        for chunk in chunks:
+            chunk = chunk.reset_index()
+            chunk[[column for column in OUTPUT_COLUMNS if column in chunk]].to_csv(f, header=header, index=False)
+            header = False
+            stats["rows"] += len(chunk)
+    os.replace(tmp_path, output_path)
+
+
+def run_pipeline(raw_path, output_path=DATA_FILE, chunksize=CHUNK_SIZE, geocoder=None, build_cache=False):
+    # Returns {"rows": rows written, "unlocated": rows without coordinates}
+    from geocoding import Geocoder
+
+    stats = {"rows": 0, "unlocated": 0}
+    chunks = read_chunks(raw_path, chunksize)
+    chunks = filter_countries(chunks)
+    chunks = drop_incomplete(chunks)
+    chunks = parse_valuation(chunks)
+    chunks = drop_columns(chunks)
+    chunks = geocode(chunks, geocoder or Geocoder(), stats)
+    write_csv(chunks, output_path, stats)
+
+    if build_cache:
+        # Prime the binary cache so the dashboard starts from it
+        load_startups(output_path)
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Clean the raw startups export in chunks")
+    parser.add_argument("raw", help="raw CSV export (Startups in 2021.csv)")
+    parser.add_argument("-o", "--output", default=DATA_FILE)
+    parser.add_argument("--chunksize", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--cache", action="store_true", help="also build the binary data cache")
+    args = parser.parse_args()
+
+    stats = run_pipeline(args.raw, args.output, args.chunksize, build_cache=args.cache)
+    print(f"{stats['rows']} rows written to {args.output} ({stats['unlocated']} dropped without coordinates)")
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+from data_loader import align_dtypes
+
+EUROPEAN_COUNTRIES = [
+    "Sweden", "United Kingdom", "Germany", "Netherlands", "Belgium", "Lithuania",
+    "Estonia", "France", "Austria", "Ireland", "Switzerland", "Spain",
+    "Luxembourg", "Finland", "Denmark", "Norway", "Czech Republic", "Croatia"
+]
+
+# Region name -> member countries. A country belongs to at most one region.
+REGIONS = {
+    "USA": ["United States"],
+    "China": ["China"],
+    "Europe": EUROPEAN_COUNTRIES,
+}
+
+
+class RegionIndex:
+    # Tags every row with a categorical Region once, then keeps the frame
+    # ordered by region so each region is a contiguous block. Region frames
+    # are iloc slices of that block (views, not boolean-mask copies).
+    def __init__(self, dataset, regions=None):
+        self.regions = {name: list(countries) for name, countries in (regions or REGIONS).items()}
+        self.dataset = self._assign(dataset)
+
+    def _tag(self, dataset):
+        country_to_region = {
+            country: name for name, countries in self.regions.items() for country in countries
+        }
+        return pd.Categorical(
+            dataset["Country"].map(country_to_region),
+            categories=list(self.regions),
+        )
+
+    def _assign(self, dataset):
+        region = self._tag(dataset)
+        dataset = dataset.assign(Region=region)
+        return dataset.iloc[self._order(region.codes)].reset_index(drop=True)
+
+    def _order(self, codes):
+        # Stable sort keeps the original row order inside each region;
+        # rows outside every region (code -1) go to the end
+        codes = np.asarray(codes)
+        sort_codes = np.where(codes < 0, len(self.regions), codes)
+        order = np.argsort(sort_codes, kind="stable")
+
+        counts = np.bincount(sort_codes, minlength=len(self.regions) + 1)
+        bounds = np.concatenate(([0], np.cumsum(counts)))
+        self._bounds = {
+            name: (int(bounds[i]), int(bounds[i + 1])) for i, name in enumerate(self.regions)
+        }
+        return order
+
+    def add_region(self, name, countries):
+        # Re-tags and re-orders the frame once; no per-region copy is kept
+        self.regions[name] = list(countries)
+        self.dataset = self._assign(self.dataset.drop(columns="Region"))
+        return self.dataset
+
+    def upsert(self, rows, key="Company"):
+        # Replaces the rows whose key is in rows and appends the others; only
+        # the new rows are tagged. Each region's new rows go to the end of
+        # its block. Returns old_positions (new row -> old row, -1 for rows
+        # from `rows`) and the old positions of the replaced rows.
+        rows = rows.assign(Region=self._tag(rows))
+
+        replaced = np.flatnonzero(self.dataset[key].isin(rows[key]).to_numpy())
+        kept = np.setdiff1d(np.arange(len(self.dataset)), replaced, assume_unique=True)
+        kept_rows, rows = align_dtypes(self.dataset.iloc[kept], rows)
+        combined = pd.concat([kept_rows, rows], ignore_index=True)
+
+        # Kept rows are already in region order, so the stable sort only
+        # moves the new rows into place
+        order = self._order(combined["Region"].cat.codes)
+        self.dataset = combined.iloc[order].reset_index(drop=True)
+        old_positions = np.concatenate((kept, np.full(len(rows), -1)))[order]
+        return old_positions, replaced
+
+    def names(self):
+        return list(self.regions)
+
+    def bounds(self, name):
+        return self._bounds[name]
+
+    def view(self, name):
+        start, stop = self._bounds[name]
+        return self.dataset.iloc[start:stop]
+
+    def sizes(self):
+        return {name: stop - start for name, (start, stop) in self._bounds.items()}
@@ -0,0 +1,108 @@
+import numpy as np
+
+# Spatial index over startup coordinates: points are bucketed in a regular
+# lat/lon grid and stored sorted by cell, so the points of a run of cells in
+# one grid row are a single contiguous slice. Queries gather the candidate
+# slices and filter them exactly (great-circle distance for radius/k-NN).
+# Results are row positions in the indexed frame.
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class SpatialIndex:
+    def __init__(self, lat, lon, cell_deg=0.5):
+        lat = np.asarray(lat, dtype=float)
+        lon = np.asarray(lon, dtype=float)
+        valid = np.isfinite(lat) & np.isfinite(lon)
+
+        self.cell_deg = cell_deg
+        self.n_rows = int(np.ceil(180 / cell_deg))
+        self.n_cols = int(np.ceil(360 / cell_deg))
+
+        ids = np.flatnonzero(valid)
+        cells = self._row(lat[valid]) * self.n_cols + self._col(lon[valid])
+        order = np.argsort(cells, kind="stable")
+        self.ids = ids[order]
+        self.lat = lat[valid][order]
+        self.lon = lon[valid][order]
+        # offsets[c]:offsets[c + 1] are the points of cell c
+        self.offsets = np.searchsorted(cells[order], np.arange(self.n_rows * self.n_cols + 1))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _row(self, lat):
+        return np.clip(((np.asarray(lat) + 90) // self.cell_deg).astype(np.int64), 0, self.n_rows - 1)
+
+    def _col(self, lon):
+        return np.clip(((np.asarray(lon) + 180) // self.cell_deg).astype(np.int64), 0, self.n_cols - 1)
+
+    def _lon_ranges(self, west, east):
+        if east - west >= 360:
+            return [(-180.0, 180.0)]
+        west = (west + 180) % 360 - 180
+        east = (east + 180) % 360 - 180
+        if west <= east:
+            return [(west, east)]
+        # Crosses the antimeridian
+        return [(west, 180.0), (-180.0, east)]
+
+    def _candidates(self, south, west, north, east):
+        first_row, last_row = self._row([south, north])
+        slices = []
+        for low, high in self._lon_ranges(west, east):
+            first_col, last_col = self._col([low, high])
+            for row in range(first_row, last_row + 1):
+                start = self.offsets[row * self.n_cols + first_col]
+                stop = self.offsets[row * self.n_cols + last_col + 1]
+                if stop > start:
+                    slices.append(np.arange(start, stop))
+        return np.concatenate(slices) if slices else np.array([], dtype=np.int64)
+
+    def bbox(self, south, west, north, east):
+        candidates = self._candidates(south, west, north, east)
+        lat, lon = self.lat[candidates], self.lon[candidates]
+        inside = (lat >= south) & (lat <= north)
+        ranges = self._lon_ranges(west, east)
+        inside &= np.logical_or.reduce([(lon >= low) & (lon <= high) for low, high in ranges])
+        return self.ids[candidates[inside]]
+
+    def radius(self, lat, lon, km):
+        # Rows within km of (lat, lon) and their distances, nearest first
+        dlat = np.degrees(km / EARTH_RADIUS_KM)
+        south, north = max(lat - dlat, -90.0), min(lat + dlat, 90.0)
+        if south <= -90 or north >= 90:
+            west, east = -180.0, 180.0
+        else:
+            dlon = dlat / max(np.cos(np.radians(max(abs(south), abs(north)))), 1e-12)
+            west, east = (-180.0, 180.0) if dlon >= 180 else (lon - dlon, lon + dlon)
+
+        candidates = self._candidates(south, west, north, east)
+        distances = haversine_km(lat, lon, self.lat[candidates], self.lon[candidates])
+        inside = distances <= km
+        candidates, distances = candidates[inside], distances[inside]
+        order = np.argsort(distances, kind="stable")
+        return self.ids[candidates[order]], distances[order]
+
+    def nearest(self, lat, lon, k=10):
+        # k nearest rows: grow the search radius until it holds k points
+        k = min(k, len(self))
+        if k == 0:
+            return np.array([], dtype=np.int64), np.array([])
+        km = self.cell_deg * 111.0
+        while True:
+            ids, distances = self.radius(lat, lon, km)
+            if len(ids) >= k or km >= np.pi * EARTH_RADIUS_KM:
+                return ids[:k], distances[:k]
+            km *= 2
+
+    def count_within(self, lat, lon, km):
+        # Number of points within km of each (lat, lon) centre
+        return np.array([len(self.radius(a, b, km)[0]) for a, b in zip(lat, lon)])
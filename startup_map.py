@@ -1,60 +1,588 @@
-import webview
+import os
+import re
+import json
+import shutil
+import hashlib
+import multiprocessing
 import pandas as pd
 import folium
-from folium.plugins import MarkerCluster
-
-# Load the dataset
-dataset = pd.read_csv('startups_with_coordinates.csv')
-
-# Define European countries
-european_countries = [
-    "Sweden", "United Kingdom", "Germany", "Netherlands", "Belgium", "Lithuania",
-    "Estonia", "France", "Austria", "Ireland", "Switzerland", "Spain",
-    "Luxembourg", "Finland", "Denmark", "Norway", "Czech Republic", "Croatia"
-]
-
-# Filter datasets by region
-dataset_USA = dataset[dataset["Country"] == "United States"]
-dataset_China = dataset[dataset["Country"] == "China"]
-dataset_EU = dataset[dataset["Country"].isin(european_countries)]
-
-# Function to add Circle Markers within Clusters
-def add_circle_markers_to_cluster(data, color, cluster_obj, radius=5):
-    for _, row in data.iterrows():
-        if pd.notnull(row['Latitude']) and pd.notnull(row['Longitude']):
-            folium.CircleMarker(
-                location=[row['Latitude'], row['Longitude']],
-                radius=radius,
-                color=color,
-                fill=True,
-                fill_color=color,
-                fill_opacity=0.6,
-                popup=folium.Popup(
-                    f"Company: {row['Company']}<br>City: {row['City']}<br>Country: {row['Country']}<br>Valuation ($B): {row['Valuation ($B)']}",
-                    max_width=300
-                )
-            ).add_to(cluster_obj)
-
-# Initialize the map
-startup_map = folium.Map(location=[20, 0], zoom_start=2)
-
-# Initialize Marker Clusters for each region
-marker_cluster_usa = MarkerCluster(name="USA Startups").add_to(startup_map)
-marker_cluster_china = MarkerCluster(name="China Startups").add_to(startup_map)
-marker_cluster_eu = MarkerCluster(name="Europe Startups").add_to(startup_map)
-
-# Add Circle Markers to clusters
-add_circle_markers_to_cluster(dataset_USA, "blue", marker_cluster_usa, radius=7)
-add_circle_markers_to_cluster(dataset_China, "red", marker_cluster_china, radius=7)
-add_circle_markers_to_cluster(dataset_EU, "green", marker_cluster_eu, radius=6)
-
-# Add Layer Control to toggle clusters
-folium.LayerControl().add_to(startup_map)
-
-# Save the map to an HTML file
-map_file = "circle_marker_cluster_map.html"
-startup_map.save(map_file)
-
-# Open the map in a Tkinter window
-webview.create_window("Carte des Startups", map_file)
-webview.start()
\ No newline at end of file
+from folium.plugins import FastMarkerCluster
+from folium.template import Template
+from branca.element import MacroElement
+from data_loader import DATA_FILE
+from ingest import load_with_deltas
+from regions import RegionIndex
+
+# Usage:
+#   map_path = build_map(data)   # data: app.StartupData or MapData
+#   show_map(map_path)           # opens the map in its own process
+#
+# With options={"clustering": "server"} points are clustered in Python and
+# the page asks a local MapServer for the clusters in view; with
+# {"clustering": "tiles"} the page loads pre-written z/x/y tiles as they
+# come into view. Both need HTTP: use show_map(serve_map(data, options=...)).
+# {"density": True} adds a valuation density overlay to any of them.
+
+# Marker style for each region shown on the map
+REGION_STYLES = {
+    "USA": {"name": "USA Startups", "color": "blue", "radius": 7},
+    "China": {"name": "China Startups", "color": "red", "radius": 7},
+    "Europe": {"name": "Europe Startups", "color": "green", "radius": 6},
+}
+
+# Map settings; build_map(options=...) overrides any of them
+DEFAULT_OPTIONS = {
+    "region_styles": REGION_STYLES,
+    "location": [20, 0],
+    "zoom_start": 2,
+    # Directory holding the generated map and the per-region marker payloads
+    "map_dir": "map_cache",
+    # "browser": every point is sent to Leaflet.markercluster
+    # "server": precomputed zoom-level clusters served per viewport
+    # "tiles": the same clusters exported as static z/x/y tiles
+    "clustering": "browser",
+    # Cluster radius in screen pixels for server-side clustering and tiles
+    "cluster_radius": 60,
+    # Deepest tile zoom written; the map over-zooms these tiles beyond it
+    "tile_max_zoom": 14,
+    # Radius of the right-click "startups nearby" query on served maps
+    "nearby_km": 50,
+    # Valuation-weighted density overlay, one image per resolution
+    "density": False,
+}
+
+# Fields sent to the browser for each marker, with their payload column
+MARKER_FIELDS = ['Latitude', 'Longitude', 'Company', 'City', 'Country', 'Valuation ($B)']
+MARKER_COLUMNS = ['lat', 'lon', 'company', 'city', 'country', 'valuation']
+
+# Bump when the payload layout changes so old payload files are not reused
+PAYLOAD_FORMAT = 2
+
+# Names of the files build_map writes in map_dir; nothing else is pruned.
+# Maps are named map_<variant>_<settings key>.html (variant: clustering,
+# plus "_density"); the others are the payloads, tiles and images they use.
+MAP_NAME = re.compile(r"map_(?:([a-z_]+)_)?[0-9a-f]{16}\.html")
+ARTIFACT_NAME = re.compile(r"rows_[0-9a-f]{16}\.js|tiles_[0-9a-f]{16}_\d+_\d+|density_[0-9a-f]{16}\.png")
+
+# One marker factory shared by every region; only the style differs. The
+# payload is columnar and text columns may be dictionary encoded as
+# {values: [...distinct], codes: [...per row]}, read through field();
+# popup text is only assembled when a popup opens.
+MARKER_CALLBACK = """
+function (table, i) {
+    var marker = L.circleMarker(new L.LatLng(table.lat[i], table.lon[i]), {
+        radius: %(radius)d, color: '%(color)s', fill: true,
+        fillColor: '%(color)s', fillOpacity: 0.6
+    });
+    marker.bindPopup(function () {
+        return 'Company: ' + field(table, 'company', i) + '<br>City: ' + field(table, 'city', i) +
+            '<br>Country: ' + field(table, 'country', i) + '<br>Valuation ($B): ' + table.valuation[i];
+    }, {maxWidth: 300});
+    return marker;
+}
+"""
+
+class MapData:
+    # What build_map needs from app.StartupData, for running this module alone
+    def __init__(self, csv_path=DATA_FILE):
+        from spatial_index import SpatialIndex
+        dataset, self.version = load_with_deltas(csv_path)
+        self.regions = RegionIndex(dataset)
+        self.dataset = self.regions.dataset
+        self.spatial = SpatialIndex(self.dataset["Latitude"], self.dataset["Longitude"])
+
+# Cluster reading its rows from a payload script loaded by the page, so the
+# (large) marker data is written once per region version and shared
+class RegionMarkerCluster(FastMarkerCluster):
+    _template = Template(
+        """
+        {% macro script(this, kwargs) %}
+            var {{ this.get_name() }} = (function(){
+                function field(table, name, i) {
+                    var column = table[name];
+                    return column.codes ? column.values[column.codes[i]] : column[i];
+                }
+                {{ this.callback }}
+
+                var table = window.STARTUP_ROWS[{{ this.region|tojson }}] || {lat: []};
+                var cluster = L.markerClusterGroup({{ this.options|tojavascript }});
+
+                for (var i = 0; i < table.lat.length; i++) {
+                    var marker = callback(table, i);
+                    marker.addTo(cluster);
+                }
+
+                cluster.addTo({{ this._parent.get_name() }});
+                return cluster;
+            })();
+        {% endmacro %}"""
+    )
+
+    def __init__(self, region, callback, name=None):
+        super().__init__([], callback=callback, name=name)
+        self.region = region
+
+# Fills each region's layer with the clusters the server returns for the
+# current viewport, refreshed after every pan/zoom
+class ServerClusterLayer(MacroElement):
+    _template = Template(
+        """
+        {% macro script(this, kwargs) %}
+        (function(){
+            var map = {{ this._parent.get_name() }};
+            var layers = {
+            {%- for region, layer in this.layers.items() %}
+                {{ region|tojson }}: {{ layer }},
+            {%- endfor %}
+            };
+            var styles = {{ this.styles|tojson }};
+
+            function draw(layer, style, items) {
+                layer.clearLayers();
+                items.forEach(function (item) {
+                    var count = item[2];
+                    var marker = L.circleMarker([item[0], item[1]], {
+                        radius: count > 1 ? style.radius + 4 * Math.log10(count) + 4 : style.radius,
+                        color: style.color, fill: true,
+                        fillColor: style.color, fillOpacity: count > 1 ? 0.4 : 0.6
+                    });
+                    if (count > 1) {
+                        marker.bindTooltip(String(count), {permanent: true, direction: 'center'});
+                        marker.on('click', function () {
+                            map.setView([item[0], item[1]], map.getZoom() + 2);
+                        });
+                    } else {
+                        marker.bindPopup(
+                            'Company: ' + item[4] + '<br>City: ' + item[5] +
+                            '<br>Country: ' + item[6] + '<br>Valuation ($B): ' + item[3],
+                            {maxWidth: 300}
+                        );
+                    }
+                    marker.addTo(layer);
+                });
+            }
+
+            // Only the latest request per region may redraw it
+            var latest = {};
+
+            function refresh() {
+                var bounds = map.getBounds();
+                Object.keys(layers).forEach(function (region) {
+                    if (!map.hasLayer(layers[region])) { return; }
+                    var query = 'clusters?region=' + encodeURIComponent(region) +
+                        '&z=' + map.getZoom() +
+                        '&west=' + bounds.getWest() + '&south=' + bounds.getSouth() +
+                        '&east=' + bounds.getEast() + '&north=' + bounds.getNorth();
+                    latest[region] = query;
+                    fetch(query)
+                        .then(function (response) { return response.json(); })
+                        .then(function (items) {
+                            if (latest[region] === query) { draw(layers[region], styles[region], items); }
+                        });
+                });
+            }
+
+            map.on('moveend overlayadd', refresh);
+            refresh();
+        })();
+        {% endmacro %}"""
+    )
+
+    def __init__(self, layers, styles):
+        super().__init__()
+        self._name = "ServerClusterLayer"
+        self.layers = layers
+        self.styles = styles
+
+# Loads a region's tiles through a Leaflet GridLayer: a tile is fetched when it
+# comes into view and its markers are dropped when Leaflet unloads it, so the
+# page only holds the visible part of the data
+class TileMarkerLayer(MacroElement):
+    _template = Template(
+        """
+        {% macro script(this, kwargs) %}
+        (function(){
+            var map = {{ this._parent.get_name() }};
+            var group = {{ this.group }};
+            var base = {{ this.base|tojson }};
+            var style = {{ this.style|tojson }};
+            var markers = {};
+            var names = {};
+
+            function key(coords) { return coords.z + '/' + coords.x + '/' + coords.y; }
+
+            function showDetails(marker, feature) {
+                var chunk = Math.floor(feature[4] / {{ this.names_chunk }});
+                var load = names[chunk] || (names[chunk] = fetch(base + 'names/' + chunk + '.json')
+                    .then(function (response) { return response.json(); }));
+                load.then(function (rows) {
+                    var row = rows[feature[4] % {{ this.names_chunk }}];
+                    marker.bindPopup(
+                        'Company: ' + row[0] + '<br>City: ' + row[1] +
+                        '<br>Country: ' + row[2] + '<br>Valuation ($B): ' + feature[3],
+                        {maxWidth: 300}
+                    ).openPopup();
+                });
+            }
+
+            function makeMarker(feature) {
+                var count = feature[2];
+                var marker = L.circleMarker([feature[0], feature[1]], {
+                    radius: count > 1 ? style.radius + 4 * Math.log10(count) + 4 : style.radius,
+                    color: style.color, fill: true,
+                    fillColor: style.color, fillOpacity: count > 1 ? 0.4 : 0.6
+                });
+                if (count > 1) {
+                    marker.bindTooltip(String(count), {permanent: true, direction: 'center'});
+                    marker.on('click', function () {
+                        map.setView([feature[0], feature[1]], map.getZoom() + 2);
+                    });
+                } else {
+                    marker.on('click', function () { showDetails(marker, feature); });
+                }
+                return marker;
+            }
+
+            var Tiles = L.GridLayer.extend({
+                createTile: function (coords, done) {
+                    var tile = document.createElement('div');
+                    fetch(base + key(coords) + '.json')
+                        .then(function (response) { return response.ok ? response.json() : []; })
+                        .then(function (features) {
+                            markers[key(coords)] = features.map(makeMarker);
+                            markers[key(coords)].forEach(function (marker) { group.addLayer(marker); });
+                            done(null, tile);
+                        })
+                        .catch(function () { done(null, tile); });
+                    return tile;
+                }
+            });
+
+            var tiles = new Tiles({maxNativeZoom: {{ this.max_zoom }}});
+            tiles.on('tileunload', function (event) {
+                (markers[key(event.coords)] || []).forEach(function (marker) { group.removeLayer(marker); });
+                delete markers[key(event.coords)];
+            });
+            group.addLayer(tiles);
+        })();
+        {% endmacro %}"""
+    )
+
+    def __init__(self, group, base, style, max_zoom, names_chunk):
+        super().__init__()
+        self._name = "TileMarkerLayer"
+        self.group = group
+        self.base = base
+        self.style = style
+        self.max_zoom = max_zoom
+        self.names_chunk = names_chunk
+
+# One image overlay whose picture is swapped for the density grid matching
+# the zoom: the browser only ever holds one image, however many startups
+class DensityOverlay(MacroElement):
+    _template = Template(
+        """
+        {% macro script(this, kwargs) %}
+        (function(){
+            var map = {{ this._parent.get_name() }};
+            var group = {{ this.group }};
+            var levels = {{ this.levels|tojson }};
+            var overlay = L.imageOverlay(levels[0][1], {{ this.bounds|tojson }}, {interactive: false});
+            overlay.on('add', function () {
+                overlay.getElement().style.imageRendering = 'pixelated';
+            });
+
+            function pick() {
+                var url = levels[0][1];
+                levels.forEach(function (level) {
+                    if (map.getZoom() >= level[0]) { url = level[1]; }
+                });
+                if (overlay._url !== url) { overlay.setUrl(url); }
+            }
+            map.on('zoomend', pick);
+            pick();
+            group.addLayer(overlay);
+        })();
+        {% endmacro %}"""
+    )
+
+    def __init__(self, group, levels, bounds):
+        super().__init__()
+        self._name = "DensityOverlay"
+        self.group = group
+        self.levels = levels
+        self.bounds = bounds
+
+# Right-click anywhere on a served map: lists the startups within `km`,
+# answered by the server's spatial index
+class NearbyQuery(MacroElement):
+    _template = Template(
+        """
+        {% macro script(this, kwargs) %}
+        (function(){
+            var map = {{ this._parent.get_name() }};
+            map.on('contextmenu', function (event) {
+                var query = 'nearby?lat=' + event.latlng.lat + '&lon=' + event.latlng.lng +
+                    '&km={{ this.km }}&limit={{ this.limit }}';
+                fetch(query)
+                    .then(function (response) { return response.json(); })
+                    .then(function (result) {
+                        var lines = result.startups.map(function (s) {
+                            return s[0] + ' (' + s[1] + ', $' + s[2] + 'B, ' + s[3] + ' km)';
+                        });
+                        L.popup({maxWidth: 300})
+                            .setLatLng(event.latlng)
+                            .setContent('<b>' + result.count + ' startups within {{ this.km }} km</b><br>' +
+                                        lines.join('<br>'))
+                            .openOn(map);
+                    });
+            });
+        })();
+        {% endmacro %}"""
+    )
+
+    def __init__(self, km=50, limit=10):
+        super().__init__()
+        self._name = "NearbyQuery"
+        self.km = km
+        self.limit = limit
+
+def settings_key(version, regions, options):
+    # Identifies a map: the dataset plus everything that changes the page
+    settings = json.dumps(
+        [version, regions, options, MARKER_FIELDS, MARKER_CALLBACK], sort_keys=True
+    )
+    return hashlib.sha1(settings.encode("utf-8")).hexdigest()[:16]
+
+def region_key(region, data):
+    # Content hash of the rows a region sends to the browser
+    row_hashes = pd.util.hash_pandas_object(data[MARKER_FIELDS], index=False).to_numpy()
+    digest = hashlib.sha1(f"{region}|{PAYLOAD_FORMAT}".encode("utf-8"))
+    digest.update(row_hashes.tobytes())
+    return digest.hexdigest()[:16]
+
+def marker_table(points):
+    # One array per field; text repeated across rows (city, country) is
+    # stored once with an integer code per row
+    table = {}
+    for field, name in zip(MARKER_FIELDS, MARKER_COLUMNS):
+        column = points[field]
+        if column.dtype.kind in "fiu":
+            # Widened first: float32 values would print with noise digits
+            table[name] = column.astype("float64").round(6).tolist()
+            continue
+        codes, values = pd.factorize(column.astype(str))
+        if len(values) * 2 <= len(column):
+            table[name] = {"values": values.tolist(), "codes": codes.tolist()}
+        else:
+            table[name] = column.astype(str).tolist()
+    return table
+
+def write_region_payload(map_dir, region, data):
+    # Reused as long as the region's rows are unchanged
+    path = os.path.join(map_dir, f"rows_{region_key(region, data)}.js")
+    if not os.path.exists(path):
+        payload = json.dumps(marker_table(data[MARKER_FIELDS]), separators=(",", ":"))
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("window.STARTUP_ROWS = window.STARTUP_ROWS || {};\n")
+            f.write(f"window.STARTUP_ROWS[{json.dumps(region)}] = {payload};\n")
+        os.replace(tmp_path, path)
+    return os.path.basename(path)
+
+def map_variant(options):
+    return options["clustering"] + ("_density" if options["density"] else "")
+
+def prune_map_dir(map_dir, map_path):
+    # Keeps the newest map of each variant (map_path for its own), so a
+    # browser map and a served one can stay open side by side, and every
+    # payload, tile directory and image one of them references
+    variant = MAP_NAME.fullmatch(os.path.basename(map_path)).group(1)
+    referenced = set()
+    for name in os.listdir(map_dir):
+        match = MAP_NAME.fullmatch(name)
+        if match is None:
+            continue
+        path = os.path.join(map_dir, name)
+        if match.group(1) in (variant, None) and name != os.path.basename(map_path):
+            os.remove(path)
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            referenced.update(ARTIFACT_NAME.findall(f.read()))
+
+    for name in os.listdir(map_dir):
+        if ARTIFACT_NAME.fullmatch(name) is None or name in referenced:
+            continue
+        path = os.path.join(map_dir, name)
+        if name.startswith("tiles_") and os.path.isdir(path):
+            shutil.rmtree(path)
+        elif os.path.isfile(path):
+            os.remove(path)
+
+def write_region_tiles(data, region, options):
+    # Tile directory for a region, rewritten only when its rows change
+    from vector_tiles import NAMES_CHUNK, export_tiles
+    rows = data.regions.view(region)
+    radius, max_zoom = options["cluster_radius"], options["tile_max_zoom"]
+    name = f"tiles_{region_key(region, rows)}_{radius}_{max_zoom}"
+    path = os.path.join(options["map_dir"], name)
+    if not os.path.exists(path):
+        tmp_path = path + ".tmp"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        export_tiles(cluster_index(data, region, radius), rows, tmp_path, max_zoom)
+        os.replace(tmp_path, path)
+    return name, NAMES_CHUNK
+
+def write_density_images(map_dir, data, regions):
+    # [(min zoom, image name), ...]; images are named by content
+    from matplotlib.image import imsave
+    from density_grid import DENSITY_ZOOMS, density_grids, density_image
+    rows = pd.concat([data.regions.view(region) for region in regions])
+    grids = density_grids(rows['Latitude'], rows['Longitude'], rows['Valuation ($B)'])
+    levels = []
+    for zoom in DENSITY_ZOOMS:
+        image = density_image(grids[zoom])
+        name = f"density_{hashlib.sha1(image.tobytes()).hexdigest()[:16]}.png"
+        path = os.path.join(map_dir, name)
+        if not os.path.exists(path):
+            imsave(path + ".tmp", image, format="png")
+            os.replace(path + ".tmp", path)
+        levels.append((zoom, name))
+    return levels
+
+def map_regions(regions, options):
+    # The requested regions (default: all) that have a marker style
+    styles = options["region_styles"]
+    return [region for region in (regions or styles) if region in styles]
+
+def build_map(data, regions=None, options=None):
+    # data: loaded startups (app.StartupData or MapData); regions: names of
+    # the regions to show, default every styled region; options: overrides
+    # for DEFAULT_OPTIONS. Returns the path of the (possibly reused) map.
+    options = {**DEFAULT_OPTIONS, **(options or {})}
+    styles = options["region_styles"]
+    regions = map_regions(regions, options)
+
+    map_dir = options["map_dir"]
+    os.makedirs(map_dir, exist_ok=True)
+    key = settings_key(data.version, regions, options)
+    map_path = os.path.join(map_dir, f"map_{map_variant(options)}_{key}.html")
+    if os.path.exists(map_path):
+        return map_path
+
+    # Initialize the map
+    startup_map = folium.Map(location=options["location"], zoom_start=options["zoom_start"])
+
+    if options["clustering"] == "server":
+        # Empty layers filled from the map server on every viewport change
+        layers = {}
+        for region in regions:
+            layer = folium.FeatureGroup(name=styles[region]["name"]).add_to(startup_map)
+            layers[region] = layer.get_name()
+        ServerClusterLayer(layers, {region: styles[region] for region in regions}).add_to(startup_map)
+    elif options["clustering"] == "tiles":
+        # Layers filled tile by tile from the exported tile directories
+        for region in regions:
+            tile_dir, names_chunk = write_region_tiles(data, region, options)
+            layer = folium.FeatureGroup(name=styles[region]["name"]).add_to(startup_map)
+            TileMarkerLayer(
+                layer.get_name(), tile_dir + "/", styles[region], options["tile_max_zoom"], names_chunk
+            ).add_to(startup_map)
+    else:
+        # Add one marker cluster per region; only changed regions are rewritten
+        for region in regions:
+            style = styles[region]
+            payload = write_region_payload(map_dir, region, data.regions.view(region))
+            startup_map.get_root().header.add_child(folium.JavascriptLink(payload))
+            RegionMarkerCluster(region, MARKER_CALLBACK % style, name=style["name"]).add_to(startup_map)
+
+    if options["density"]:
+        from density_grid import MERCATOR_BOUNDS
+        levels = write_density_images(map_dir, data, regions)
+        layer = folium.FeatureGroup(name="Valuation density").add_to(startup_map)
+        DensityOverlay(layer.get_name(), levels, MERCATOR_BOUNDS).add_to(startup_map)
+
+    # Served maps can query the spatial index
+    if options["clustering"] in ("server", "tiles"):
+        NearbyQuery(options["nearby_km"]).add_to(startup_map)
+
+    # Add Layer Control to toggle clusters
+    folium.LayerControl().add_to(startup_map)
+
+    # Save the map to an HTML file
+    startup_map.save(map_path)
+    prune_map_dir(map_dir, map_path)
+    return map_path
+
+# One server per process, started on first use; cluster indexes are cached
+# per (dataset version, region, radius), for the latest version only
+_server = None
+_cluster_indexes = {}
+
+def cluster_index(data, region, radius):
+    from geo_cluster import ClusterIndex
+    key = (data.version, region, radius)
+    if key not in _cluster_indexes:
+        # A new version (reload, ingest) makes every older index useless
+        for old in [old for old in _cluster_indexes if old[0] != data.version]:
+            del _cluster_indexes[old]
+        rows = data.regions.view(region)
+        _cluster_indexes[key] = ClusterIndex(
+            rows['Latitude'].to_numpy(), rows['Longitude'].to_numpy(),
+            rows['Valuation ($B)'].to_numpy(), radius_px=radius,
+        )
+    return _cluster_indexes[key]
+
+def serve_map(data, regions=None, options=None):
+    # Server-side clustering or tiles: build the page, start the local map
+    # server on map_dir and return the URL to open
+    global _server
+    from map_server import MapServer
+
+    options = {**DEFAULT_OPTIONS, **(options or {})}
+    if options["clustering"] not in ("server", "tiles"):
+        options["clustering"] = "server"
+    map_path = build_map(data, regions, options)
+
+    if _server is None:
+        _server = MapServer(options["map_dir"])
+    elif _server.map_dir != os.path.abspath(options["map_dir"]):
+        # The page just built lives in another directory
+        _server.set_root(options["map_dir"])
+    _server.set_spatial(data.spatial, data.dataset)
+    # Replaced as a whole, so the server holds no index or rows of older data
+    clusters = {}
+    if options["clustering"] == "server":
+        for region in map_regions(regions, options):
+            index = cluster_index(data, region, options["cluster_radius"])
+            clusters[region] = (index, data.regions.view(region))
+    _server.set_clusters(clusters)
+    return _server.start() + os.path.basename(map_path)
+
+def _run_webview(map_path):
+    import webview
+    webview.create_window("Carte des Startups", map_path)
+    webview.start()
+
+def show_map(map_path, block=False):
+    # webview.start() owns the main thread until the window closes, so by
+    # default it runs in a child process and the caller keeps its event loop
+    if not map_path.startswith("http"):
+        map_path = os.path.abspath(map_path)
+    if block:
+        _run_webview(map_path)
+        return None
+    process = multiprocessing.Process(target=_run_webview, args=(map_path,), daemon=True)
+    process.start()
+    return process
+
+if __name__ == "__main__":
+    import sys
+    data = MapData()
+    options = {"density": "--density" in sys.argv}
+    if "--server" in sys.argv:
+        show_map(serve_map(data, options=options), block=True)
+    elif "--tiles" in sys.argv:
+        show_map(serve_map(data, options={**options, "clustering": "tiles"}), block=True)
+    else:
+        show_map(build_map(data, options=options), block=True)
@@ -0,0 +1,57 @@
+import numpy as np
+
+from density_grid import density_grids, density_image, grid_cells
+
+
+def points(n=2000):
+    rng = np.random.default_rng(0)
+    lat = rng.uniform(-60, 70, n)
+    lon = rng.uniform(-180, 180, n)
+    # Edges of the map and rows that can't be placed
+    lat[:4] = [90, -90, 0, np.nan]
+    lon[:4] = [180, -180, 180, 10]
+    return lat, lon, rng.uniform(1, 10, n)
+
+
+def test_grid_cells():
+    assert grid_cells(0) == 32
+    assert grid_cells(6) == 2048
+    assert grid_cells(2, cell_px=16) == 64
+
+
+def test_every_level_holds_the_total_weight():
+    lat, lon, weights = points()
+    grids = density_grids(lat, lon, weights)
+    placed = weights[np.isfinite(lat)].sum()
+    for zoom, grid in grids.items():
+        assert grid.shape == (grid_cells(zoom),) * 2
+        assert np.isclose(grid.sum(), placed)
+    # Unweighted grids count the points
+    assert density_grids(lat, lon, zooms=(0, 2))[0].sum() == len(lat) - 1
+
+
+def test_coarser_levels_are_block_sums():
+    lat, lon, weights = points()
+    grids = density_grids(lat, lon, weights, zooms=(0, 2))
+    fine, coarse = grids[2], grids[0]
+    blocks = fine.reshape(32, 4, 32, 4).sum(axis=(1, 3))
+    assert np.allclose(coarse, blocks)
+    # Coarse grids binned directly give the same cells
+    assert np.allclose(density_grids(lat, lon, weights, zooms=(0,))[0], coarse)
+
+
+def test_north_is_row_zero():
+    grid = density_grids([60.0], [0.0], zooms=(0,))[0]
+    row, column = np.argwhere(grid)[0]
+    assert row < grid.shape[0] // 2 and column == grid.shape[1] // 2
+
+
+def test_density_image_transparent_where_empty():
+    grid = np.zeros((4, 4))
+    grid[1, 2] = 5
+    grid[3, 3] = 1
+    image = density_image(grid)
+    assert image.shape == (4, 4, 4) and image.dtype == np.uint8
+    assert (image[..., 3] > 0).sum() == 2
+    assert image[1, 2, 3] > image[3, 3, 3]
+    assert not density_image(np.zeros((2, 2)))[..., 3].any()
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from geo_cluster import ClusterIndex, project, unproject
+
+
+@pytest.fixture(scope="module")
+def points():
+    rng = np.random.default_rng(3)
+    lat = np.concatenate((rng.normal(40, 3, 1500), rng.uniform(-60, 70, 1500)))
+    lon = np.concatenate((rng.normal(-100, 5, 1500), rng.uniform(-180, 180, 1500)))
+    value = rng.uniform(0.5, 20, len(lat))
+    lat[0] = np.nan
+    return lat, lon, value
+
+
+def test_project_round_trip():
+    lat = np.array([-80.0, -33.9, 0.0, 48.85, 80.0])
+    lon = np.array([-179.0, 18.4, 0.0, 2.35, 179.0])
+    back_lat, back_lon = unproject(*project(lat, lon))
+    assert np.allclose(back_lat, lat) and np.allclose(back_lon, lon)
+
+
+def test_every_level_keeps_every_point(points):
+    lat, lon, value = points
+    index = ClusterIndex(lat, lon, value, max_zoom=10)
+    finite = np.isfinite(lat)
+    for zoom in range(0, 12):
+        level = index.level(zoom)
+        assert level.count.sum() == finite.sum()
+        assert np.isclose(level.value.sum(), value[finite].sum())
+        singles = level.ids[level.count == 1]
+        assert np.all(level.ids[level.count > 1] == -1)
+        assert len(np.unique(singles)) == len(singles)
+        assert np.all(finite[singles])
+    # Coarser levels never have more clusters
+    sizes = [len(index.level(zoom)) for zoom in range(0, 11)]
+    assert sizes == sorted(sizes)
+
+
+def test_query_returns_points_in_view(points):
+    lat, lon, value = points
+    index = ClusterIndex(lat, lon, value, max_zoom=8)
+    # Above max_zoom the points themselves: every one in view, padded by
+    # at most one cluster radius
+    got = set(index.query(13, -110, 30, -90, 50, limit=10 ** 6)[4].tolist())
+    inside = np.flatnonzero((lat >= 30) & (lat <= 50) & (lon >= -110) & (lon <= -90))
+    assert set(inside.tolist()) <= got
+    assert np.all((lon[list(got)] > -110.2) & (lon[list(got)] < -89.8))
+
+
+def test_query_across_antimeridian():
+    lat = np.array([-15.0, -15.0, -15.0])
+    lon = np.array([179.5, -179.5, 0.0])
+    index = ClusterIndex(lat, lon, max_zoom=4)
+    ids = index.query(13, 179, -20, -179, -10)[4]
+    assert sorted(ids.tolist()) == [0, 1]
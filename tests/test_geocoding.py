@@ -0,0 +1,88 @@
+import os
+import pandas as pd
+import pytest
+
+import geocoding
+from geocoding import Geocoder, place_key
+
+
+@pytest.fixture
+def gazetteer(tmp_path):
+    path = tmp_path / 'gazetteer.csv'
+    pd.DataFrame([
+        {'City': 'São Paulo', 'Country': 'Brazil', 'Latitude': -23.55, 'Longitude': -46.63,
+         'Alternate Names': 'Sao Paulo City, SP'},
+        {'City': 'Paris', 'Country': 'France', 'Latitude': 48.86, 'Longitude': 2.35},
+        # A namesake listed later doesn't replace the main city
+        {'City': 'Paris', 'Country': 'France', 'Latitude': 0.0, 'Longitude': 0.0},
+    ]).to_csv(path, index=False)
+    return path
+
+
+def test_place_key_normalizes():
+    assert place_key(' São  Paulo ', 'BRAZIL') == 'sao paulo|brazil'
+    assert place_key('Zürich', 'Switzerland') == place_key('zurich', 'switzerland')
+
+
+def test_gazetteer_aliases(gazetteer):
+    places = geocoding.Gazetteer(str(gazetteer))
+    assert places.lookup(place_key('SP', 'Brazil')) == (-23.55, -46.63)
+    assert places.lookup(place_key('sao paulo city', 'Brazil')) == (-23.55, -46.63)
+    assert places.lookup(place_key('Paris', 'France')) == (48.86, 2.35)
+    assert places.lookup(place_key('Paris', 'United States')) is None
+
+
+def test_cache_hit_skips_gazetteer(gazetteer, tmp_path, monkeypatch):
+    cache = str(tmp_path / 'cache.json')
+    keys = [place_key('Paris', 'France'), place_key('São Paulo', 'Brazil')]
+    first = Geocoder(str(gazetteer), cache)
+    found = first.resolve(keys)
+    first.cache.save()
+    assert first.stats == {'pairs': 2, 'cached': 0, 'resolved': 2, 'unresolved': 0}
+
+    # Everything cached: the gazetteer is never read
+    def no_gazetteer(path):
+        raise AssertionError("gazetteer read on a cache hit")
+    monkeypatch.setattr(geocoding, 'Gazetteer', no_gazetteer)
+    second = Geocoder(str(gazetteer), cache)
+    assert {key: tuple(value) for key, value in second.resolve(keys).items()} == \
+        {key: tuple(value) for key, value in found.items()}
+    assert second.gazetteer is None
+    assert second.stats == {'pairs': 2, 'cached': 2, 'resolved': 0, 'unresolved': 0}
+
+
+def test_misses_retried_for_new_gazetteer(gazetteer, tmp_path):
+    cache = str(tmp_path / 'cache.json')
+    key = place_key('Lyon', 'France')
+    geocoder = Geocoder(str(gazetteer), cache)
+    assert geocoder.resolve([key]) == {key: None}
+    geocoder.cache.save()
+    # The same gazetteer keeps the miss...
+    again = Geocoder(str(gazetteer), cache)
+    assert again.resolve([key]) == {key: None}
+    assert again.stats['cached'] == 1
+
+    # ...a changed one is asked again
+    with open(gazetteer, 'a', encoding='utf-8') as f:
+        f.write('Lyon,France,45.76,4.83,\n')
+    updated = Geocoder(str(gazetteer), cache)
+    assert updated.resolve([key]) == {key: [45.76, 4.83]}
+    assert updated.stats['resolved'] == 1
+
+
+def test_geocode_fills_only_missing(gazetteer, tmp_path):
+    dataset = pd.DataFrame({
+        'City': ['Paris', 'Paris', 'SP', 'Atlantis'],
+        'Country': ['France', 'France', 'Brazil', 'Nowhere'],
+        'Latitude': [None, 1.0, None, None],
+        'Longitude': [None, 2.0, None, None],
+    })
+    geocoder = Geocoder(str(gazetteer), str(tmp_path / 'cache.json'))
+    geocoded = geocoder.geocode(dataset)
+    assert geocoded['Latitude'].tolist()[:3] == [48.86, 1.0, -23.55]
+    assert geocoded['Longitude'].tolist()[:3] == [2.35, 2.0, -46.63]
+    assert geocoded.loc[3, ['Latitude', 'Longitude']].isna().all()
+    # Distinct pairs are looked up once; the caller's frame is left alone
+    assert geocoder.stats['pairs'] == 3
+    assert dataset['Latitude'].isna().sum() == 3
+    assert os.path.exists(tmp_path / 'cache.json')
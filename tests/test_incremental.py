@@ -0,0 +1,99 @@
+import os
+import shutil
+import pandas as pd
+import pytest
+
+import app
+from ingest import append_delta, load_with_deltas
+from regions import RegionIndex
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Updates an existing company (moved to another region) and adds new ones,
+# one of them in a new industry and one without investors
+DELTA = pd.DataFrame([
+    {'Company': None, 'Valuation ($B)': '$12.5', 'Country': 'Germany', 'City': 'Berlin',
+     'Industry': 'Fintech', 'Select Investors': 'Sequoia Capital, Accel'},
+    {'Company': 'Delta Robotics', 'Valuation ($B)': '3', 'Country': 'United States', 'City': 'Austin',
+     'Industry': 'Robotics', 'Select Investors': 'Accel'},
+    {'Company': 'Delta Health', 'Valuation ($B)': '1.25', 'Country': 'China', 'City': 'Beijing',
+     'Industry': 'Health'},
+])
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    for name in ['startups_with_coordinates.csv', 'gazetteer.csv']:
+        shutil.copy(os.path.join(ROOT, name), tmp_path / name)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def delta():
+    dataset = pd.read_csv(os.path.join(ROOT, 'startups_with_coordinates.csv'))
+    updated = dataset[dataset['Country'] == 'United States']['Company'].iloc[0]
+    return DELTA.assign(Company=DELTA['Company'].fillna(updated))
+
+
+def assert_same_data(data, fresh):
+    # Identical rows, dtypes and order, version and section digests
+    assert data.version == fresh.version
+    pd.testing.assert_frame_equal(data.dataset, fresh.dataset)
+    pd.testing.assert_frame_equal(data.aggregates.region_stats, fresh.aggregates.region_stats)
+    pd.testing.assert_frame_equal(data.aggregates.cube, fresh.aggregates.cube)
+    pd.testing.assert_frame_equal(data.investors.table, fresh.investors.table)
+    assert app.section_inputs(data) == app.section_inputs(fresh)
+
+
+def test_upsert_matches_fresh_index(workdir, delta):
+    dataset, _ = load_with_deltas()
+    regions = RegionIndex(dataset)
+    old = regions.dataset
+    path, accepted = append_delta(delta)
+
+    old_positions, replaced = regions.upsert(accepted)
+    fresh = RegionIndex(load_with_deltas()[0])
+    pd.testing.assert_frame_equal(regions.dataset, fresh.dataset)
+    assert regions.sizes() == fresh.sizes()
+    assert len(replaced) == 1
+    assert (old_positions < 0).sum() == len(accepted)
+    kept = old_positions >= 0
+    assert regions.dataset['Company'][kept].tolist() == old['Company'].iloc[old_positions[kept]].tolist()
+
+
+def test_ingest_matches_fresh_load(workdir, delta):
+    data = app.StartupData()
+    data.ingest(delta)
+    assert_same_data(data, app.StartupData())
+
+
+def test_merged_deltas_match_fresh_load(workdir, delta):
+    data = app.StartupData()
+    before = data.dataset.copy()
+    append_delta(delta.iloc[:2])
+    append_delta(delta.iloc[2:])
+
+    paths = data.pending_deltas()
+    assert len(paths) == 2
+    merged = data.merged(paths)
+    assert_same_data(merged, app.StartupData())
+    assert merged.pending_deltas() == []
+    # The instance merged from is left as it was
+    pd.testing.assert_frame_equal(data.dataset, before)
+
+
+def test_changed_csv_needs_full_reload(workdir):
+    data = app.StartupData()
+    with open('startups_with_coordinates.csv', 'a', encoding='utf-8') as f:
+        f.write('\n')
+    assert data.pending_deltas() is None
+
+
+def test_ingest_without_source_stamp(workdir, delta):
+    data = app.StartupData()
+    data.sources = None
+    data.ingest(delta)
+    assert data.sources is None
+    assert data.pending_deltas() is None
+    assert_same_data(data, app.StartupData())
@@ -0,0 +1,60 @@
+import os
+import shutil
+import pandas as pd
+import pytest
+
+from data_loader import file_hash
+from ingest import (append_delta, assign_indice, compact, delta_files, delta_version,
+                    load_with_deltas, merge_delta, validate_delta)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ROWS = pd.DataFrame([
+    {'Company': 'Paris Labs', 'Valuation ($B)': '$2', 'Country': 'France', 'City': 'Paris', 'Industry': 'Other'},
+    {'Company': 'Paris Labs', 'Valuation ($B)': '$3', 'Country': 'France', 'City': 'Paris', 'Industry': 'Other'},
+    {'Company': 'Berlin Bits', 'Valuation ($B)': '1,5', 'Country': 'Germany', 'City': 'Berlin', 'Industry': 'Other'},
+])
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    for name in ['startups_with_coordinates.csv', 'gazetteer.csv']:
+        shutil.copy(os.path.join(ROOT, name), tmp_path / name)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_validate_delta_cleans_and_keeps_last(workdir):
+    accepted, rejected = validate_delta(ROWS)
+    assert accepted['Company'].tolist() == ['Paris Labs', 'Berlin Bits']
+    assert accepted['Valuation ($B)'].tolist() == [3.0, 15.0]
+    assert accepted[['Latitude', 'Longitude']].notna().all().all()
+    assert len(rejected) == 0
+    with pytest.raises(ValueError):
+        validate_delta(ROWS.drop(columns='City'))
+
+
+def test_assign_indice_keeps_known_numbers():
+    dataset = pd.DataFrame({'Company': ['a', 'b'], 'indice': [4, 9]})
+    delta = assign_indice(pd.DataFrame({'Company': ['b', 'c', 'd']}), dataset)
+    assert delta['indice'].tolist() == [9, 10, 11]
+    merged = merge_delta(dataset, delta)
+    assert merged['Company'].tolist() == ['a', 'b', 'c', 'd']
+
+
+def test_delta_version_chains_one_file_at_a_time(workdir):
+    first, _ = append_delta(ROWS.iloc[:1])
+    second, _ = append_delta(ROWS.iloc[2:])
+    base = file_hash('startups_with_coordinates.csv')
+    assert delta_version(base, [first, second]) == delta_version(delta_version(base, [first]), [second])
+    assert load_with_deltas()[1] == delta_version(base, delta_files())
+
+
+def test_compact_folds_deltas_into_csv(workdir):
+    append_delta(ROWS)
+    merged, _ = load_with_deltas()
+    assert compact() == 1
+    assert delta_files() == []
+    compacted, _ = load_with_deltas()
+    pd.testing.assert_frame_equal(compacted, merged, check_dtype=False, check_categorical=False)
+    assert 'indice' in pd.read_csv('startups_with_coordinates.csv').columns
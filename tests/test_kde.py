@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+import kde
+
+
+def exact_kde(values, grid):
+    values = np.asarray(values, dtype=float)
+    bandwidth = values.std(ddof=1) * len(values) ** (-1 / 5)
+    offsets = (grid[:, None] - values[None, :]) / bandwidth
+    return np.exp(-0.5 * offsets ** 2).sum(axis=1) / (len(values) * bandwidth * np.sqrt(2 * np.pi))
+
+
+@pytest.mark.parametrize("values", [
+    np.random.default_rng(0).normal(5, 2, 500),
+    np.random.default_rng(1).lognormal(0.5, 0.6, 700),
+    # Most values near 1-3 with a few far out, like the valuations
+    np.concatenate([np.random.default_rng(2).uniform(1, 3, 400), [40, 95, 140]]),
+])
+def test_binned_kde_matches_exact(values):
+    grid, density = kde.binned_kde(values)
+    exact = exact_kde(values, grid)
+    assert np.abs(density - exact).max() < 0.01 * exact.max()
+    bandwidth = values.std(ddof=1) * len(values) ** (-1 / 5)
+    # Grid points never further apart than a fraction of the bandwidth,
+    # except across the empty gaps between outliers
+    steps = np.diff(grid)
+    assert np.all(steps > 0)
+    assert np.all((steps <= kde.GRID_SPACING * bandwidth * (1 + 1e-9)) | (exact[1:] + exact[:-1] < 1e-3 * exact.max()))
+
+
+def test_outliers_keep_the_grid_small():
+    values = np.concatenate([np.random.default_rng(3).normal(0, 1, 1000), [1e6]])
+    grid, density = kde.binned_kde(values)
+    assert len(grid) < 2000
+    assert grid[-1] > 1e6
+    assert density[np.argmin(np.abs(grid - 1e6))] > 0
+
+
+def test_constant_and_empty_values():
+    grid, density = kde.binned_kde([2.0, 2.0, 2.0])
+    assert grid[np.argmax(density)] == pytest.approx(2.0, abs=1e-2)
+    grid, density = kde.binned_kde([np.nan])
+    assert len(grid) == len(density) == 0
+
+
+def test_density_curve_is_cached():
+    kde.clear_cache()
+    first = kde.density_curve(("v1", "USA"), [1.0, 2.0, 3.0, 10.0])
+    # A cache hit doesn't look at the values
+    assert kde.density_curve(("v1", "USA"), None) is first
+    assert first.quartiles == (1.75, 2.5, 4.75)
+    kde.clear_cache()
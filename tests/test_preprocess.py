@@ -0,0 +1,67 @@
+import os
+import pandas as pd
+import pytest
+
+from geocoding import Geocoder
+from preprocess import clean_valuation, parse_valuation, run_pipeline
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RAW = [
+    ['Paris Labs', '$2.5', '1/1/2020', 'France', 'Paris', 'Fintech', 'Accel'],
+    ['Tokyo Co', '$3', '1/1/2020', 'Japan', 'Tokyo', 'Fintech', 'Accel'],
+    ['No Investors', '$1', '1/1/2020', 'Germany', 'Berlin', 'Health', None],
+    ['Big One', '$1,400', None, 'United States', 'San Francisco', 'Robotics', 'Sequoia Capital'],
+    ['Bad Value', 'n/a', '1/1/2020', 'China', 'Beijing', 'Other', 'Accel'],
+    ['Nowhere', '$4', '1/1/2020', 'United States', 'Nowhere Town', 'Other', 'Accel'],
+]
+
+
+@pytest.fixture
+def raw(tmp_path):
+    rows = [[f'{row[0]} {i}'] + row[1:] for i in range(20) for row in RAW]
+    path = tmp_path / 'raw.csv'
+    pd.DataFrame(rows, columns=['Company', 'Valuation ($B)', 'Date Joined', 'Country', 'City',
+                                'Industry', 'Select Investors']).to_csv(path, index=False)
+    return str(path)
+
+
+def geocoder(tmp_path):
+    return Geocoder(os.path.join(ROOT, 'gazetteer.csv'), str(tmp_path / 'cache.json'))
+
+
+def test_clean_valuation():
+    values = pd.Series(['$140,000', '$2.5', None], dtype=object)
+    assert clean_valuation(values).tolist()[:2] == ['140000', '2.5']
+    chunk = pd.DataFrame({'Valuation ($B)': ['$1,400', 'n/a', '$0.5']})
+    parsed = next(parse_valuation([chunk]))
+    assert parsed['Valuation ($B)'].tolist() == [1400.0, 0.5]
+    assert parsed['Valuation ($B)'].dtype == 'float64'
+
+
+def test_pipeline_rows_and_stats(raw, tmp_path):
+    output = str(tmp_path / 'clean.csv')
+    stats = run_pipeline(raw, output, geocoder=geocoder(tmp_path))
+    clean = pd.read_csv(output)
+    # Japan, no investors, bad valuation and the unknown town are dropped;
+    # only the last one counts as unlocated
+    assert stats == {'rows': 40, 'unlocated': 20}
+    assert len(clean) == 40
+    assert list(clean.columns) == ['indice', 'Company', 'Valuation ($B)', 'Country', 'City', 'Industry',
+                                   'Select Investors', 'Latitude', 'Longitude']
+    assert sorted(set(clean['Country'])) == ['France', 'United States']
+    assert clean['indice'].is_monotonic_increasing
+    assert clean.loc[clean['Company'] == 'Big One 0', 'indice'].item() == 3
+    assert clean['Valuation ($B)'].max() == 1400.0
+    assert clean[['Latitude', 'Longitude']].notna().all().all()
+    assert not os.path.exists(output + '.tmp')
+
+
+def test_chunked_matches_one_shot(raw, tmp_path):
+    one_shot = str(tmp_path / 'one_shot.csv')
+    chunked = str(tmp_path / 'chunked.csv')
+    expected = run_pipeline(raw, one_shot, chunksize=10_000, geocoder=geocoder(tmp_path))
+    # Chunks that split the repeated rows unevenly, the cache warm by now
+    assert run_pipeline(raw, chunked, chunksize=7, geocoder=geocoder(tmp_path)) == expected
+    with open(one_shot, 'rb') as a, open(chunked, 'rb') as b:
+        assert a.read() == b.read()
@@ -0,0 +1,78 @@
+import os
+import numpy as np
+import pytest
+
+from spatial_index import SpatialIndex, haversine_km
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def points():
+    rng = np.random.default_rng(7)
+    lat = rng.uniform(-89, 89, 4000)
+    lon = rng.uniform(-180, 180, 4000)
+    # A cluster on both sides of the antimeridian
+    lat[:300] = rng.uniform(-20, -10, 300)
+    lon[:300] = np.where(np.arange(300) % 2, rng.uniform(178, 180, 300), rng.uniform(-180, -178, 300))
+    lat[300] = np.nan
+    return lat, lon
+
+
+def brute_radius(lat, lon, centre, km):
+    distances = haversine_km(centre[0], centre[1], lat, lon)
+    return set(np.flatnonzero(distances <= km))
+
+
+@pytest.mark.parametrize("centre, km", [
+    ((-15.0, 179.9), 300), ((-15.0, -179.9), 150), ((48.85, 2.35), 1000), ((88.0, 10.0), 500), ((0.0, 0.0), 5),
+])
+def test_radius_matches_brute_force(points, centre, km):
+    lat, lon = points
+    index = SpatialIndex(lat, lon)
+    ids, distances = index.radius(centre[0], centre[1], km)
+    assert set(ids) == brute_radius(lat, lon, centre, km)
+    assert np.all(np.diff(distances) >= 0)
+    assert np.allclose(distances, haversine_km(centre[0], centre[1], lat[ids], lon[ids]))
+
+
+@pytest.mark.parametrize("centre", [(-15.0, 180.0), (-15.0, -179.5), (60.0, 100.0), (-89.0, 0.0)])
+def test_nearest_matches_brute_force(points, centre):
+    lat, lon = points
+    index = SpatialIndex(lat, lon)
+    ids, distances = index.nearest(centre[0], centre[1], k=25)
+    all_distances = haversine_km(centre[0], centre[1], lat, lon)
+    expected = np.sort(all_distances[np.isfinite(all_distances)])[:25]
+    assert np.allclose(distances, expected)
+
+
+def test_bbox_across_antimeridian(points):
+    lat, lon = points
+    index = SpatialIndex(lat, lon)
+    ids = index.bbox(-20, 179, -10, -179)
+    expected = np.flatnonzero((lat >= -20) & (lat <= -10) & ((lon >= 179) | (lon <= -179)))
+    assert set(ids) == set(expected)
+    assert 300 not in set(index.bbox(-90, -180, 90, 180))
+
+
+def test_count_within(points):
+    lat, lon = points
+    index = SpatialIndex(lat, lon)
+    centres = [(-15.0, 180.0), (40.0, -100.0)]
+    counts = index.count_within([c[0] for c in centres], [c[1] for c in centres], 400)
+    assert counts.tolist() == [len(brute_radius(lat, lon, c, 400)) for c in centres]
+
+
+def test_city_hubs_are_distinct(monkeypatch):
+    import app
+    monkeypatch.chdir(ROOT)
+    data = app.StartupData()
+    hubs = data.city_hubs(km=50, top=10)
+    assert len(hubs) == 10
+    assert hubs.index.names == ["City", "Country"]
+    assert hubs.is_monotonic_decreasing
+    centres = data.dataset.groupby(["City", "Country"], observed=True)[["Latitude", "Longitude"]].mean().loc[hubs.index]
+    lat, lon = centres["Latitude"].to_numpy(), centres["Longitude"].to_numpy()
+    for i in range(len(hubs)):
+        others = np.delete(np.arange(len(hubs)), i)
+        assert np.all(haversine_km(lat[i], lon[i], lat[others], lon[others]) >= 100)
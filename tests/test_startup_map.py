@@ -0,0 +1,63 @@
+import os
+import pytest
+
+import startup_map
+from startup_map import build_map
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def data():
+    return startup_map.MapData(os.path.join(ROOT, "startups_with_coordinates.csv"))
+
+
+def test_prune_keeps_other_variants_and_foreign_files(tmp_path, data):
+    (tmp_path / "notes.txt").write_text("not a map file")
+    (tmp_path / "rows_keep").mkdir()
+    options = {"map_dir": str(tmp_path)}
+
+    browser = build_map(data, options=options)
+    rows = {name for name in os.listdir(tmp_path) if name.startswith("rows_")}
+    served = build_map(data, options={**options, "clustering": "server"})
+    assert os.path.exists(browser) and os.path.exists(served)
+    assert rows <= set(os.listdir(tmp_path))
+    assert {"notes.txt", "rows_keep"} <= set(os.listdir(tmp_path))
+
+
+def test_prune_replaces_map_of_same_variant(tmp_path, data):
+    options = {"map_dir": str(tmp_path)}
+    first = build_map(data, options=options)
+    second = build_map(data, regions=["USA"], options=options)
+    assert not os.path.exists(first)
+    payloads = [name for name in os.listdir(tmp_path) if name.startswith("rows_")]
+    # Only the USA payload is still referenced
+    assert len(payloads) == 1
+    with open(second, encoding="utf-8") as f:
+        assert payloads[0] in f.read()
+
+
+def test_tiles_survive_other_builds(tmp_path, data):
+    options = {"map_dir": str(tmp_path), "clustering": "tiles", "tile_max_zoom": 4}
+    build_map(data, options=options)
+    tiles = sorted(name for name in os.listdir(tmp_path) if name.startswith("tiles_"))
+    stamps = [os.stat(tmp_path / name).st_mtime_ns for name in tiles]
+
+    build_map(data, options={"map_dir": str(tmp_path)})
+    build_map(data, options={**options, "density": True})
+    # Still there and reused, not exported again
+    assert sorted(name for name in os.listdir(tmp_path) if name.startswith("tiles_")) == tiles
+    assert [os.stat(tmp_path / name).st_mtime_ns for name in tiles] == stamps
+
+
+def test_serve_map_regions_and_map_dir(tmp_path, data):
+    import urllib.request
+
+    first = startup_map.serve_map(data, regions=["USA", "Atlantis"], options={"map_dir": str(tmp_path / "a")})
+    assert list(startup_map._server.cluster_indexes) == ["USA"]
+    assert all(key[1] != "Atlantis" for key in startup_map._cluster_indexes)
+    second = startup_map.serve_map(data, options={"map_dir": str(tmp_path / "b")})
+    assert list(startup_map._server.cluster_indexes) == ["USA", "China", "Europe"]
+    with urllib.request.urlopen(second) as response:
+        assert response.status == 200
+    assert first.rsplit("/", 1)[0] == second.rsplit("/", 1)[0]
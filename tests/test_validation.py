@@ -0,0 +1,72 @@
+import os
+import shutil
+import pandas as pd
+import pytest
+
+from ingest import append_delta, compact, delta_files
+from validation import quarantine_path, validate
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BAD = {'Company': 'Nowhere Inc', 'Valuation ($B)': '2', 'Country': 'Atlantis', 'City': 'Nowhere', 'Industry': 'Other'}
+GOOD = {'Company': 'Paris Labs', 'Valuation ($B)': '2', 'Country': 'France', 'City': 'Paris', 'Industry': 'Other'}
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    for name in ['startups_with_coordinates.csv', 'gazetteer.csv']:
+        shutil.copy(os.path.join(ROOT, name), tmp_path / name)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_validate_gives_reasons():
+    dataset = pd.DataFrame([
+        {**GOOD, 'Latitude': 48.86, 'Longitude': 2.35},
+        {**GOOD, 'Valuation ($B)': 'abc', 'Latitude': 48.86, 'Longitude': 2.35},
+        {**BAD, 'Valuation ($B)': '-1', 'Latitude': 123, 'Longitude': None},
+    ])
+    valid, rejected = validate(dataset)
+    assert valid['Company'].tolist() == ['Paris Labs']
+    assert valid['Valuation ($B)'].dtype == 'float64'
+    assert rejected['Row'].tolist() == [1, 2]
+    assert rejected['Reason'].tolist() == [
+        'Valuation ($B) not a number',
+        'Longitude missing; Valuation ($B) not positive; Latitude outside [-90, 90]; unknown Country',
+    ]
+
+
+def test_quarantine_survives_compact(workdir):
+    first, _ = append_delta(pd.DataFrame([GOOD, BAD]))
+    first_quarantine = quarantine_path('startups_with_coordinates.csv', first)
+    assert pd.read_csv(first_quarantine)['Company'].tolist() == ['Nowhere Inc']
+
+    compact()
+    assert delta_files() == []
+    # A clean delta after compact() gets a new number and leaves the
+    # earlier rejected rows alone
+    second, _ = append_delta(pd.DataFrame([GOOD]))
+    assert os.path.basename(second) != os.path.basename(first)
+    assert pd.read_csv(first_quarantine)['Company'].tolist() == ['Nowhere Inc']
+
+
+def test_hand_edited_delta_is_validated_on_merge(workdir):
+    import app
+
+    path, _ = append_delta(pd.DataFrame([GOOD]))
+    data = app.StartupData()
+    # Dropped in by hand: one valid row, one with a country outside the data
+    pd.DataFrame([
+        {**GOOD, 'Company': 'Lyon Labs', 'City': 'Lyon', 'Latitude': 45.76, 'Longitude': 4.83},
+        {**BAD, 'Latitude': 0.0, 'Longitude': 0.0},
+    ]).to_csv(os.path.join(os.path.dirname(path), '000002.csv'), index=False)
+
+    merged = data.merged(data.pending_deltas())
+    fresh = app.StartupData()
+    for loaded in (merged, fresh):
+        companies = set(loaded.dataset['Company'])
+        assert 'Lyon Labs' in companies and 'Nowhere Inc' not in companies
+    quarantined = pd.read_csv(quarantine_path('startups_with_coordinates.csv', '000002.merge.csv'))
+    assert quarantined['Reason'].tolist() == ['unknown Country']
+    # Numbering goes on after the quarantined name
+    assert os.path.basename(append_delta(pd.DataFrame([GOOD]))[0]) == '000003.csv'
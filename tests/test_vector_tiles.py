@@ -0,0 +1,53 @@
+import os
+import json
+import glob
+import numpy as np
+import pandas as pd
+
+from geo_cluster import ClusterIndex
+from vector_tiles import NAMES_CHUNK, export_tiles, tile_features
+
+
+def points(n=2500, seed=1):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Latitude": rng.uniform(-60, 70, n),
+        "Longitude": rng.uniform(-180, 180, n),
+        "Company": [f"Company {i}" for i in range(n)],
+        "City": "City",
+        "Country": "Country",
+    })
+
+
+def test_tile_features_partition_the_level():
+    rows = points()
+    index = ClusterIndex(rows["Latitude"], rows["Longitude"], max_zoom=6)
+    for zoom in range(0, 7):
+        level = index.level(zoom)
+        seen = np.concatenate([selected for _, _, selected in tile_features(level, zoom)])
+        assert np.array_equal(np.sort(seen), np.arange(len(level)))
+        for x, y, selected in tile_features(level, zoom):
+            # Every feature lies in the tile it is written to
+            assert np.all(np.floor(level.x[selected] * 2 ** zoom) == x)
+            assert np.all(np.floor(level.y[selected] * 2 ** zoom) == y)
+
+
+def test_exported_tiles_hold_every_startup_at_each_zoom(tmp_path):
+    rows = points()
+    index = ClusterIndex(rows["Latitude"], rows["Longitude"], max_zoom=5)
+    export_tiles(index, rows, str(tmp_path), max_zoom=5)
+
+    for zoom in range(0, 6):
+        features = []
+        for path in glob.glob(os.path.join(tmp_path, str(zoom), "*", "*.json")):
+            with open(path, encoding="utf-8") as f:
+                features.extend(json.load(f))
+        assert sum(feature[2] for feature in features) == len(rows)
+        singles = [int(feature[4]) for feature in features if feature[2] == 1]
+        assert all(feature[4] == -1 for feature in features if feature[2] > 1)
+        assert len(set(singles)) == len(singles)
+
+    chunks = sorted(glob.glob(os.path.join(tmp_path, "names", "*.json")))
+    assert len(chunks) == -(-len(rows) // NAMES_CHUNK)
+    with open(os.path.join(tmp_path, "names", "1.json"), encoding="utf-8") as f:
+        assert json.load(f)[0] == ["Company 1000", "City", "Country"]
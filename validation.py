@@ -0,0 +1,70 @@
+import os
+import numpy as np
+import pandas as pd
+from preprocess import KEPT_COUNTRIES
+
+# Row checks run once, when the dataset (or a delta) is read. Every rule is
+# a boolean mask over the whole frame; rows failing any of them are moved to
+# a quarantine CSV with the reasons, so code past the loader can count on
+# numeric, in-range, non-missing values and known countries.
+#
+# Quarantine files live in <base>.quarantine/, one per source file: the
+# dataset CSV itself, or the delta a rejected row came with.
+
+REQUIRED_COLUMNS = ['Company', 'Valuation ($B)', 'Country', 'City', 'Industry', 'Latitude', 'Longitude']
+NUMERIC_COLUMNS = ['Valuation ($B)', 'Latitude', 'Longitude']
+# Inclusive bounds; valuations must also be above zero
+RANGES = {'Latitude': (-90.0, 90.0), 'Longitude': (-180.0, 180.0)}
+REFERENCE_SETS = {'Country': KEPT_COUNTRIES}
+
+
+def quarantine_path(csv_path, source=None):
+    base, _ = os.path.splitext(csv_path)
+    return os.path.join(base + '.quarantine', os.path.basename(source or csv_path))
+
+
+def validate(dataset):
+    # Returns (valid rows, numeric columns as float64; rejected rows as given,
+    # with their position in the input as Row and a Reason column). Raises
+    # ValueError when a required column is absent
+    missing = [column for column in REQUIRED_COLUMNS if column not in dataset]
+    if missing:
+        raise ValueError(f"missing columns: {', '.join(missing)}")
+    numbers = {column: pd.to_numeric(dataset[column], errors='coerce').astype('float64') for column in NUMERIC_COLUMNS}
+
+    rules = [(dataset[column].isna(), f"{column} missing") for column in REQUIRED_COLUMNS]
+    rules += [
+        (dataset[column].notna() & ~np.isfinite(numbers[column]), f"{column} not a number")
+        for column in NUMERIC_COLUMNS
+    ]
+    rules.append((numbers['Valuation ($B)'] <= 0, "Valuation ($B) not positive"))
+    rules += [
+        (numbers[column].notna() & ~numbers[column].between(low, high), f"{column} outside [{low:g}, {high:g}]")
+        for column, (low, high) in RANGES.items()
+    ]
+    rules += [
+        (dataset[column].notna() & ~dataset[column].isin(values), f"unknown {column}")
+        for column, values in REFERENCE_SETS.items()
+    ]
+
+    failed = np.column_stack([np.asarray(mask, dtype=bool) for mask, _ in rules])
+    bad = failed.any(axis=1)
+    reasons = np.array([reason for _, reason in rules])
+    # Only the failing rows, usually few, are turned into text
+    rejected = dataset[bad].assign(Reason=['; '.join(reasons[row]) for row in failed[bad]])
+    rejected.insert(0, 'Row', np.flatnonzero(bad))
+
+    valid = dataset[~bad].assign(**{column: values.to_numpy()[~bad] for column, values in numbers.items()})
+    return valid.reset_index(drop=True), rejected.reset_index(drop=True)
+
+
+def write_quarantine(rejected, path):
+    # Replaces the quarantine file of one source; removes it once clean
+    if not len(rejected):
+        if os.path.exists(path):
+            os.remove(path)
+        return None
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    rejected.to_csv(path + '.tmp', index=False)
+    os.replace(path + '.tmp', path)
+    return path
@@ -0,0 +1,57 @@
+import os
+import json
+import numpy as np
+
+# Pre-tiled point data for the map: <out_dir>/<z>/<x>/<y>.json holds the
+# features of one Web Mercator tile as
+#   [[lat, lon, count, valuation, id], ...]
+# where count > 1 is a cluster of that zoom (id -1) and count == 1 is a
+# single startup whose id indexes <out_dir>/names/<id // NAMES_CHUNK>.json.
+# Only non-empty tiles are written.
+
+NAMES_CHUNK = 1000
+NAME_FIELDS = ['Company', 'City', 'Country']
+
+
+def tile_features(level, zoom):
+    # Groups one ClusterLevel by tile: yields (x, y, rows)
+    tiles = 2 ** zoom
+    tile_x = np.minimum((level.x * tiles).astype(np.int64), tiles - 1)
+    tile_y = np.minimum((level.y * tiles).astype(np.int64), tiles - 1)
+    keys = tile_x * tiles + tile_y
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    for start, stop in zip(starts, np.r_[starts[1:], len(keys)]):
+        key = int(keys[start])
+        yield key // tiles, key % tiles, order[start:stop]
+
+
+def _write_json(path, body):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(body, f, separators=(",", ":"))
+
+
+def export_tiles(index, rows, out_dir, max_zoom=14):
+    # index: geo_cluster.ClusterIndex over rows (ids are row positions)
+    from geo_cluster import unproject
+
+    for zoom in range(index.min_zoom, max_zoom + 1):
+        level = index.level(zoom)
+        lat, lon = unproject(level.x, level.y)
+        lat, lon = np.round(lat, 6), np.round(lon, 6)
+        value = np.round(level.value, 2)
+        for x, y, selected in tile_features(level, zoom):
+            features = np.column_stack((
+                lat[selected], lon[selected], level.count[selected], value[selected], level.ids[selected]
+            )).tolist()
+            _write_json(os.path.join(out_dir, str(zoom), str(x), f"{y}.json"), features)
+
+    # Popup details, fetched by the page only for the startups clicked
+    names = rows[NAME_FIELDS].astype(str).to_numpy().tolist()
+    for chunk in range(0, len(names), NAMES_CHUNK):
+        _write_json(
+            os.path.join(out_dir, "names", f"{chunk // NAMES_CHUNK}.json"),
+            names[chunk:chunk + NAMES_CHUNK],
+        )